@@ -0,0 +1,74 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Measures the Bloom filter pre-check of map on a miss-only workload, e.g. noisy scanner output: time and peak RSS
+of mapping names that are not a key of any map in a fresh interpreter, with and without the filter, per backend.
+Also reports the false positive rate on the misses and the cost of the filter check itself.
+Requires merged_data.bloom in licenselynx/resources (merge_data.py --bloom).
+
+Usage: python -m benchmarks.benchmark_bloom_filter [--names N] [--runs N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+
+MISSES = """
+import json, resource, sys, time
+import licenselynx.licenselynx as licenselynx_module
+from licenselynx import LicenseLynx
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+if sys.argv[2] == "off":
+    licenselynx_module._key_filter_loaded = True
+names = [f"scanner finding {number} (unknown)" for number in range(int(sys.argv[1]))]
+start = time.perf_counter()
+results = LicenseLynx.map_many(names)
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                  "loaded": _LicenseMapSingleton.is_initialized(), "mapped": sum(result is not None for result in results)}))
+"""
+
+
+def run(backend: str, names: int, key_filter: str) -> dict:
+    env = dict(os.environ, LICENSELYNX_BACKEND=backend)
+    return json.loads(subprocess.run([sys.executable, "-c", MISSES, str(names), key_filter], env=env, check=True,
+                                     capture_output=True, text=True).stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--names", type=int, default=10_000, help="Number of distinct unknown names")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters per configuration")
+    args = parser.parse_args()
+
+    key_filter = _LicenseMapSingleton.load_key_filter()
+    if key_filter is None:
+        raise SystemExit("merged_data.bloom is not packaged, run merge_data.py with --bloom")
+
+    names = [f"scanner finding {number} (unknown)" for number in range(args.names)]
+    start = time.perf_counter()
+    false_positives = sum(name in key_filter for name in names)
+    check = (time.perf_counter() - start) / len(names)
+    print(f"filter check {check * 1e9:.0f} ns per name, false positives {false_positives / len(names):.2%}")
+
+    # A single false positive loads the data, so the filter pays off for batches well below 1 / false positive rate
+    for count in (10, 100, args.names):
+        for backend in ("json", "index"):
+            for setting in ("off", "on"):
+                samples = [run(backend, count, setting) for _ in range(args.runs)]
+                seconds = statistics.median(sample["seconds"] for sample in samples)
+                rss = statistics.median(sample["max_rss_kib"] for sample in samples)
+                loaded = sum(sample["loaded"] for sample in samples)
+                print(f"{count:>6} misses, {backend:>5}, filter {setting:>3}: {seconds * 1000:7.2f} ms, "
+                      f"peak RSS {rss / 1024:6.1f} MiB, data loaded in {loaded}/{len(samples)} runs")
+
+
+if __name__ == "__main__":
+    main()
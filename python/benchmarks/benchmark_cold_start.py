@@ -0,0 +1,92 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Compares cold-start time and peak RSS of the first LicenseLynx.map call for the JSON, generated module and
+binary index backends, and checks that all backends return the same mappings. Every run happens in a fresh
+interpreter. Requires merged_data.json and merged_data.idx in licenselynx/resources and the modules written by
+merge_data.py --python-modules in licenselynx/_generated. The generated modules are compiled before measuring,
+so the runs load them from the cached .pyc files like an installed wheel does.
+
+--reference runs the same cold start against the python directory of another checkout, e.g. the tree before a
+change set with its merged_data.json, created with git worktree add. Its modules are compiled first as well.
+
+Usage: python -m benchmarks.benchmark_cold_start [--runs N] [--reference DIR]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Optional
+
+BACKENDS = ("json", "generated", "index")
+LIBRARY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "licenselynx")
+GENERATED_DIR = os.path.join(LIBRARY_DIR, "_generated")
+COLD_START = """
+import json, resource, time
+start = time.perf_counter()
+from licenselynx import LicenseLynx
+LicenseLynx.map("MIT")
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+"""
+
+ALL_RESULTS = """
+import json
+from licenselynx import LicenseLynx, Organization
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+merged_data = _LicenseMapSingleton().merged_data
+maps = {"stableMap": merged_data.stable_map, "riskyMap": merged_data.risky_map}
+maps.update({org.value: merged_data.organizations[org] for org in Organization})
+if merged_data.folded is not None:
+    maps.update({name + ".folded": alias_map for name, alias_map in (
+        ("stableMap", merged_data.folded.stable_map), ("riskyMap", merged_data.folded.risky_map),
+        *((org.value, merged_data.folded.organizations[org]) for org in Organization))})
+print(json.dumps({name: {key: [value.id, value.src] for key, value in alias_map.items()} for name, alias_map in maps.items()}))
+"""
+
+
+def run(code: str, backend: str, cwd: Optional[str] = None) -> str:
+    # PYTHONDONTWRITEBYTECODE would leave the .pyc files unwritten and every run would compile the modules
+    env = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+    env["LICENSELYNX_BACKEND"] = backend
+    return subprocess.run([sys.executable, "-c", code], env=env, cwd=cwd, check=True, capture_output=True,
+                          text=True).stdout
+
+
+def measure(runs: int, backend: str, cwd: Optional[str] = None) -> tuple[float, float]:
+    samples = [json.loads(run(COLD_START, backend, cwd)) for _ in range(runs)]
+    return (statistics.median(sample["seconds"] for sample in samples),
+            statistics.median(sample["max_rss_kib"] for sample in samples))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10, help="Number of fresh interpreters per backend")
+    parser.add_argument("--reference", help="python directory of another checkout to compare the cold start with")
+    args = parser.parse_args()
+
+    # Compiled in a separate interpreter, the measured children would inherit the peak RSS of this process otherwise
+    subprocess.run([sys.executable, "-m", "compileall", "-q", LIBRARY_DIR, GENERATED_DIR], check=True)
+    baseline = json.loads(run(COLD_START.replace('LicenseLynx.map("MIT")', ""), "json"))
+    print(f"interpreter + import baseline: {baseline['seconds'] * 1000:.1f} ms, {baseline['max_rss_kib'] / 1024:.1f} MiB")
+
+    if args.reference:
+        subprocess.run([sys.executable, "-m", "compileall", "-q", os.path.join(args.reference, "licenselynx")], check=True)
+        seconds, rss = measure(args.runs, "auto", args.reference)
+        print(f"reference: first map {seconds * 1000:8.2f} ms, peak RSS {rss / 1024:6.1f} MiB")
+
+    for backend in BACKENDS:
+        seconds, rss = measure(args.runs, backend)
+        print(f"{backend:>9}: first map {seconds * 1000:8.2f} ms, peak RSS {rss / 1024:6.1f} MiB")
+
+    expected = json.loads(run(ALL_RESULTS, "json"))
+    identical = all(json.loads(run(ALL_RESULTS, backend)) == expected for backend in BACKENDS[1:])
+    print(f"backends return identical mappings: {identical}")
+
+
+if __name__ == "__main__":
+    main()
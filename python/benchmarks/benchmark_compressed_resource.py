@@ -0,0 +1,87 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Compares shipping merged_data.json uncompressed and gzip-compressed (merge_data.py -o merged_data.json.gz):
+size on disk and in the wheel, bytes read by the loading process, and the time to the first map call and to all
+maps loaded. Every run happens in a fresh interpreter with the JSON backend. Requires merged_data.json in
+licenselynx/resources.
+
+Usage: python -m benchmarks.benchmark_compressed_resource [--runs N]
+"""
+import argparse
+import gzip
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import zipfile
+
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "licenselynx", "resources")
+
+LOAD = """
+import json, sys, time
+from pathlib import Path
+from unittest.mock import patch
+with patch("importlib.resources.files", return_value=Path(sys.argv[1])):
+    start = time.perf_counter()
+    from licenselynx import LicenseLynx
+    from licenselynx.license_map_singleton import _LicenseMapSingleton
+    LicenseLynx.map("MIT")
+    first_map = time.perf_counter() - start
+    _LicenseMapSingleton().materialize()
+    all_maps = time.perf_counter() - start
+with open("/proc/self/io") as io_stats:
+    read_chars = int(next(line for line in io_stats if line.startswith("rchar:")).split()[1])
+print(json.dumps({"first_map": first_map, "all_maps": all_maps, "read_chars": read_chars}))
+"""
+
+
+def wheel_size(name: str, content: bytes) -> int:
+    """Size of the file inside a wheel, which is a deflate-compressed zip archive."""
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as wheel:
+        wheel.writestr(name, content)
+    return len(archive.getvalue())
+
+
+def run(resource_dir: str) -> dict:
+    env = dict(os.environ, LICENSELYNX_BACKEND="json")
+    env.pop("LICENSELYNX_SNAPSHOT_CACHE", None)
+    return json.loads(subprocess.run([sys.executable, "-c", LOAD, resource_dir], env=env, check=True,
+                                     capture_output=True, text=True).stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10, help="Number of fresh interpreters per format")
+    args = parser.parse_args()
+
+    with open(os.path.join(RESOURCES_DIR, "merged_data.json"), "rb") as file:
+        data = file.read()
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+
+    with tempfile.TemporaryDirectory() as plain_dir, tempfile.TemporaryDirectory() as compressed_dir:
+        with open(os.path.join(plain_dir, "merged_data.json"), "wb") as file:
+            file.write(data)
+        with open(os.path.join(compressed_dir, "merged_data.json.gz"), "wb") as file:
+            file.write(compressed)
+
+        formats = (("json", "merged_data.json", data, plain_dir),
+                   ("json.gz", "merged_data.json.gz", compressed, compressed_dir))
+        for label, name, content, resource_dir in formats:
+            samples = [run(resource_dir) for _ in range(args.runs)]
+            first_map = statistics.median(sample["first_map"] for sample in samples)
+            all_maps = statistics.median(sample["all_maps"] for sample in samples)
+            read_chars = statistics.median(sample["read_chars"] for sample in samples)
+            print(f"{label:>7}: on disk {len(content) / 1024:7.0f} KiB, in wheel {wheel_size(name, content) / 1024:5.0f} KiB, "
+                  f"read {read_chars / 1024:6.0f} KiB, first map {first_map * 1000:6.1f} ms, "
+                  f"all maps {all_maps * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
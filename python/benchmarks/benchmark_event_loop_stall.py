@@ -0,0 +1,75 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Measures how long the event loop is stalled by the first lookup in a fresh interpreter,
+calling LicenseLynx.map directly from a coroutine versus awaiting LicenseLynx.amap.
+A ticker task records the longest gap between its 1 ms sleeps while the first lookup is running.
+
+Usage: python -m benchmarks.benchmark_event_loop_stall [--runs N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+COLD_START = """
+import asyncio, json, time
+from licenselynx import LicenseLynx
+
+async def main():
+    longest_gap = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal longest_gap
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            longest_gap = max(longest_gap, now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    result = {mode}
+    elapsed = time.perf_counter() - start
+    running = False
+    await task
+    assert result.id == "MIT"
+    print(json.dumps({{"stall": longest_gap, "elapsed": elapsed}}))
+
+asyncio.run(main())
+"""
+
+MODES = {
+    "map": 'LicenseLynx.map("MIT")',
+    "amap": 'await LicenseLynx.amap("MIT")',
+}
+
+
+def run(mode: str, backend: str) -> dict:
+    env = dict(os.environ, LICENSELYNX_BACKEND=backend)
+    code = COLD_START.format(mode=MODES[mode])
+    return json.loads(subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters per combination")
+    args = parser.parse_args()
+
+    for backend in ("json", "index"):
+        for mode in MODES:
+            samples = [run(mode, backend) for _ in range(args.runs)]
+            stall = statistics.median(sample["stall"] for sample in samples)
+            elapsed = statistics.median(sample["elapsed"] for sample in samples)
+            print(f"{backend:>6} {mode:>5}: longest event loop stall {stall * 1000:7.2f} ms, first lookup {elapsed * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
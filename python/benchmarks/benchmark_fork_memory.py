@@ -0,0 +1,75 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Measures the unique memory (USS) of forked workers that map every alias of the parent's loaded data.
+Compares loading in the parent without and with LicenseLynx.preload(freeze=True) for both backends.
+Linux only, USS is read from /proc/<pid>/smaps_rollup.
+
+Usage: python -m benchmarks.benchmark_fork_memory [--workers N]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+SCENARIO = """
+import gc, json, os, sys
+from licenselynx import LicenseLynx
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+
+def uss_kib():
+    with open("/proc/self/smaps_rollup") as smaps:
+        return sum(int(line.split()[1]) for line in smaps if line.startswith(("Private_Clean", "Private_Dirty")))
+
+if {freeze}:
+    LicenseLynx.preload(freeze=True)
+else:
+    LicenseLynx.preload()
+aliases = list(_LicenseMapSingleton().merged_data.stable_map)
+
+results = []
+for _ in range({workers}):
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        before = uss_kib()
+        LicenseLynx.map_many(aliases, risky=True)
+        gc.collect()
+        with os.fdopen(write_end, "w") as pipe:
+            pipe.write(json.dumps([before, uss_kib()]))
+        os._exit(0)
+    os.close(write_end)
+    with os.fdopen(read_end) as pipe:
+        results.append(json.loads(pipe.read()))
+    os.waitpid(pid, 0)
+print(json.dumps(results))
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=8, help="Number of forked workers")
+    args = parser.parse_args()
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        sys.exit("This benchmark requires Linux /proc/<pid>/smaps_rollup")
+
+    for backend in ("json", "index"):
+        for freeze in (False, True):
+            env = dict(os.environ, LICENSELYNX_BACKEND=backend)
+            code = SCENARIO.format(freeze=freeze, workers=args.workers)
+            output = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout
+            results = json.loads(output)
+            after = sum(uss for _, uss in results) / len(results)
+            growth = sum(uss - before for before, uss in results) / len(results)
+            label = "preload(freeze=True)" if freeze else "preload()"
+            print(f"{backend:>6} {label:>21}: USS per worker {after / 1024:6.2f} MiB "
+                  f"(+{growth / 1024:5.2f} MiB after lookups), {args.workers} workers {after * args.workers / 1024:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
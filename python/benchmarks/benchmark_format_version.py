@@ -0,0 +1,71 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Compares merged_data.json format version 1 (canonical object per alias) and version 2 (merge_data.py --format-version 2,
+license array and license index per alias): file size, json.loads time, and the time to the first map call and to
+all maps loaded in fresh interpreters with the JSON backend. Requires merged_data.json in licenselynx/resources,
+in either version.
+
+Usage: python -m benchmarks.benchmark_format_version [--runs N]
+"""
+import argparse
+import gzip
+import json
+import os
+import statistics
+import tempfile
+import timeit
+
+from benchmarks.benchmark_compressed_resource import RESOURCES_DIR, run
+
+
+def to_version_1(data: dict) -> dict:
+    if data.get("version") != 2:
+        return data
+    licenses = data["licenses"]
+    return {name: {alias: licenses[index] for alias, index in alias_map.items()}
+            for name, alias_map in data.items() if name not in ("version", "maps", "licenses")}
+
+
+def to_version_2(data: dict) -> dict:
+    """Same conversion as merge_data.to_format_version_2 in the scripts."""
+    license_indices: dict[str, int] = {}
+    licenses: list[dict] = []
+    normalized: dict = {"version": 2, "maps": list(data), "licenses": licenses}
+    for name, alias_map in data.items():
+        normalized[name] = {}
+        for alias, canonical in alias_map.items():
+            license_key = json.dumps(canonical, sort_keys=True)
+            if license_key not in license_indices:
+                license_indices[license_key] = len(licenses)
+                licenses.append(canonical)
+            normalized[name][alias] = license_indices[license_key]
+    return normalized
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10, help="Number of fresh interpreters per format version")
+    args = parser.parse_args()
+
+    with open(os.path.join(RESOURCES_DIR, "merged_data.json")) as file:
+        version_1 = to_version_1(json.load(file))
+    versions = {1: json.dumps(version_1, separators=(",", ":")),
+                2: json.dumps(to_version_2(version_1), separators=(",", ":"))}
+
+    for version, text in versions.items():
+        decode = min(timeit.repeat(lambda: json.loads(text), number=1, repeat=args.runs))
+        with tempfile.TemporaryDirectory() as resource_dir:
+            with open(os.path.join(resource_dir, "merged_data.json"), "w") as file:
+                file.write(text)
+            samples = [run(resource_dir) for _ in range(args.runs)]
+        first_map = statistics.median(sample["first_map"] for sample in samples)
+        all_maps = statistics.median(sample["all_maps"] for sample in samples)
+        print(f"version {version}: {len(text.encode()) / 1024:5.0f} KiB, gzip {len(gzip.compress(text.encode())) / 1024:4.0f} KiB, "
+              f"json.loads {decode * 1000:5.1f} ms, first map {first_map * 1000:5.1f} ms, all maps {all_maps * 1000:5.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Reports the heap retained by the loaded maps before and after interning LicenseObjects.
+"Before" rebuilds the maps the way the library used to: one regular dataclass instance per alias.
+
+Usage: python -m benchmarks.benchmark_heap
+"""
+import gc
+import json
+import os
+import tracemalloc
+from dataclasses import dataclass
+from importlib import resources
+
+from licenselynx import Organization
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+
+
+@dataclass
+class _LegacyLicenseObject(object):
+    id: str
+    src: str
+
+
+def load_legacy() -> list[dict]:
+    with resources.files("licenselynx.resources").joinpath("merged_data.json").open() as file:
+        data = json.load(file)
+    if data.get("version") == 2:
+        licenses = data["licenses"]
+        data = {name: {key: licenses[index] for key, index in alias_map.items()}
+                for name, alias_map in data.items() if name not in ("version", "maps", "licenses")}
+    return [{key: _LegacyLicenseObject(**value) for key, value in alias_map.items()} for alias_map in data.values()]
+
+
+def load_current(backend: str):
+    os.environ["LICENSELYNX_BACKEND"] = backend
+    _LicenseMapSingleton._instances.clear()
+    merged_data = _LicenseMapSingleton().merged_data
+    maps = [merged_data.stable_map, merged_data.risky_map] + [merged_data.organizations[org] for org in Organization]
+    # Touch every entry so lazily decoded backends are measured fully materialized
+    for alias_map in maps:
+        for _ in alias_map.values():
+            pass
+    return maps
+
+
+def measure(name: str, load) -> None:
+    gc.collect()
+    tracemalloc.start()
+    maps = load()
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    objects = {id(value) for alias_map in maps for value in alias_map.values()}
+    aliases = sum(len(alias_map) for alias_map in maps)
+    print(f"{name:>22}: retained {retained / 2 ** 20:6.2f} MiB, peak {peak / 2 ** 20:6.2f} MiB, "
+          f"{len(objects):>6} license objects for {aliases} aliases")
+
+
+def main():
+    measure("before (per alias)", load_legacy)
+    measure("after, json backend", lambda: load_current("json"))
+    measure("after, index backend", lambda: load_current("index"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Measures type-ahead latency of search_prefix and search_substring: queries are prefixes and substrings of
+1 to 8 characters cut from random aliases, as typed one character at a time. Reports index build time and
+p50/p99 latency per call, first for the loaded data and then for the same keys multiplied with synthetic
+variants, to show how the latency grows with the corpus size.
+
+Usage: python -m benchmarks.benchmark_key_search [--queries N] [--scales 1,4,16]
+"""
+import argparse
+import random
+import time
+
+from licenselynx.key_search import _PrefixIndex, _SubstringIndex
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+
+
+def queries(keys: list[str], count: int, generator: random.Random) -> tuple[list[str], list[str]]:
+    prefixes, substrings = [], []
+    for key in generator.choices(keys, k=count):
+        length = generator.randint(1, min(8, len(key)))
+        start = generator.randrange(len(key) - length + 1)
+        prefixes.append(key[:length])
+        substrings.append(key[start:start + length])
+    return prefixes, substrings
+
+
+def measure(index, texts: list[str], view) -> tuple[float, float]:
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        index.search(text, view, 10)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--queries", type=int, default=5000, help="Number of queries per search")
+    parser.add_argument("--scales", type=str, default="1,4,16", help="Corpus multipliers")
+    args = parser.parse_args()
+
+    merged_data = _LicenseMapSingleton().merged_data
+    base_keys = merged_data._keys()
+    generator = random.Random(0)
+
+    for scale in (int(value) for value in args.scales.split(",")):
+        keys = base_keys + [f"{key} v{copy}" for copy in range(1, scale) for key in base_keys]
+        license_object = merged_data.stable_map.get("MIT")
+        view = {key: license_object for key in keys}
+        prefixes, substrings = queries(keys, args.queries, generator)
+
+        for name, index_class, texts in (("prefix", _PrefixIndex, prefixes), ("substring", _SubstringIndex, substrings)):
+            start = time.perf_counter()
+            index = index_class(keys)
+            build = time.perf_counter() - start
+            p50, p99 = measure(index, texts, view)
+            print(f"{len(keys):>7} keys {name:>9}: build {build * 1000:8.1f} ms, "
+                  f"p50 {p50 * 1e6:6.1f} us, p99 {p99 * 1e6:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
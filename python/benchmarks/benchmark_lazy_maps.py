@@ -0,0 +1,59 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Measures what callers pay for the maps they use: time of the first lookup and heap retained by the loaded data
+in a fresh interpreter, for a caller that only uses the stable map, one that also uses the risky and organization
+maps, and one that loads every map up front (LicenseLynx.preload(freeze=True), as eager loading did before).
+
+Usage: python -m benchmarks.benchmark_lazy_maps [--runs N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "stable map only": 'LicenseLynx.map("MIT")',
+    "stable, risky, org": 'LicenseLynx.map("MIT"); LicenseLynx.map("MIT", risky=True, org=Organization.SIEMENS)',
+    "all maps up front": 'LicenseLynx.preload(freeze=True); LicenseLynx.map("MIT")',
+}
+
+FIRST_LOOKUP = """
+import gc, json, time, tracemalloc
+from licenselynx import LicenseLynx, Organization
+gc.collect()
+tracemalloc.start()
+start = time.perf_counter()
+{scenario}
+elapsed = time.perf_counter() - start
+gc.collect()
+print(json.dumps({{"seconds": elapsed, "retained": tracemalloc.get_traced_memory()[0]}}))
+"""
+
+
+def run(scenario: str, backend: str) -> dict:
+    env = dict(os.environ, LICENSELYNX_BACKEND=backend)
+    code = FIRST_LOOKUP.format(scenario=scenario)
+    return json.loads(subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters per scenario")
+    args = parser.parse_args()
+
+    for backend in ("json", "index"):
+        for name, scenario in SCENARIOS.items():
+            samples = [run(scenario, backend) for _ in range(args.runs)]
+            seconds = statistics.median(sample["seconds"] for sample in samples)
+            retained = statistics.median(sample["retained"] for sample in samples)
+            # tracemalloc slows down the load, compare the times relative to each other
+            print(f"{backend:>5}, {name:>18}: first lookup {seconds * 1000:7.2f} ms, retained {retained / 2 ** 20:6.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Measures the throughput of license expression mapping on an SBOM-like corpus: expressions as they appear in
+npm, PyPI and Maven metadata plus random AND/OR/WITH combinations of real aliases, drawn with a skewed
+distribution so that popular expressions and operands repeat. A real corpus can be passed with --input,
+one expression per line. Compares map_expression per expression with map_expressions on the whole batch.
+
+Usage: python -m benchmarks.benchmark_map_expression [--expressions N] [--input FILE]
+"""
+import argparse
+import random
+import time
+
+from licenselynx import LicenseLynx
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+
+COMMON_EXPRESSIONS = [
+    "MIT",
+    "Apache-2.0",
+    "MIT OR Apache-2.0",
+    "(MIT OR Apache-2.0)",
+    "Apache-2.0 OR MIT",
+    "BSD-3-Clause",
+    "ISC",
+    "(MIT AND Zlib)",
+    "(BSD-3-Clause AND MIT)",
+    "GPL-2.0 WITH Classpath-exception-2.0",
+    "GPL-2.0-only WITH Classpath-exception-2.0 OR CDDL-1.1",
+    "EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0",
+    "LGPL-2.1-or-later OR MPL-1.1",
+    "(MIT OR GPL-3.0-or-later)",
+    "MPL-2.0 AND BSD-2-Clause",
+    "Apache License 2.0 OR MIT License",
+    "The Apache Software License, Version 2.0",
+    "BSD License",
+    "GNU General Public License v3 (GPLv3)",
+    "Unlicense OR MIT",
+]
+
+
+def synthetic_corpus(count: int, generator: random.Random) -> list[str]:
+    aliases = list(_LicenseMapSingleton().merged_data.stable_map)
+    popular = generator.sample(aliases, 200)
+    distinct = list(COMMON_EXPRESSIONS)
+    for _ in range(2000):
+        operands = [generator.choice(popular) for _ in range(generator.choice((1, 2, 2, 3, 4)))]
+        operator = generator.choice(("OR", "AND"))
+        expression = f" {operator} ".join(operands)
+        if generator.random() < 0.3:
+            expression = f"({expression}) {'AND' if operator == 'OR' else 'OR'} {generator.choice(popular)}"
+        distinct.append(expression)
+    weights = [1 / (rank + 1) for rank in range(len(distinct))]
+    return generator.choices(distinct, weights=weights, k=count)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--expressions", type=int, default=100_000, help="Number of expressions in the synthetic corpus")
+    parser.add_argument("--input", type=str, help="File with one license expression per line instead of the synthetic corpus")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    LicenseLynx.preload()
+    if args.input:
+        with open(args.input, encoding="utf-8") as file:
+            expressions = [line.rstrip("\n") for line in file if line.strip()]
+    else:
+        expressions = synthetic_corpus(args.expressions, random.Random(args.seed))
+    print(f"{len(expressions)} expressions, {len(set(expressions))} distinct")
+
+    start = time.perf_counter()
+    single = [LicenseLynx.map_expression(expression, risky=True) for expression in expressions]
+    single_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = LicenseLynx.map_expressions(expressions, risky=True)
+    batch_seconds = time.perf_counter() - start
+
+    assert [str(tree) for tree in single] == [str(tree) for tree in batch]
+    mapped = sum(all(symbol.license for symbol in tree.symbols()) for tree in batch)
+    print(f"map_expression per expression: {single_seconds:.3f} s ({len(expressions) / single_seconds:,.0f} expressions/s)")
+    print(f"map_expressions on the batch:  {batch_seconds:.3f} s ({len(expressions) / batch_seconds:,.0f} expressions/s)")
+    print(f"fully mapped: {mapped / len(expressions):.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Compares mapping an SBOM-like input (many rows, few distinct license strings) with one LicenseLynx.map call per row
+against a single LicenseLynx.map_many call.
+
+Usage: python -m benchmarks.benchmark_map_many [--rows N] [--distinct N]
+"""
+import argparse
+import os
+import random
+import time
+
+from licenselynx import LicenseLynx
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+
+
+def sbom_rows(rows: int, distinct: int) -> list[str]:
+    aliases = sorted(_LicenseMapSingleton().merged_data.stable_map)
+    generator = random.Random(42)
+    names = generator.sample(aliases, distinct // 2) + [f"unknown license {number}" for number in range(distinct // 2)]
+    return [generator.choice(names) for _ in range(rows)]
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000, help="Number of input rows")
+    parser.add_argument("--distinct", type=int, default=50, help="Number of distinct license strings")
+    args = parser.parse_args()
+
+    for backend in ("json", "index"):
+        os.environ["LICENSELYNX_BACKEND"] = backend
+        _LicenseMapSingleton._instances.clear()
+        rows = sbom_rows(args.rows, args.distinct)
+
+        single = timed(lambda: [LicenseLynx.map(name, risky=True) for name in rows])
+        batch = timed(lambda: LicenseLynx.map_many(rows, risky=True))
+        assert LicenseLynx.map_many(rows, risky=True) == [LicenseLynx.map(name, risky=True) for name in rows]
+        print(f"{backend:>6}: map loop {single * 1000:8.2f} ms, map_many {batch * 1000:7.2f} ms, "
+              f"speedup {single / batch:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Compares LicenseLynx.map_many with LicenseLynx.map_many_parallel on a batch of mostly distinct license names for
+1, 2, 4, ... worker processes up to the number of CPUs. The first parallel call publishes the license maps to shared
+memory, later calls reuse the published block, so both are reported. Requires the packaged license data.
+
+Usage: python -m benchmarks.benchmark_map_many_parallel [--rows N] [--max-workers N]
+"""
+import argparse
+import os
+import random
+import time
+
+from licenselynx import LicenseLynx
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+
+
+def distinct_rows(rows: int) -> list[str]:
+    aliases = sorted(_LicenseMapSingleton().merged_data.stable_map)
+    generator = random.Random(42)
+    return [generator.choice(aliases) + (f" {number}" if number % 2 else "") for number in range(rows)]
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of input rows")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="Largest number of workers")
+    args = parser.parse_args()
+
+    rows = distinct_rows(args.rows)
+    expected = LicenseLynx.map_many(rows, risky=True)
+    sequential = timed(lambda: LicenseLynx.map_many(rows, risky=True))
+    print(f"map_many: {sequential * 1000:8.1f} ms")
+
+    workers = 1
+    while workers <= args.max_workers:
+        first = timed(lambda: LicenseLynx.map_many_parallel(rows, risky=True, max_workers=workers))
+        repeated = timed(lambda: LicenseLynx.map_many_parallel(rows, risky=True, max_workers=workers))
+        assert LicenseLynx.map_many_parallel(rows, risky=True, max_workers=workers) == expected
+        print(f"map_many_parallel, {workers:3d} workers: first call {first * 1000:8.1f} ms, "
+              f"repeated {repeated * 1000:8.1f} ms, speedup {sequential / repeated:5.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
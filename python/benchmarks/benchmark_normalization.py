@@ -0,0 +1,58 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Measures the per-lookup cost of quote normalization and checks on the full alias corpus of the data directory
+that the shared, precompiled normalize_quotes returns exactly what the previous implementations returned.
+Before, the library and scripts/src/update/BaseDataUpdate.py each rebuilt the translation table on every call.
+
+Usage: python -m benchmarks.benchmark_normalization [--data-dir ../data]
+"""
+import argparse
+import json
+import pathlib
+import timeit
+
+from licenselynx.quotes_handler import _QuotesHandler, normalize_quotes
+
+
+def legacy_normalize_quotes(input_string: str, replacement: str = "'") -> str:
+    translation_map = {ord(char): replacement for char in _QuotesHandler.quote_characters}
+    return input_string.translate(translation_map)
+
+
+def load_aliases(data_dir: pathlib.Path) -> list[str]:
+    aliases = []
+    for path in sorted(data_dir.rglob("*.json")):
+        license_data = json.loads(path.read_text(encoding="utf-8"))
+        aliases.append(license_data["canonical"]["id"])
+        for source_aliases in license_data.get("aliases", {}).values():
+            aliases.extend(source_aliases)
+        aliases.extend(license_data.get("risky", []))
+    return aliases
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data-dir", type=pathlib.Path, default=pathlib.Path(__file__).parents[2] / "data",
+                        help="LicenseLynx data directory")
+    args = parser.parse_args()
+
+    aliases = load_aliases(args.data_dir)
+    # Realistic inputs are mostly ASCII, but include typographic quotes as well
+    non_ascii = [alias.replace("'", "’").replace('"', "“") for alias in aliases if "'" in alias or '"' in alias]
+
+    mismatches = [alias for alias in aliases + non_ascii if normalize_quotes(alias) != legacy_normalize_quotes(alias)]
+    print(f"{len(aliases)} aliases, {len(non_ascii)} with typographic quotes, mismatches: {len(mismatches)}")
+
+    for name, inputs in (("ascii corpus", aliases), ("typographic quotes", non_ascii)):
+        if not inputs:
+            continue
+        for label, function in (("per-call table", legacy_normalize_quotes), ("precompiled", normalize_quotes)):
+            seconds = min(timeit.repeat(lambda: [function(alias) for alias in inputs], number=5, repeat=3)) / 5
+            print(f"{name:>18} {label:>15}: {seconds / len(inputs) * 1e9:7.1f} ns per call")
+
+
+if __name__ == "__main__":
+    main()
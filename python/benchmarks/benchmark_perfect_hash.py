@@ -0,0 +1,73 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Compares the stable map lookup of the dict backend (merged_data.json), the binary index with sorted entry tables
+(version 1, binary search) and the binary index with a minimal perfect hash (version 2, one probe). Reports the
+memory of each map, the index build time and the mean lookup time for hits and for misses.
+
+Usage: python -m benchmarks.benchmark_perfect_hash [--lookups N]
+"""
+import argparse
+import gc
+import os
+import random
+import time
+import tracemalloc
+
+from licenselynx.license_index import _LicenseIndex, _build_index
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+
+
+def load_dict_map() -> dict:
+    os.environ["LICENSELYNX_BACKEND"] = "json"
+    _LicenseMapSingleton._instances.clear()
+    return _LicenseMapSingleton().merged_data.stable_map
+
+
+def measure_memory(load):
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained
+
+
+def measure_lookups(stable_map, keys: list[str]) -> float:
+    get = stable_map.get
+    start = time.perf_counter()
+    for key in keys:
+        get(key)
+    return (time.perf_counter() - start) / len(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lookups", type=int, default=200_000, help="Number of lookups per backend")
+    args = parser.parse_args()
+
+    dict_map, dict_memory = measure_memory(load_dict_map)
+    generator = random.Random(0)
+    hits = generator.choices(list(dict_map), k=args.lookups)
+    misses = [f"{key} (unknown)" for key in hits]
+
+    print(f"{len(dict_map)} aliases in the stable map")
+    print(f"{'dict':>20}: memory {dict_memory / 2 ** 20:6.2f} MiB, "
+          f"hit {measure_lookups(dict_map, hits) * 1e9:6.0f} ns, miss {measure_lookups(dict_map, misses) * 1e9:6.0f} ns")
+
+    for name, perfect_hash in (("index (sorted)", False), ("index (perfect hash)", True)):
+        start = time.perf_counter()
+        index = _build_index({"stableMap": dict_map}, perfect_hash=perfect_hash)
+        build = time.perf_counter() - start
+        stable_map, memory = measure_memory(lambda: _LicenseIndex(index).license_map("stableMap"))
+        # The index buffer is memory-mapped from the package in production, it is reported separately
+        print(f"{name:>20}: memory {memory / 2 ** 20:6.2f} MiB + {len(index) / 2 ** 20:.2f} MiB buffer, "
+              f"hit {measure_lookups(stable_map, hits) * 1e9:6.0f} ns, miss {measure_lookups(stable_map, misses) * 1e9:6.0f} ns, "
+              f"build {build * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Measures LicenseLynx.reload_data on a copy of merged_data.json and the LicenseLynx.map latency of a lookup thread
+while the data is reloaded in a loop, compared to the latency without reloads. Every lookup checks that it sees
+either the original or the curated data. Requires merged_data.json in licenselynx/resources.
+
+Usage: python -m benchmarks.benchmark_reload [--reloads N]
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from benchmarks.benchmark_compressed_resource import RESOURCES_DIR
+from licenselynx import LicenseLynx
+
+LICENSE_NAMES = ["MIT", "Apache License 2.0", "BSD-3-Clause", "GPL-2.0", "license-that-does-not-exist", "ISC License"]
+CURATED_ALIAS = "Internal Curated License"
+
+
+def curated(data: dict) -> dict:
+    if data.get("version") == 2:
+        return dict(data, licenses=data["licenses"] + [{"id": "LicenseRef-Internal", "src": "custom"}],
+                    stableMap=dict(data["stableMap"], **{CURATED_ALIAS: len(data["licenses"])}))
+    return dict(data, stableMap=dict(data["stableMap"], **{CURATED_ALIAS: {"id": "LicenseRef-Internal", "src": "custom"}}))
+
+
+def replace_data(path: str, text: str) -> None:
+    with open(path + ".tmp", "w") as file:
+        file.write(text)
+    os.replace(path + ".tmp", path)
+
+
+def lookup_latencies(stop: threading.Event, latencies: list[float]) -> None:
+    while not stop.is_set():
+        for name in LICENSE_NAMES:
+            start = time.perf_counter()
+            LicenseLynx.map(name, risky=True)
+            latencies.append(time.perf_counter() - start)
+        mapped = LicenseLynx.map(CURATED_ALIAS)
+        assert mapped is None or mapped.id == "LicenseRef-Internal"
+
+
+def measure(reload, seconds: float) -> list[float]:
+    stop = threading.Event()
+    latencies: list[float] = []
+    thread = threading.Thread(target=lookup_latencies, args=(stop, latencies))
+    thread.start()
+    reload(seconds)
+    stop.set()
+    thread.join()
+    return latencies
+
+
+def print_latencies(label: str, latencies: list[float]) -> None:
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(f"{label:>15}: {len(latencies):8d} lookups, median {statistics.median(latencies) * 1e6:6.2f} us, "
+          f"p99 {p99 * 1e6:8.2f} us, max {latencies[-1] * 1000:6.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reloads", type=int, default=20, help="Number of reloads")
+    args = parser.parse_args()
+
+    with open(os.path.join(RESOURCES_DIR, "merged_data.json")) as file:
+        data = json.load(file)
+    texts = (json.dumps(curated(data), separators=(",", ":")), json.dumps(data, separators=(",", ":")))
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        data_path = os.path.join(data_dir, "merged_data.json")
+        replace_data(data_path, texts[1])
+        LicenseLynx.use_data_path(data_path)
+
+        reload_times: list[float] = []
+
+        def reload_loop(_: float) -> None:
+            for reload in range(args.reloads):
+                replace_data(data_path, texts[reload % 2])
+                start = time.perf_counter()
+                LicenseLynx.reload_data()
+                reload_times.append(time.perf_counter() - start)
+
+        with_reloads = measure(reload_loop, 0)
+        without_reloads = measure(time.sleep, sum(reload_times))
+
+    print(f"reload_data: median {statistics.median(reload_times) * 1000:6.1f} ms, "
+          f"max {max(reload_times) * 1000:6.1f} ms over {LicenseLynx.reload_info().reloads} reloads")
+    print_latencies("without reloads", without_reloads)
+    print_latencies("with reloads", with_reloads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Compares the cold start of the JSON backend without the snapshot cache, with an empty cache (the snapshot is written)
+and with a filled cache, and checks that the snapshot returns the same mappings. Every run happens in a fresh
+interpreter. Requires merged_data.json in licenselynx/resources.
+
+Usage: python -m benchmarks.benchmark_snapshot_cache [--runs N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.benchmark_cold_start import ALL_RESULTS, COLD_START
+
+
+def run(code: str, cache_dir: str) -> str:
+    env = dict(os.environ, LICENSELYNX_BACKEND="json", LICENSELYNX_SNAPSHOT_CACHE=cache_dir)
+    return subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout
+
+
+def report(label: str, samples: list[dict]) -> None:
+    seconds = statistics.median(sample["seconds"] for sample in samples)
+    rss = statistics.median(sample["max_rss_kib"] for sample in samples)
+    print(f"{label:>14}: first map {seconds * 1000:8.2f} ms, peak RSS {rss / 1024:6.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10, help="Number of fresh interpreters per configuration")
+    args = parser.parse_args()
+
+    report("no cache", [json.loads(run(COLD_START, "0")) for _ in range(args.runs)])
+
+    misses = []
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            misses.append(json.loads(run(COLD_START, cache_dir)))
+    report("empty cache", misses)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        run(COLD_START, cache_dir)
+        report("filled cache", [json.loads(run(COLD_START, cache_dir)) for _ in range(args.runs)])
+        snapshot_size = sum(os.path.getsize(os.path.join(cache_dir, name)) for name in os.listdir(cache_dir))
+        print(f"snapshot size: {snapshot_size / 1024:.0f} KiB")
+
+        identical = json.loads(run(ALL_RESULTS, "0")) == json.loads(run(ALL_RESULTS, cache_dir))
+    print(f"snapshot returns identical mappings: {identical}")
+
+
+if __name__ == "__main__":
+    main()
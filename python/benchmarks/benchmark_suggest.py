@@ -0,0 +1,75 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Measures LicenseLynx.suggest on synthetic typos of real aliases: each query is an alias with random
+character deletions, insertions, substitutions and transpositions. Reports the one-time index build,
+p50/p99/max latency per call, and how often the license of the original alias is among the suggestions.
+
+Usage: python -m benchmarks.benchmark_suggest [--queries N] [--typos N] [--seed N]
+"""
+import argparse
+import random
+import string
+import time
+
+from licenselynx import LicenseLynx
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+
+
+def mutate(alias: str, typos: int, generator: random.Random) -> str:
+    chars = list(alias)
+    for _ in range(typos):
+        position = generator.randrange(len(chars) + 1)
+        operation = generator.choice(("delete", "insert", "substitute", "transpose"))
+        if operation == "insert" or not chars:
+            chars.insert(position, generator.choice(string.ascii_lowercase))
+        elif operation == "transpose" and position + 1 < len(chars):
+            chars[position], chars[position + 1] = chars[position + 1], chars[position]
+        else:
+            position = min(position, len(chars) - 1)
+            if operation == "delete":
+                del chars[position]
+            else:
+                chars[position] = generator.choice(string.ascii_lowercase)
+    return "".join(chars)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--queries", type=int, default=5000, help="Number of mutated aliases")
+    parser.add_argument("--typos", type=int, default=2, help="Number of typos per alias")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    merged_data = _LicenseMapSingleton().merged_data
+    stable_map = merged_data.stable_map
+    generator = random.Random(args.seed)
+    aliases = generator.choices(list(stable_map), k=args.queries)
+    queries = [mutate(alias, args.typos, generator) for alias in aliases]
+
+    start = time.perf_counter()
+    LicenseLynx.suggest("MIT")
+    print(f"index build and first call: {(time.perf_counter() - start) * 1000:.1f} ms, "
+          f"{len(merged_data.suggestion_index()._folded_keys)} folded keys")
+
+    latencies = []
+    found = 0
+    exact_hits = 0
+    for alias, query in zip(aliases, queries):
+        exact_hits += LicenseLynx.map(query) is not None
+        start = time.perf_counter()
+        suggestions = LicenseLynx.suggest(query)
+        latencies.append(time.perf_counter() - start)
+        found += any(suggestion.license is stable_map[alias] for suggestion in suggestions)
+
+    latencies.sort()
+    print(f"{args.queries} queries with {args.typos} typos: "
+          f"p50 {latencies[len(latencies) // 2] * 1000:.3f} ms, p99 {latencies[int(len(latencies) * 0.99)] * 1000:.3f} ms, "
+          f"max {latencies[-1] * 1000:.3f} ms")
+    print(f"map hits {exact_hits / args.queries:.1%}, original license among suggestions {found / args.queries:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+"""
+Measures LicenseLynx.map throughput with 1 to N threads after the maps are loaded.
+Lookups only scale with the thread count on a free-threaded interpreter (e.g. python3.13t),
+with the GIL enabled the numbers show that steady-state lookups do not add lock contention on top of it.
+
+Usage: python -m benchmarks.benchmark_thread_scaling [--threads N] [--lookups N]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+from licenselynx import LicenseLynx
+
+LICENSE_NAMES = ["MIT", "Apache License 2.0", "BSD-3-Clause", "GPL-2.0", "license-that-does-not-exist", "ISC License"]
+
+
+def run(thread_count: int, lookups: int) -> float:
+    barrier = threading.Barrier(thread_count + 1)
+
+    def worker():
+        names = LICENSE_NAMES * (lookups // len(LICENSE_NAMES))
+        barrier.wait()
+        for name in names:
+            LicenseLynx.map(name, risky=True)
+
+    threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return thread_count * lookups / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 4, help="Maximum number of threads")
+    parser.add_argument("--lookups", type=int, default=200_000, help="Lookups per thread")
+    args = parser.parse_args()
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL enabled: {gil_enabled}")
+
+    LicenseLynx.map("MIT")
+    single = run(1, args.lookups)
+    for thread_count in range(1, args.threads + 1):
+        throughput = single if thread_count == 1 else run(thread_count, args.lookups)
+        print(f"{thread_count:>3} threads: {throughput / 1e6:6.2f} M lookups/s ({throughput / single:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,12 @@ import zipfile
 import re
 from pathlib import Path
 
+# A tuple lists alternatives of which one is expected, merged_data.json may be shipped gzip-compressed
+EXPECTED_RESOURCES = [("merged_data.json", "merged_data.json.gz"), "merged_data.idx", "merged_aliases.json",
+                      "merged_data.bloom"]
 EXPECTED_SUBPATHS = [
-    "licenselynx/resources/merged_data.json",  # Without versioned directory
-    ".+/licenselynx/resources/merged_data.json"  # With versioned directory (regex pattern)
+    "licenselynx/resources/{}",  # Without versioned directory
+    ".+/licenselynx/resources/{}"  # With versioned directory (regex pattern)
 ]
 DIST_DIR = Path("dist")
 
@@ -34,36 +37,39 @@ def get_latest_file(extension):
     return files[0]
 
 
-def find_matching_path(archive_members):
+def find_matching_path(archive_members, resource):
     """
-    Check if any path in the archive matches one of the expected paths.
+    Check if any path in the archive matches one of the expected paths of the resource.
     """
     for expected_path in EXPECTED_SUBPATHS:
-        if any(re.match(expected_path, member) for member in archive_members):
+        pattern = expected_path.format(re.escape(resource))
+        if any(re.fullmatch(pattern, member) for member in archive_members):
             return True
     return False
 
 
-def check_sdist(file_path):
-    """Check if the expected file exists in the tar.gz (sdist)."""
-    with tarfile.open(file_path, "r:gz") as tar:
-        archive_members = tar.getnames()
-        if find_matching_path(archive_members):
-            print("SUCCESS: merged_data.json found in source distribution.")
+def check_resources(archive_members, distribution):
+    """Check if all expected resources exist in the archive members of a distribution."""
+    for resource in EXPECTED_RESOURCES:
+        alternatives = resource if isinstance(resource, tuple) else (resource,)
+        found = next((alternative for alternative in alternatives if find_matching_path(archive_members, alternative)), None)
+        if found:
+            print(f"SUCCESS: {found} found in {distribution} distribution.")
         else:
-            print("ERROR: merged_data.json NOT found in source distribution.")
+            print(f"ERROR: {' or '.join(alternatives)} NOT found in {distribution} distribution.")
             sys.exit(1)
 
 
+def check_sdist(file_path):
+    """Check if the expected files exist in the tar.gz (sdist)."""
+    with tarfile.open(file_path, "r:gz") as tar:
+        check_resources(tar.getnames(), "source")
+
+
 def check_wheel(file_path):
-    """Check if the expected file exists in the wheel (.whl)."""
+    """Check if the expected files exist in the wheel (.whl)."""
     with zipfile.ZipFile(file_path, "r") as zipf:
-        archive_members = zipf.namelist()
-        if find_matching_path(archive_members):
-            print("SUCCESS: merged_data.json found in wheel distribution.")
-        else:
-            print("ERROR: merged_data.json NOT found in wheel distribution.")
-            sys.exit(1)
+        check_resources(zipf.namelist(), "wheel")
 
 
 def main():
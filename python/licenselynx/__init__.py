@@ -1,15 +1,44 @@
 # SPDX-FileCopyrightText: Copyright 2025 Siemens AG
 # SPDX-License-Identifier: BSD-3-Clause
 """LicenseLynx Python Library"""
+from typing import TYPE_CHECKING
 
 from licenselynx.organization import Organization
 from licenselynx.license_object import LicenseObject
 from licenselynx.licenselynx import LicenseLynx
 from licenselynx.license_source import LicenseSource
+from licenselynx.license_expression import LicenseExpression, LicenseOperation, LicenseSymbol, LicenseWithException
+from licenselynx.license_name_folding import fold_license_name
+from licenselynx.lookup_cache import CacheInfo
+from licenselynx.data_watcher import DataWatcher, ReloadInfo
+from licenselynx.preload_handle import PreloadHandle
+from licenselynx.suggestion_index import Suggestion
+
+if TYPE_CHECKING:
+    from licenselynx.shared_license_data import SharedLicenseData
 
 __all__ = [
     "LicenseLynx",
     "Organization",
     "LicenseObject",
     "LicenseSource",
+    "PreloadHandle",
+    "CacheInfo",
+    "DataWatcher",
+    "ReloadInfo",
+    "SharedLicenseData",
+    "Suggestion",
+    "LicenseExpression",
+    "LicenseOperation",
+    "LicenseSymbol",
+    "LicenseWithException",
+    "fold_license_name",
 ]
+
+
+def __getattr__(name: str):
+    # SharedLicenseData is imported on first access, it pulls in process pools and shared memory
+    if name == "SharedLicenseData":
+        from licenselynx.shared_license_data import SharedLicenseData
+        return SharedLicenseData
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,67 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import math
+import struct
+import zlib
+from collections.abc import Collection
+
+# Layout of merged_data.bloom as written by scripts/src/load/merge_data.py --bloom: a header
+# (magic, version, hash count, bit count) followed by the bit array, bit i is bit i % 8 of byte i // 8.
+# The bit positions of a key are derived from two CRC-32 hashes of its UTF-8 bytes (double hashing).
+_BLOOM_MAGIC = b"LLYNXBLM"
+_BLOOM_VERSION = 1
+_HEADER = struct.Struct("<8sIII")
+_SECOND_HASH_SEED = 0x9E3779B9
+FALSE_POSITIVE_RATE = 0.001
+
+
+def build_bloom_filter(keys: Collection[str], false_positive_rate: float = FALSE_POSITIVE_RATE) -> bytes:
+    """
+    Builds a Bloom filter over distinct keys, sized for the given false positive rate.
+    :param keys: distinct keys
+    :param false_positive_rate: probability that a key that was not added is reported as contained
+    :return: Bloom filter in the layout described above
+    """
+    bit_count = max(8, math.ceil(-len(keys) * math.log(false_positive_rate) / math.log(2) ** 2))
+    hash_count = max(1, round(bit_count / max(1, len(keys)) * math.log(2)))
+    bits = bytearray(-(-bit_count // 8))
+    for key in keys:
+        encoded_key = key.encode("utf-8", "surrogatepass")
+        first_hash = zlib.crc32(encoded_key)
+        second_hash = zlib.crc32(encoded_key, _SECOND_HASH_SEED) | 1
+        for position in range(hash_count):
+            bit = (first_hash + position * second_hash) % bit_count
+            bits[bit >> 3] |= 1 << (bit & 7)
+    return _HEADER.pack(_BLOOM_MAGIC, _BLOOM_VERSION, hash_count, bit_count) + bytes(bits)
+
+
+class _BloomFilter:
+    """Read-only Bloom filter: a key that is not contained was never added, a contained key may have been added."""
+
+    def __init__(self, buffer: bytes):
+        magic, version, hash_count, bit_count = _HEADER.unpack_from(buffer, 0)
+        if magic != _BLOOM_MAGIC:
+            raise ValueError("Bloom filter has an invalid header")
+        if version != _BLOOM_VERSION:
+            raise ValueError(f"Bloom filter version {version} is not supported, expected {_BLOOM_VERSION}")
+        if len(buffer) < _HEADER.size + -(-bit_count // 8):
+            raise ValueError("Bloom filter is truncated")
+
+        self._bits = bytes(buffer[_HEADER.size:])
+        self._hash_count = hash_count
+        self._bit_count = bit_count
+
+    def __contains__(self, key) -> bool:
+        if not isinstance(key, str):
+            return False
+        encoded_key = key.encode("utf-8", "surrogatepass")
+        first_hash = zlib.crc32(encoded_key)
+        second_hash = zlib.crc32(encoded_key, _SECOND_HASH_SEED) | 1
+        bits, bit_count = self._bits, self._bit_count
+        for position in range(self._hash_count):
+            bit = (first_hash + position * second_hash) % bit_count
+            if not bits[bit >> 3] >> (bit & 7) & 1:
+                return False
+        return True
@@ -0,0 +1,93 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import os
+from collections.abc import Callable
+from threading import Event, Thread
+from typing import NamedTuple, Optional
+
+
+class ReloadInfo(NamedTuple):
+    """Reloads of the license data from an external data file, see LicenseLynx.reload_info."""
+    data_path: Optional[str]
+    reloads: int
+    last_reload: Optional[float]
+
+
+class DataWatcher(object):
+    """DataWatcher class polls the data file of LicenseLynx.use_data_path and reloads the license data when it changes."""
+
+    def __init__(self, data_path: Callable[[], Optional[str]], reload: Callable[[], None], interval: float):
+        """
+        Starts polling on a daemon thread.
+        :param data_path: returns the path of the current data file, None while there is none
+        :param reload: reloads the current data file
+        :param interval: seconds between two polls
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self._data_path = data_path
+        self._reload = reload
+        self._interval = interval
+        self._stopped = Event()
+        self._error: Optional[Exception] = None
+        self._watched_path = data_path()
+        self._signature = self._stat(self._watched_path)
+        self._thread = Thread(target=self._run, name="licenselynx-data-watcher", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _stat(data_path: Optional[str]) -> Optional[tuple[int, int, int]]:
+        if data_path is None:
+            return None
+        try:
+            stat = os.stat(data_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self.check()
+
+    def check(self) -> bool:
+        """
+        Reloads the license data if the data file changed since the last successful reload. A file that cannot
+        be loaded, e.g. because it is still being written, keeps the current data and is retried on the next check.
+        If the data path itself changed, the new file was just loaded and is only watched from now on.
+        :return: True if the license data was reloaded
+        """
+        data_path = self._data_path()
+        signature = self._stat(data_path)
+        if data_path != self._watched_path:
+            self._watched_path = data_path
+            self._signature = signature
+            self._error = None
+            return False
+        if signature is None or signature == self._signature:
+            return False
+        try:
+            self._reload()
+        except Exception as e:
+            self._error = e
+            return False
+        self._signature = signature
+        self._error = None
+        return True
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops polling and waits for a reload in progress to finish.
+        :param timeout: maximum number of seconds to wait, None waits until the watcher stopped
+        """
+        self._stopped.set()
+        self._thread.join(timeout)
+
+    def is_running(self) -> bool:
+        return self._thread.is_alive()
+
+    @property
+    def last_error(self) -> Optional[Exception]:
+        """The exception the last reload failed with, None if the last reload succeeded or none was needed yet."""
+        return self._error
@@ -0,0 +1,142 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import json
+import re
+from collections.abc import Callable, Collection
+from threading import Lock
+from typing import Any, Optional
+
+_DECODER = json.JSONDecoder()
+# Decodes a value only to find its end: objects are dropped instead of being built
+_SKIPPING_DECODER = json.JSONDecoder(object_pairs_hook=lambda pairs: None)
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JsonSections:
+    """
+    Top-level members of a JSON object, decoded one at a time in document order and only as far as needed.
+    The text is not kept: members that were not decoded up front are decoded from a fresh copy of the text
+    when they are first requested, members passed over on the way are only skipped. The positions of the members
+    are only valid in the same text, so a fresh copy that differs from it, e.g. after the file was replaced by
+    an update of the package, is rejected.
+    """
+
+    def __init__(self, text: str, read_text: Callable[[], str], names: Collection[str]):
+        """
+        Decodes the members of the object up to the last of the given names.
+        :param text: JSON text of an object
+        :param read_text: returns the same JSON text again, called on first request of a member that was not decoded
+        :param names: members to decode up front, together with all members preceding them
+        """
+        self._read_text = read_text
+        self._fingerprint = _fingerprint(text)
+        self._sections: dict[str, Any] = {}
+        # Position of the value of every member that was skipped, decoded on first request
+        self._offsets: dict[str, int] = {}
+        self._names: list[str] = []
+        self._lock = Lock()
+
+        position = _skip_whitespace(text, 0)
+        if not text.startswith("{", position):
+            raise json.JSONDecodeError("Expecting '{'", text, position)
+        position = _skip_whitespace(text, position + 1)
+        self._position: Optional[int] = None if text.startswith("}", position) else position
+        remaining = set(names)
+        while remaining and self._position is not None:
+            remaining.discard(self._next_member(text, True))
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the members seen so far, in document order. Complete once is_complete is True."""
+        return list(self._names)
+
+    @property
+    def is_complete(self) -> bool:
+        return self._position is None
+
+    def skip_to(self, text: str, names: Optional[Collection[str]] = None) -> None:
+        """
+        Skips the members that were not decoded yet up to the last of the given names, without keeping their values.
+        :param text: the JSON text passed to the constructor
+        :param names: members to skip to, all remaining members if None, so names is complete
+        """
+        with self._lock:
+            remaining = None if names is None else set(names).difference(self._names)
+            while self._position is not None and (remaining is None or remaining):
+                name = self._next_member(text, False)
+                if remaining is not None:
+                    remaining.discard(name)
+
+    def pop(self, name: str) -> Optional[Any]:
+        """
+        Returns the value of a member and drops it. A member that was not decoded yet is decoded from a fresh copy
+        of the text, skipping the members preceding it.
+        :param name: member name
+        :return: value, None if the object has no such member or it was already popped
+        :raises ValueError: if the fresh copy of the text differs from the text passed to the constructor
+        """
+        with self._lock:
+            if name in self._sections:
+                return self._sections.pop(name)
+            if name not in self._offsets and self._position is None:
+                return None
+
+            text = self._fresh_text()
+            while name not in self._offsets and self._position is not None:
+                self._next_member(text, False)
+            if name not in self._offsets:
+                return None
+            # The position is only dropped once the value is decoded, a failed attempt can be repeated
+            value = _DECODER.raw_decode(text, self._offsets[name])[0]
+            del self._offsets[name]
+            return value
+
+    def _fresh_text(self) -> str:
+        text = self._read_text()
+        if _fingerprint(text) != self._fingerprint:
+            raise ValueError("The JSON text changed since it was first read, its members cannot be decoded any more")
+        return text
+
+    def _next_member(self, text: str, decode: bool) -> str:
+        """
+        Reads the "name": value member at the current position and advances to the next one.
+        :param decode: store the decoded value, else only remember the position of the value
+        :return: name of the member
+        """
+        position = self._position
+        assert position is not None
+        if not text.startswith('"', position):
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, position)
+        name, position = _DECODER.raw_decode(text, position)
+        position = _skip_whitespace(text, position)
+        if not text.startswith(":", position):
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, position)
+        position = _skip_whitespace(text, position + 1)
+        if decode:
+            self._sections[name], position = _DECODER.raw_decode(text, position)
+        else:
+            self._offsets[name] = position
+            _, position = _SKIPPING_DECODER.raw_decode(text, position)
+        self._names.append(name)
+
+        position = _skip_whitespace(text, position)
+        if text.startswith("}", position):
+            self._position = None
+        elif text.startswith(",", position):
+            self._position = _skip_whitespace(text, position + 1)
+        else:
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, position)
+        return name
+
+
+def _fingerprint(text: str) -> tuple[int, int]:
+    # The hash of a str is computed once and cached on it, and stable within the process
+    return len(text), hash(text)
+
+
+def _skip_whitespace(text: str, position: int) -> int:
+    match = _WHITESPACE.match(text, position)
+    assert match is not None
+    return match.end()
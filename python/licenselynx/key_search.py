@@ -0,0 +1,94 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Mapping
+
+from licenselynx.license_object import LicenseObject
+
+
+def _matches(names: Iterator[str], view: Mapping[str, LicenseObject], limit: int) -> list[tuple[str, LicenseObject]]:
+    """
+    Resolves names in the view until limit names were found, names not contained in the view are skipped.
+    """
+    results = []
+    for name in names:
+        license_object = view.get(name)
+        if license_object is not None:
+            results.append((name, license_object))
+            if len(results) == limit:
+                break
+    return results
+
+
+class _PrefixIndex:
+    """Case-insensitive prefix search over a sorted array of keys, O(log n) plus the size of the result."""
+
+    def __init__(self, keys: Iterable[str]):
+        self._keys = sorted(set(keys), key=lambda key: (key.casefold(), key))
+        self._folded_keys = [key.casefold() for key in self._keys]
+
+    def search(self, prefix: str, view: Mapping[str, LicenseObject], limit: int) -> list[tuple[str, LicenseObject]]:
+        """
+        :param prefix: prefix of the names, compared case-insensitively
+        :param view: mapping the names are resolved in, names not contained in it are skipped
+        :param limit: maximum number of results
+        :return: (name, LicenseObject) pairs in case-insensitive alphabetical order
+        """
+        folded_prefix = prefix.casefold()
+        start = bisect_left(self._folded_keys, folded_prefix)
+        return _matches(self._names(folded_prefix, start), view, limit)
+
+    def _names(self, folded_prefix: str, start: int) -> Iterator[str]:
+        for position in range(start, len(self._keys)):
+            if not self._folded_keys[position].startswith(folded_prefix):
+                return
+            yield self._keys[position]
+
+
+class _SubstringIndex:
+    """
+    Case-insensitive substring search over a suffix array of all keys, O(m log n) for a text of length m
+    plus the size of the result. Every suffix is stored as (key id, offset) instead of a string.
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        self._keys = sorted(set(keys))
+        self._folded_keys = [key.casefold() for key in self._keys]
+
+        suffixes = sorted((folded[offset:], key_id, offset)
+                          for key_id, folded in enumerate(self._folded_keys) for offset in range(len(folded)))
+        self._suffix_keys = array("I", (key_id for _, key_id, _ in suffixes))
+        self._suffix_offsets = array("I", (offset for _, _, offset in suffixes))
+
+    def search(self, text: str, view: Mapping[str, LicenseObject], limit: int) -> list[tuple[str, LicenseObject]]:
+        """
+        :param text: text contained in the names, compared case-insensitively
+        :param view: mapping the names are resolved in, names not contained in it are skipped
+        :param limit: maximum number of results
+        :return: (name, LicenseObject) pairs in suffix order, i.e. ordered by the text following the match,
+        so names ending with the text come first
+        """
+        folded_text = text.casefold()
+        if not folded_text:
+            return _matches(iter(self._keys), view, limit)
+
+        length = len(folded_text)
+        start = bisect_left(range(len(self._suffix_keys)), folded_text, key=lambda position: self._suffix(position, length))
+        return _matches(self._names(folded_text, start), view, limit)
+
+    def _suffix(self, position: int, length: int) -> str:
+        offset = self._suffix_offsets[position]
+        return self._folded_keys[self._suffix_keys[position]][offset:offset + length]
+
+    def _names(self, folded_text: str, start: int) -> Iterator[str]:
+        seen = set()
+        for position in range(start, len(self._suffix_keys)):
+            if self._suffix(position, len(folded_text)) != folded_text:
+                return
+            key_id = self._suffix_keys[position]
+            if key_id not in seen:
+                seen.add(key_id)
+                yield self._keys[key_id]
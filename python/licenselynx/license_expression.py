@@ -0,0 +1,177 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import re
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from licenselynx.license_object import LicenseObject
+
+# Operators are matched case-sensitively as in the SPDX specification, lowercase "and", "or" and "with"
+# are part of many license names, e.g. "GPL v2 or later".
+_OPERATORS = ("AND", "OR", "WITH")
+_PARENTHESES = ("(", ")")
+_TOKEN = re.compile(r"[()]|[^\s()]+")
+# Deeper nesting is rejected as invalid before the recursive descent exhausts the interpreter stack
+_MAX_DEPTH = 64
+
+
+@dataclass(frozen=True, slots=True)
+class LicenseSymbol:
+    """Operand of a license expression with the license it maps to, None if it has no mapping."""
+    name: str
+    license: Optional[LicenseObject]
+
+    def symbols(self) -> Iterator["LicenseSymbol"]:
+        yield self
+
+    def __str__(self) -> str:
+        return self.license.id if self.license else self.name
+
+
+@dataclass(frozen=True, slots=True)
+class LicenseWithException:
+    """License with an exception, e.g. GPL-2.0-only WITH Classpath-exception-2.0."""
+    license: LicenseSymbol
+    exception: LicenseSymbol
+
+    def symbols(self) -> Iterator[LicenseSymbol]:
+        yield self.license
+        yield self.exception
+
+    def __str__(self) -> str:
+        return f"{self.license} WITH {self.exception}"
+
+
+@dataclass(frozen=True, slots=True)
+class LicenseOperation:
+    """Conjunction (AND) or disjunction (OR) of two or more expressions."""
+    operator: str
+    operands: tuple["LicenseExpression", ...]
+
+    def symbols(self) -> Iterator[LicenseSymbol]:
+        for operand in self.operands:
+            yield from operand.symbols()
+
+    def __str__(self) -> str:
+        return f" {self.operator} ".join(
+            f"({operand})" if isinstance(operand, LicenseOperation) else str(operand) for operand in self.operands)
+
+
+LicenseExpression = Union[LicenseSymbol, LicenseWithException, LicenseOperation]
+
+
+class _ExpressionParser:
+    """
+    Recursive descent parser for SPDX license expressions. WITH binds tighter than AND, AND tighter than OR.
+    Operands may consist of several words ("MIT License"), joined by single spaces, and may end with a parenthesized
+    group without operators ("Zero-Clause BSD License (0BSD)").
+    """
+
+    def __init__(self, expression: str, resolve: Callable[[str], Optional[LicenseObject]]):
+        self._tokens = _TOKEN.findall(expression)
+        self._position = 0
+        self._depth = 0
+        self._resolve = resolve
+
+    def parse(self) -> LicenseExpression:
+        expression = self._operation("OR", self._conjunction)
+        if self._position != len(self._tokens):
+            raise ValueError(f"unexpected '{self._tokens[self._position]}'")
+        return expression
+
+    def _peek(self) -> Optional[str]:
+        return self._tokens[self._position] if self._position < len(self._tokens) else None
+
+    def _operation(self, operator: str, operand: Callable[[], LicenseExpression]) -> LicenseExpression:
+        operands = [operand()]
+        while self._peek() == operator:
+            self._position += 1
+            operands.append(operand())
+        if len(operands) == 1:
+            return operands[0]
+
+        # Flatten nested operations with the same operator, e.g. from "(A OR B) OR C"
+        flattened: list[LicenseExpression] = []
+        for expression in operands:
+            if isinstance(expression, LicenseOperation) and expression.operator == operator:
+                flattened.extend(expression.operands)
+            else:
+                flattened.append(expression)
+        return LicenseOperation(operator, tuple(flattened))
+
+    def _conjunction(self) -> LicenseExpression:
+        return self._operation("AND", self._with_exception)
+
+    def _with_exception(self) -> LicenseExpression:
+        expression = self._primary()
+        if self._peek() != "WITH":
+            return expression
+        self._position += 1
+        if not isinstance(expression, LicenseSymbol):
+            raise ValueError("WITH must follow a single license")
+        return LicenseWithException(expression, self._symbol())
+
+    def _primary(self) -> LicenseExpression:
+        if self._peek() != "(":
+            return self._symbol()
+        self._position += 1
+        self._depth += 1
+        if self._depth > _MAX_DEPTH:
+            raise ValueError(f"parentheses nested deeper than {_MAX_DEPTH} levels")
+        expression = self._operation("OR", self._conjunction)
+        if self._peek() != ")":
+            raise ValueError("missing ')'")
+        self._position += 1
+        self._depth -= 1
+        return expression
+
+    def _symbol(self) -> LicenseSymbol:
+        words = []
+        while (token := self._peek()) is not None and token not in _OPERATORS and token not in _PARENTHESES:
+            words.append(token)
+            self._position += 1
+        if not words:
+            raise ValueError(f"expected a license, found '{token}'" if token else "expected a license")
+
+        group = self._operator_free_group()
+        name = " ".join(words) + (f" ({' '.join(group)})" if group is not None else "")
+        return LicenseSymbol(name, self._resolve(name))
+
+    def _operator_free_group(self) -> Optional[list[str]]:
+        """
+        Consumes a parenthesized group directly following an operand if it contains words but no operators
+        or parentheses.
+        :return: words of the group, None if there is no such group
+        """
+        if self._peek() != "(":
+            return None
+        end = self._position + 1
+        while end < len(self._tokens) and self._tokens[end] not in _OPERATORS + _PARENTHESES:
+            end += 1
+        if end == len(self._tokens) or self._tokens[end] != ")" or end == self._position + 1:
+            return None
+        group = self._tokens[self._position + 1:end]
+        self._position = end + 1
+        return group
+
+
+def _parse_expression(expression: str, resolve: Callable[[str], Optional[LicenseObject]]) -> LicenseExpression:
+    """
+    Maps a license expression to an expression tree. The whole string is looked up first, so aliases that look like
+    expressions keep their mapping. A string that is not a valid expression is returned as a single symbol.
+    :param expression: license expression
+    :param resolve: maps one operand, called for every operand
+    :return: expression tree
+    """
+    name = expression.strip()
+    license_object = resolve(name)
+    if license_object is not None:
+        return LicenseSymbol(name, license_object)
+
+    try:
+        return _ExpressionParser(name, resolve).parse()
+    except ValueError:
+        return LicenseSymbol(name, None)
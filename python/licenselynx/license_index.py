@@ -0,0 +1,272 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import mmap
+import struct
+from collections.abc import Iterator, Mapping
+from typing import Optional, Union
+
+from licenselynx.license_object import LicenseObject
+from licenselynx.perfect_hash import build_perfect_hash, perfect_hash_key, perfect_hash_position
+
+# Binary index layout of merged_data.idx (all integers little-endian, all strings UTF-8):
+#
+#   header      magic, version, strings offset/size, licenses offset/count, maps offset/count
+#   strings     deduplicated string table, referenced by (offset, length) relative to the table start
+#   licenses    one record per distinct canonical object: (id offset, id length, src offset, src length)
+#   maps        one directory entry per map: (name offset, name length, entries offset, entry count)
+#   entries     per map, sorted by UTF-8 key bytes: (key offset, key length, license index)
+#
+# Version 2 replaces the binary search with a minimal perfect hash per map, see licenselynx/perfect_hash.py.
+# Its map directory entries add (bucket count, pilots offset, salt), the entries of a map are stored in perfect hash
+# slot order, and the pilots of all maps follow the entries as one unsigned 32-bit integer per bucket. A map with
+# a bucket count of 0 keeps the sorted layout.
+#
+# _build_index is the only writer: scripts/src/load/binary_index.py uses it for merge_data.py --index.
+_INDEX_MAGIC = b"LLYNXIDX"
+_INDEX_VERSION = 1
+_PERFECT_HASH_INDEX_VERSION = 2
+
+_HEADER = struct.Struct("<8sIIIIIII")
+_LICENSE_RECORD = struct.Struct("<IIII")
+_MAP_RECORD = struct.Struct("<IIII")
+_PERFECT_HASH_MAP_RECORD = struct.Struct("<IIIIIII")
+_ENTRY_RECORD = struct.Struct("<III")
+_PILOT_RECORD = struct.Struct("<I")
+
+
+class _LicenseIndex:
+    """Read-only view of the binary index. Strings and license objects are decoded lazily on access."""
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap, memoryview]):
+        magic, version, strings_offset, _, licenses_offset, license_count, maps_offset, map_count = \
+            _HEADER.unpack_from(buffer, 0)
+        if magic != _INDEX_MAGIC:
+            raise ValueError("Binary index has an invalid header")
+        if version not in (_INDEX_VERSION, _PERFECT_HASH_INDEX_VERSION):
+            raise ValueError(f"Binary index version {version} is not supported, "
+                             f"expected {_INDEX_VERSION} or {_PERFECT_HASH_INDEX_VERSION}")
+
+        self._buffer = buffer
+        self._strings_offset = strings_offset
+        self._licenses_offset = licenses_offset
+        self._licenses: list[Optional[LicenseObject]] = [None] * license_count
+
+        # Map name to (entries offset, entry count, bucket count, pilots offset, salt), bucket count 0 for sorted maps
+        self._maps: dict[str, tuple[int, int, int, int, int]] = {}
+        for position in range(map_count):
+            if version == _PERFECT_HASH_INDEX_VERSION:
+                name_offset, name_length, entries_offset, entry_count, bucket_count, pilots_offset, salt = \
+                    _PERFECT_HASH_MAP_RECORD.unpack_from(buffer, maps_offset + position * _PERFECT_HASH_MAP_RECORD.size)
+            else:
+                name_offset, name_length, entries_offset, entry_count = \
+                    _MAP_RECORD.unpack_from(buffer, maps_offset + position * _MAP_RECORD.size)
+                bucket_count, pilots_offset, salt = 0, 0, 0
+            self._maps[self.string(name_offset, name_length)] = (entries_offset, entry_count, bucket_count, pilots_offset, salt)
+
+    @classmethod
+    def open(cls, path) -> "_LicenseIndex":
+        """
+        Memory-maps the index file read-only. The mapping stays valid after the file is closed.
+        :param path: filesystem path of the index
+        :return: _LicenseIndex backed by the memory-mapped file
+        """
+        with open(path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer)
+
+    @property
+    def buffer(self) -> Union[bytes, mmap.mmap, memoryview]:
+        return self._buffer
+
+    @property
+    def map_names(self) -> list[str]:
+        return list(self._maps)
+
+    def license_map(self, name: str) -> "_IndexedLicenseMap":
+        entries_offset, entry_count, bucket_count, pilots_offset, salt = self._maps[name]
+        if bucket_count:
+            return _PerfectHashLicenseMap(self, entries_offset, entry_count, bucket_count, pilots_offset, salt)
+        return _IndexedLicenseMap(self, entries_offset, entry_count)
+
+    def string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return str(self._buffer[start:start + length], "utf-8", "surrogatepass")
+
+    def raw_string(self, offset: int, length: int) -> bytes:
+        start = self._strings_offset + offset
+        return bytes(self._buffer[start:start + length])
+
+    def license(self, license_index: int) -> LicenseObject:
+        license_object = self._licenses[license_index]
+        if license_object is None:
+            id_offset, id_length, src_offset, src_length = \
+                _LICENSE_RECORD.unpack_from(self._buffer, self._licenses_offset + license_index * _LICENSE_RECORD.size)
+            license_object = LicenseObject(id=self.string(id_offset, id_length), src=self.string(src_offset, src_length))
+            self._licenses[license_index] = license_object
+        return license_object
+
+    def load_licenses(self) -> None:
+        """
+        Decodes all license records up front instead of on first lookup.
+        """
+        for license_index in range(len(self._licenses)):
+            self.license(license_index)
+
+    def entry(self, offset: int) -> tuple[int, int, int]:
+        return _ENTRY_RECORD.unpack_from(self._buffer, offset)
+
+    def pilot(self, offset: int) -> int:
+        return _PILOT_RECORD.unpack_from(self._buffer, offset)[0]
+
+
+class _IndexedLicenseMap(Mapping[str, LicenseObject]):
+    """Mapping of alias to LicenseObject backed by one sorted entry table of the binary index."""
+
+    def __init__(self, index: _LicenseIndex, entries_offset: int, entry_count: int):
+        self._index = index
+        self._entries_offset = entries_offset
+        self._entry_count = entry_count
+
+    def _find(self, key: str) -> int:
+        """
+        Binary search over the sorted entry table.
+        :param key: alias to look up
+        :return: license index of the alias, -1 if the alias is not in the map
+        """
+        encoded_key = key.encode("utf-8", "surrogatepass")
+        low, high = 0, self._entry_count
+        while low < high:
+            middle = (low + high) // 2
+            key_offset, key_length, license_index = self._index.entry(self._entries_offset + middle * _ENTRY_RECORD.size)
+            probe = self._index.raw_string(key_offset, key_length)
+            if probe < encoded_key:
+                low = middle + 1
+            elif probe > encoded_key:
+                high = middle
+            else:
+                return license_index
+        return -1
+
+    def get(self, key, default=None):
+        if not isinstance(key, str):
+            return default
+        license_index = self._find(key)
+        if license_index < 0:
+            return default
+        return self._index.license(license_index)
+
+    def __getitem__(self, key: str) -> LicenseObject:
+        license_object = self.get(key)
+        if license_object is None:
+            raise KeyError(key)
+        return license_object
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._entry_count):
+            key_offset, key_length, _ = self._index.entry(self._entries_offset + position * _ENTRY_RECORD.size)
+            yield self._index.string(key_offset, key_length)
+
+    def __len__(self) -> int:
+        return self._entry_count
+
+
+class _PerfectHashLicenseMap(_IndexedLicenseMap):
+    """Mapping of alias to LicenseObject backed by one minimal perfect hash entry table of the binary index."""
+
+    def __init__(self, index: _LicenseIndex, entries_offset: int, entry_count: int, bucket_count: int,
+                 pilots_offset: int, salt: int):
+        super().__init__(index, entries_offset, entry_count)
+        self._bucket_count = bucket_count
+        self._pilots_offset = pilots_offset
+        self._salt = salt
+
+    def _find(self, key: str) -> int:
+        """
+        Probes the one slot the key can be stored in. The perfect hash maps unknown keys to arbitrary slots,
+        so the stored key is compared before the entry is returned.
+        :param key: alias to look up
+        :return: license index of the alias, -1 if the alias is not in the map
+        """
+        encoded_key = key.encode("utf-8", "surrogatepass")
+        key_hash = perfect_hash_key(encoded_key, self._salt)
+        pilot = self._index.pilot(self._pilots_offset + (key_hash % self._bucket_count) * _PILOT_RECORD.size)
+        slot = perfect_hash_position(key_hash, pilot, self._entry_count)
+        key_offset, key_length, license_index = self._index.entry(self._entries_offset + slot * _ENTRY_RECORD.size)
+        if key_length != len(encoded_key) or self._index.raw_string(key_offset, key_length) != encoded_key:
+            return -1
+        return license_index
+
+
+def _order_entries(map_entries: list[tuple[bytes, int, int, int]], perfect_hash: bool) \
+        -> tuple[list[tuple[bytes, int, int, int]], int, list[int]]:
+    """
+    Orders the (encoded key, key offset, key length, license index) entries of one map.
+    :return: entries sorted by key bytes or in perfect hash slot order, salt and pilots of the perfect hash
+    """
+    if not perfect_hash or not map_entries:
+        return sorted(map_entries, key=lambda entry: entry[0]), 0, []
+    salt, pilots, slots = build_perfect_hash([entry[0] for entry in map_entries])
+    return [map_entries[position] for position in slots], salt, pilots
+
+
+def _build_index(maps: Mapping[str, Mapping[str, LicenseObject]], perfect_hash: bool = False) -> bytes:
+    """
+    Builds a binary index in the layout described above from already loaded maps.
+    :param maps: map name to mapping of alias to LicenseObject
+    :param perfect_hash: build version 2 with a minimal perfect hash per map instead of sorted entry tables
+    :return: binary index
+    """
+    strings: dict[str, tuple[int, int]] = {}
+    blob = bytearray()
+    license_indices: dict[LicenseObject, int] = {}
+    licenses = bytearray()
+    tables = []
+
+    def add_string(value: str) -> tuple[int, int]:
+        reference = strings.get(value)
+        if reference is None:
+            encoded = value.encode("utf-8", "surrogatepass")
+            reference = (len(blob), len(encoded))
+            blob.extend(encoded)
+            strings[value] = reference
+        return reference
+
+    for name, license_map in maps.items():
+        map_entries = []
+        for alias, license_object in license_map.items():
+            license_index = license_indices.get(license_object)
+            if license_index is None:
+                license_index = len(license_indices)
+                license_indices[license_object] = license_index
+                licenses.extend(_LICENSE_RECORD.pack(*add_string(license_object.id), *add_string(license_object.src)))
+            map_entries.append((alias.encode("utf-8", "surrogatepass"), *add_string(alias), license_index))
+        map_entries, salt, pilots = _order_entries(map_entries, perfect_hash)
+        tables.append((add_string(name), b"".join(_ENTRY_RECORD.pack(*entry[1:]) for entry in map_entries), len(map_entries),
+                       b"".join(_PILOT_RECORD.pack(pilot) for pilot in pilots), len(pilots), salt))
+
+    map_record = _PERFECT_HASH_MAP_RECORD if perfect_hash else _MAP_RECORD
+    licenses_offset = _HEADER.size + len(blob)
+    maps_offset = licenses_offset + len(licenses)
+    entries_offset = maps_offset + len(tables) * map_record.size
+    pilots_offset = entries_offset + sum(len(table[1]) for table in tables)
+    map_records = bytearray()
+    entries = bytearray()
+    pilot_tables = bytearray()
+    for (name_offset, name_length), table, entry_count, pilot_table, bucket_count, salt in tables:
+        if perfect_hash:
+            map_records.extend(map_record.pack(name_offset, name_length, entries_offset + len(entries), entry_count,
+                                               bucket_count, pilots_offset + len(pilot_tables), salt))
+        else:
+            map_records.extend(map_record.pack(name_offset, name_length, entries_offset + len(entries), entry_count))
+        entries.extend(table)
+        pilot_tables.extend(pilot_table)
+
+    version = _PERFECT_HASH_INDEX_VERSION if perfect_hash else _INDEX_VERSION
+    header = _HEADER.pack(_INDEX_MAGIC, version, _HEADER.size, len(blob), licenses_offset, len(license_indices),
+                          maps_offset, len(tables))
+    return header + bytes(blob) + bytes(licenses) + bytes(map_records) + bytes(entries) + bytes(pilot_tables)
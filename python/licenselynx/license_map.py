@@ -2,14 +2,191 @@
 # SPDX-FileCopyrightText: Copyright 2025 Siemens AG
 # SPDX-License-Identifier: BSD-3-Clause
 #
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Optional
 
+from licenselynx.key_search import _PrefixIndex, _SubstringIndex
 from licenselynx.license_object import LicenseObject
 from licenselynx.organization import Organization
+from licenselynx.suggestion_index import _SuggestionIndex
+
+
+class _LazyMap(Mapping[str, LicenseObject]):
+    """Mapping of alias to LicenseObject that is loaded on first access, for maps that many callers never use."""
+
+    def __init__(self, load: Callable[[], Mapping[str, LicenseObject]]):
+        self._load: Optional[Callable[[], Mapping[str, LicenseObject]]] = load
+        self._map: Optional[Mapping[str, LicenseObject]] = None
+        self._lock = Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._map is not None
+
+    def loaded(self) -> Mapping[str, LicenseObject]:
+        """
+        Loads the map unless it is loaded already. The lock is only taken until the map exists,
+        and the loader is dropped afterwards so it can release its source data.
+        :return: the loaded map
+        """
+        license_map = self._map
+        if license_map is None:
+            with self._lock:
+                license_map = self._map
+                if license_map is None:
+                    assert self._load is not None
+                    license_map = self._load()
+                    self._map = license_map
+                    self._load = None
+        return license_map
+
+    def get(self, key, default=None):
+        return self.loaded().get(key, default)
+
+    def __getitem__(self, key: str) -> LicenseObject:
+        return self.loaded()[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self.loaded()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.loaded())
+
+    def __len__(self) -> int:
+        return len(self.loaded())
+
+
+class _ChainedMap(Mapping[str, LicenseObject]):
+    """
+    Mapping that probes several maps in order without copying them, for maps backed by the binary index,
+    whose keys are only decoded on lookup. The first map containing a key wins.
+    """
+
+    def __init__(self, maps: Sequence[Mapping[str, LicenseObject]]):
+        self._maps = maps
+
+    def get(self, key, default=None):
+        for license_map in self._maps:
+            license_object = license_map.get(key)
+            if license_object is not None:
+                return license_object
+        return default
+
+    def __getitem__(self, key: str) -> LicenseObject:
+        license_object = self.get(key)
+        if license_object is None:
+            raise KeyError(key)
+        return license_object
+
+    def __contains__(self, key) -> bool:
+        return any(key in license_map for license_map in self._maps)
+
+    def __iter__(self) -> Iterator[str]:
+        seen: set[str] = set()
+        for license_map in self._maps:
+            for key in license_map:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
 
 
 @dataclass
 class _LicenseMap(object):
-    stable_map: dict[str, LicenseObject]
-    risky_map: dict[str, LicenseObject]
-    organizations: dict[Organization, dict[str, LicenseObject]]
+    stable_map: Mapping[str, LicenseObject]
+    risky_map: Mapping[str, LicenseObject]
+    organizations: Mapping[Organization, Mapping[str, LicenseObject]]
+    # Maps keyed by fold_license_name, used as fallback when the exact name misses. None if not shipped.
+    folded: Optional["_LicenseMap"] = None
+    _views: dict[tuple[bool, Optional[Organization]], Mapping[str, LicenseObject]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _suggestion_index: Optional[_SuggestionIndex] = field(default=None, init=False, repr=False, compare=False)
+    _prefix_index: Optional[_PrefixIndex] = field(default=None, init=False, repr=False, compare=False)
+    _substring_index: Optional[_SubstringIndex] = field(default=None, init=False, repr=False, compare=False)
+
+    def view(self, risky: bool, org: Optional[Organization]) -> Mapping[str, LicenseObject]:
+        """
+        Returns a single mapping for a lookup with the given options, so a lookup is one probe instead of one per map.
+        Views are built on first use and cached; they share the LicenseObjects of the underlying maps.
+        If all maps are plain dicts, the view is a merged dict. Maps backed by the binary index are probed
+        in order instead, so their keys are never copied onto the heap.
+        Precedence is the same as probing the maps in order: stable, then risky, then organization.
+        :param risky: include risky mappings
+        :param org: include the mappings of this organization
+        :return: mapping of alias to LicenseObject
+        """
+        if not risky and not org:
+            return self.stable_map
+
+        key = (risky, org or None)
+        view = self._views.get(key)
+        if view is None:
+            maps = [self.stable_map]
+            if risky:
+                maps.append(self.risky_map)
+            if org:
+                maps.append(self.organizations[org])
+            maps = [license_map.loaded() if isinstance(license_map, _LazyMap) else license_map for license_map in maps]
+            if all(isinstance(license_map, dict) for license_map in maps):
+                merged: dict[str, LicenseObject] = {}
+                for license_map in reversed(maps):
+                    merged.update(license_map)
+                view = merged
+            else:
+                view = _ChainedMap(maps)
+            self._views[key] = view
+        return view
+
+    def load_views(self) -> None:
+        """
+        Builds the views of all lookup options and of the folded maps up front, see view.
+        """
+        for org in (None, *self.organizations):
+            for risky in (False, True):
+                self.view(risky, org)
+        if self.folded is not None:
+            self.folded.load_views()
+
+    def suggestion_index(self) -> _SuggestionIndex:
+        """
+        Returns the trigram index over the keys of all maps, built on first use.
+        Concurrent first calls may each build an index, the last one built is kept.
+        :return: _SuggestionIndex
+        """
+        index = self._suggestion_index
+        if index is None:
+            index = _SuggestionIndex(self._keys())
+            self._suggestion_index = index
+        return index
+
+    def prefix_index(self) -> _PrefixIndex:
+        """
+        Returns the sorted key array for prefix search over the keys of all maps, built on first use like suggestion_index.
+        :return: _PrefixIndex
+        """
+        index = self._prefix_index
+        if index is None:
+            index = _PrefixIndex(self._keys())
+            self._prefix_index = index
+        return index
+
+    def substring_index(self) -> _SubstringIndex:
+        """
+        Returns the suffix array for substring search over the keys of all maps, built on first use like suggestion_index.
+        :return: _SubstringIndex
+        """
+        index = self._substring_index
+        if index is None:
+            index = _SubstringIndex(self._keys())
+            self._substring_index = index
+        return index
+
+    def _keys(self) -> list[str]:
+        keys = [*self.stable_map, *self.risky_map]
+        for org_map in self.organizations.values():
+            keys.extend(org_map)
+        return keys
@@ -2,13 +2,46 @@
 # SPDX-FileCopyrightText: Copyright 2025 Siemens AG
 # SPDX-License-Identifier: BSD-3-Clause
 #
+import gzip
+import importlib
+import importlib.util
 import json
+import os
 import sys
+import time
+from collections.abc import Callable, Collection, Iterable, Mapping, Sequence
 from importlib import resources
+from pathlib import Path
 from threading import Lock
-from licenselynx.license_map import _LicenseMap
+from typing import Optional
+from licenselynx.bloom_filter import _BloomFilter
+from licenselynx.data_watcher import ReloadInfo
+from licenselynx.license_index import _LicenseIndex, _build_index
+from licenselynx.json_sections import _JsonSections
+from licenselynx.license_map import _LazyMap, _LicenseMap
+from licenselynx.license_name_folding import FOLDED_MAP_SUFFIX
 from licenselynx.license_object import LicenseObject
 from licenselynx.organization import Organization
+from licenselynx.snapshot_cache import build_snapshot, default_cache_dir, read_snapshot, snapshot_path, write_snapshot
+
+# Selects the data backend: "auto" uses the binary index if it is packaged, then the generated modules,
+# and falls back to JSON. "index", "generated" and "json" force the respective backend.
+BACKEND_ENV_VAR = "LICENSELYNX_BACKEND"
+BACKENDS = ("auto", "index", "generated", "json")
+
+# Suffix of the gzip-compressed merged_data.json written by merge_data.py -o merged_data.json.gz
+COMPRESSED_SUFFIX = ".gz"
+
+# Enables the snapshot cache of the JSON backend: "1" keeps the snapshots in the user cache directory,
+# any other value except "0" is the cache directory. See licenselynx/snapshot_cache.py.
+SNAPSHOT_CACHE_ENV_VAR = "LICENSELYNX_SNAPSHOT_CACHE"
+
+# Path of a merged_data.json outside the package that is loaded instead of the packaged data,
+# see LicenseLynx.use_data_path
+DATA_PATH_ENV_VAR = "LICENSELYNX_DATA_PATH"
+
+# Package of the modules written by merge_data.py --python-modules, see scripts/src/load/python_codegen.py
+GENERATED_PACKAGE = "licenselynx._generated"
 
 
 class _Singleton(type):
@@ -16,50 +49,446 @@ class _Singleton(type):
     _lock: Lock = Lock()
 
     def __call__(cls, *args, **kwargs):
+        # Double-checked locking: the lock is only taken until the instance exists. The instance is
+        # published to the dict after it is fully constructed, and dict reads and writes are atomic
+        # with and without the GIL, so steady-state calls never block each other.
+        instance = cls._instances.get(cls)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    cls._instances[cls] = instance
+        return instance
+
+    def install(cls, instance) -> None:
+        """
+        Replaces the instance, e.g. with one created from data shared by another process.
+        :param instance: instance of the class
+        """
         with cls._lock:
-            if cls not in cls._instances:
-                instance = super().__call__(*args, **kwargs)
-                cls._instances[cls] = instance
-        return cls._instances[cls]
+            cls._instances[cls] = instance
+
+    def is_initialized(cls) -> bool:
+        """
+        Checks without blocking whether the instance has already been created.
+        :return: True if the instance exists
+        """
+        return cls._instances.get(cls) is not None
 
 
 class _LicenseMapSingleton(metaclass=_Singleton):
-    def __init__(self):
+    def __init__(self, data_path: Optional[str] = None):
+        """
+        Loads the packaged license data, or the merged_data.json at data_path or LICENSELYNX_DATA_PATH instead.
+        :param data_path: path of a merged_data.json (format version 1 or 2, gzip-compressed if it ends with .gz)
+        """
         self._stable_map_str = "stableMap"
         self._risky_map_str = "riskyMap"
-        self._file_path = resources.files("licenselynx.resources").joinpath("merged_data.json")
+        self._data_path: Optional[str] = data_path or os.environ.get(DATA_PATH_ENV_VAR) or None
+        self._alias_index: Optional[dict[str, dict[str, list[str]]]] = None
+        self._data_alias_index: Optional[tuple[_LicenseMap, dict[str, dict[str, list[str]]]]] = None
+        self._index: Optional[_LicenseIndex] = None
+        self._owner: object = None
+        self._reload_lock = Lock()
+        self._reloads = 0
+        self._last_reload: Optional[float] = None
         try:
-            with self._file_path.open() as file:
-                data = json.load(file)
-
-                stable_map = {}
-                for key, value in data[self._stable_map_str].items():
-                    stable_map[key] = LicenseObject(**value)
-                risky_map = {}
-                for key, value in data[self._risky_map_str].items():
-                    risky_map[key] = LicenseObject(**value)
+            backend = os.environ.get(BACKEND_ENV_VAR, "auto")
+            if backend not in BACKENDS:
+                raise ValueError(f"Unknown {BACKEND_ENV_VAR} '{backend}', expected one of {BACKENDS}")
 
-                orgs = self._add_orgs(data)
-
-                self._merged_data = _LicenseMap(stable_map, risky_map, orgs)
+            if self._data_path is not None:
+                self._file_path, self._file_compressed = Path(self._data_path), self._data_path.endswith(COMPRESSED_SUFFIX)
+                self._merged_data = self._load_data_path()
+            else:
+                self._merged_data = self._load_packaged(backend)
         except Exception as e:
             raise e.with_traceback(sys.exc_info()[2])
 
+    def _load_packaged(self, backend: str) -> _LicenseMap:
+        """
+        Loads the license data packaged in licenselynx.resources with the selected backend. The resources are
+        only resolved here, data loaded from a data path does not need them.
+        """
+        resource_dir = resources.files("licenselynx.resources")
+        self._file_path, self._file_compressed = self._json_path(resource_dir)
+        index_path = resource_dir.joinpath("merged_data.idx")
+        if backend == "index" or (backend == "auto" and index_path.is_file()):
+            return self._load_index(index_path)
+        if backend == "generated" or (backend == "auto" and importlib.util.find_spec(GENERATED_PACKAGE) is not None):
+            return self._load_generated()
+        return self._load_json()
+
+    def _load_json(self, read_text: Optional[Callable[[], str]] = None) -> _LicenseMap:
+        """
+        Parses merged_data.json up to the stable map, which is converted into LicenseObjects up front. The risky
+        and organization maps following it are only skipped to check that they exist, they are decoded and converted
+        on first access like the folded-key maps at the end of the file. Format version 2 lists the names of all maps
+        before them, so nothing is skipped. If the snapshot cache is enabled, the maps of the packaged file are loaded
+        from its snapshot instead.
+        Data-path files are never cached, every reload of a changed file would add a snapshot.
+        :param read_text: returns the JSON text, reads the file if None
+        """
+        cache_dir = self._snapshot_cache_dir() if self._data_path is None else None
+        if cache_dir is not None:
+            return self._load_snapshot(cache_dir)
+
+        read_text = read_text or self._read_json_text
+        text = read_text()
+        sections = _JsonSections(text, read_text, [self._stable_map_str])
+        map_names = sections.pop("maps") if "maps" in sections.names else None
+        if map_names is None:
+            # A data-path file is loaded completely anyway, so it is skipped through to check all of its names
+            skip_names = None if self._data_path is not None else [self._risky_map_str, *(o.value for o in Organization)]
+            sections.skip_to(text, skip_names)
+            # Without the list, the names of all maps are only known if the file ended before one of the maps skipped to
+            if sections.is_complete:
+                map_names = [name for name in sections.names if name not in ("version", "licenses")]
+        del text
+        if map_names is not None:
+            for name in (self._stable_map_str, self._risky_map_str):
+                if name not in map_names:
+                    raise KeyError(name)
+            self._check_orgs(map_names)
+
+        convert = self._json_map_converter(sections)
+
+        def lazy_map(name: str) -> _LazyMap:
+            return _LazyMap(lambda: convert(sections.pop(name) or {}))
+
+        stable_map = convert(sections.pop(self._stable_map_str) or {})
+        orgs = {org: lazy_map(org) for org in Organization}
+        return _LicenseMap(stable_map, lazy_map(self._risky_map_str), orgs, self._add_folded(map_names, lazy_map))
+
+    def _load_generated(self) -> _LicenseMap:
+        """
+        Imports the generated modules. Every map is a module of constant tuples that is imported on first access,
+        only the stable map is imported up front.
+        """
+        map_modules: dict[str, str] = importlib.import_module(GENERATED_PACKAGE).MAPS
+
+        def table(name: str) -> tuple[Sequence[str], Sequence[int]]:
+            module = importlib.import_module(f"{GENERATED_PACKAGE}.{map_modules[name]}")
+            return module.KEYS, module.LICENSES
+
+        return self._use_tables(map_modules, importlib.import_module(f"{GENERATED_PACKAGE}.licenses").LICENSES, table)
+
+    def _json_map_converter(self, sections: _JsonSections) -> Callable[[dict], dict[str, LicenseObject]]:
+        """
+        Returns the conversion of a map of merged_data.json into a map of LicenseObjects. Format version 1 stores
+        the canonical object of every alias. Version 2 (merge_data.py --format-version 2) stores the position of
+        the canonical object in the licenses array, which precedes the maps together with the version.
+        """
+        version = sections.pop("version") if "version" in sections.names else 1
+        if version == 1:
+            interned: dict[tuple, LicenseObject] = {}
+            return lambda license_map: self._intern_map(license_map, interned)
+        if version != 2:
+            raise ValueError(f"merged_data.json format version {version} is not supported, expected 1 or 2")
+
+        license_objects = [LicenseObject(**record) for record in sections.pop("licenses") or []]
+        return lambda license_map: dict(zip(license_map, map(license_objects.__getitem__, license_map.values())))
+
+    def _load_snapshot(self, cache_dir: Path) -> _LicenseMap:
+        """
+        Loads the maps from the snapshot of merged_data.json in the cache directory. If there is none yet,
+        the JSON file is parsed completely and its snapshot is written for the next process.
+        """
+        data = self._file_path.read_bytes()
+        path = snapshot_path(cache_dir, data)
+        snapshot = read_snapshot(path)
+        if snapshot is None:
+            # Parses the bytes that were hashed, a second read could see a file replaced in between.
+            # The compressed bytes are decompressed once and dropped before the JSON is parsed.
+            if self._file_compressed:
+                data = gzip.decompress(data)
+            snapshot = build_snapshot(json.loads(data))
+            write_snapshot(path, snapshot)
+        del data
+
+        licenses, tables = snapshot
+        return self._use_tables(tables, licenses, tables.__getitem__)
+
+    def _use_tables(self, map_names: Collection[str], licenses: Iterable[tuple[str, str]],
+                    table: Callable[[str], tuple[Sequence[str], Sequence[int]]]) -> _LicenseMap:
+        """
+        Creates the maps from tables of keys and license indices, the stable map up front and the others on first access.
+        :param map_names: names of all maps
+        :param licenses: (id, src) of every license, referenced by its position
+        :param table: returns the keys and the license index per key of a map
+        """
+        for name in (self._stable_map_str, self._risky_map_str):
+            if name not in map_names:
+                raise KeyError(name)
+        self._check_orgs(map_names)
+
+        license_objects = [LicenseObject(id=license_id, src=src) for license_id, src in licenses]
+
+        def license_map(name: str) -> dict[str, LicenseObject]:
+            keys, license_indices = table(name)
+            return dict(zip(keys, map(license_objects.__getitem__, license_indices)))
+
+        def lazy_map(name: str) -> _LazyMap:
+            return _LazyMap(lambda: license_map(name) if name in map_names else {})
+
+        orgs = {org: lazy_map(org) for org in Organization}
+        folded = None
+        if self._stable_map_str + FOLDED_MAP_SUFFIX in map_names:
+            folded = _LicenseMap(lazy_map(self._stable_map_str + FOLDED_MAP_SUFFIX),
+                                 lazy_map(self._risky_map_str + FOLDED_MAP_SUFFIX),
+                                 {org: lazy_map(org + FOLDED_MAP_SUFFIX) for org in Organization})
+        return _LicenseMap(license_map(self._stable_map_str), lazy_map(self._risky_map_str), orgs, folded)
+
+    @staticmethod
+    def _snapshot_cache_dir() -> Optional[Path]:
+        setting = os.environ.get(SNAPSHOT_CACHE_ENV_VAR, "")
+        if setting in ("", "0"):
+            return None
+        return default_cache_dir() if setting == "1" else Path(setting)
+
     @staticmethod
-    def _add_orgs(data) -> dict[Organization, dict[str, LicenseObject]]:
-        orgs: dict[Organization, dict[str, LicenseObject]] = {}
+    def _json_path(resource_dir) -> tuple:
+        """
+        Selects merged_data.json, or the gzip-compressed merged_data.json.gz if only that one is packaged.
+        :return: path and whether it is compressed
+        """
+        json_path = resource_dir.joinpath("merged_data.json")
+        compressed_path = resource_dir.joinpath("merged_data.json" + COMPRESSED_SUFFIX)
+        if not json_path.is_file() and compressed_path.is_file():
+            return compressed_path, True
+        return json_path, False
+
+    def _load_data_path(self) -> _LicenseMap:
+        """
+        Loads the data file at the data path completely from one read: the file may change at any time, so the maps
+        cannot be parsed from it on first access.
+        """
+        text = self._read_json_text()
+        merged_data = self._load_json(lambda: text)
+        self._load_lazy_maps(merged_data)
+        return merged_data
+
+    def reload(self) -> None:
+        """
+        Loads the data file at the data path again and swaps the new maps in once they are completely loaded.
+        Lookups in progress finish with the maps they started with, later lookups use the new maps.
+        If loading fails, the current maps are kept.
+        """
+        if self._data_path is None:
+            raise ValueError(f"Only license data loaded from a data path ({DATA_PATH_ENV_VAR}) can be reloaded")
+        with self._reload_lock:
+            self._merged_data = self._load_data_path()
+            self._reloads += 1
+            self._last_reload = time.time()
+
+    def reload_info(self) -> ReloadInfo:
+        with self._reload_lock:
+            return ReloadInfo(self._data_path, self._reloads, self._last_reload)
+
+    @property
+    def data_path(self) -> Optional[str]:
+        return self._data_path
+
+    def _read_json_text(self) -> str:
+        """
+        Reads merged_data.json. A compressed file is decompressed while it is read, without reading it into memory first.
+        """
+        if self._file_compressed:
+            with self._file_path.open("rb") as compressed_file, \
+                    gzip.open(compressed_file, "rt", encoding="utf-8") as file:
+                return file.read()
+        with self._file_path.open() as file:
+            return file.read()
+
+    def _load_index(self, resource_path) -> _LicenseMap:
+        with resources.as_file(resource_path) as index_path:
+            index = _LicenseIndex.open(index_path)
+
+        return self._use_index(index)
+
+    def _use_index(self, index: _LicenseIndex) -> _LicenseMap:
+        self._index = index
+        self._check_orgs(index.map_names)
+        orgs = {org: index.license_map(org) for org in Organization}
+
+        folded = None
+        map_names = set(index.map_names)
+        if self._stable_map_str + FOLDED_MAP_SUFFIX in map_names:
+            folded_orgs = {org: index.license_map(org + FOLDED_MAP_SUFFIX) if org + FOLDED_MAP_SUFFIX in map_names else {}
+                           for org in Organization}
+            folded = _LicenseMap(index.license_map(self._stable_map_str + FOLDED_MAP_SUFFIX),
+                                 index.license_map(self._risky_map_str + FOLDED_MAP_SUFFIX), folded_orgs)
+
+        return _LicenseMap(index.license_map(self._stable_map_str), index.license_map(self._risky_map_str), orgs, folded)
+
+    @classmethod
+    def from_index(cls, index: _LicenseIndex, owner: object = None) -> "_LicenseMapSingleton":
+        """
+        Creates an instance backed by an already opened binary index instead of the packaged resources.
+        The instance is not installed as the singleton, see _Singleton.install.
+        :param index: binary index containing all maps
+        :param owner: object that owns the index buffer and must stay alive as long as the instance
+        :return: new instance
+        """
+        instance = cls.__new__(cls)
+        instance._stable_map_str = "stableMap"
+        instance._risky_map_str = "riskyMap"
+        instance._alias_index = None
+        instance._data_alias_index = None
+        instance._data_path = None
+        instance._reload_lock = Lock()
+        instance._reloads = 0
+        instance._last_reload = None
+        instance._merged_data = instance._use_index(index)
+        instance._owner = owner
+        return instance
+
+    @classmethod
+    def from_data_path(cls, data_path: str) -> "_LicenseMapSingleton":
+        """
+        Creates an instance loaded from a merged_data.json outside the package.
+        The instance is not installed as the singleton, see _Singleton.install.
+        :param data_path: path of a merged_data.json (format version 1 or 2, gzip-compressed if it ends with .gz)
+        :return: new instance
+        """
+        # type.__call__ constructs a new instance, bypassing _Singleton.__call__
+        return type.__call__(cls, data_path)
+
+    def to_index(self) -> bytes:
+        """
+        Serializes the loaded maps into the binary index layout. Maps backed by a binary index are returned as they
+        are, in the layout they were written with.
+        :return: binary index
+        """
+        if self._index is not None:
+            return bytes(self._index.buffer)
+        maps = self._maps(self._merged_data)
+        if self._merged_data.folded is not None:
+            maps.update({name + FOLDED_MAP_SUFFIX: license_map
+                         for name, license_map in self._maps(self._merged_data.folded).items()})
+        return _build_index(maps)
+
+    def _maps(self, merged_data: _LicenseMap) -> dict[str, Mapping[str, LicenseObject]]:
+        maps = {self._stable_map_str: merged_data.stable_map, self._risky_map_str: merged_data.risky_map}
+        maps.update({org.value: license_map for org, license_map in merged_data.organizations.items()})
+        return maps
+
+    @staticmethod
+    def _check_orgs(available_keys) -> None:
         for org in Organization:
-            if org not in data:
+            if org not in available_keys:
                 raise ValueError(
                     f"Organization '{org}' is defined in the Organization enum "
                     f"but missing from merged_data.json. "
-                    f"Available keys: {list(data.keys())}"
+                    f"Available keys: {list(available_keys)}"
                 )
-            org_map: dict[str, LicenseObject] = {}
-            for key, value in data[org].items():
-                org_map[key] = LicenseObject(**value)
-            orgs[org] = org_map
-        return orgs
+
+    @staticmethod
+    def _intern(value: dict, interned: dict[tuple, LicenseObject]) -> LicenseObject:
+        """
+        Returns the shared LicenseObject for a canonical object, creating it on first use.
+        :param value: canonical object with id and src
+        :param interned: LicenseObjects created so far, keyed by (id, src)
+        :return: LicenseObject shared by all aliases of the canonical object
+        """
+        key = (value.get("id"), value.get("src"))
+        license_object = interned.get(key)
+        if license_object is None:
+            license_object = LicenseObject(**value)
+            interned[key] = license_object
+        return license_object
+
+    @staticmethod
+    def _intern_map(license_map: dict, interned: dict[tuple, LicenseObject]) -> dict[str, LicenseObject]:
+        return {key: _LicenseMapSingleton._intern(value, interned) for key, value in license_map.items()}
+
+    def _add_folded(self, map_names: Optional[Collection[str]],
+                    lazy_map: Callable[[str], _LazyMap]) -> Optional[_LicenseMap]:
+        """
+        Adds the folded-key maps written by merge_data.py --folded, which follow all other maps in merged_data.json.
+        :param map_names: names of all maps, None if they are not known
+        :return: _LicenseMap of the folded maps loaded on first access, None if the data does not contain them
+        """
+        if map_names is not None and self._stable_map_str + FOLDED_MAP_SUFFIX not in map_names:
+            return None
+
+        orgs = {org: lazy_map(org + FOLDED_MAP_SUFFIX) for org in Organization}
+        return _LicenseMap(lazy_map(self._stable_map_str + FOLDED_MAP_SUFFIX),
+                           lazy_map(self._risky_map_str + FOLDED_MAP_SUFFIX), orgs)
+
+    def materialize(self) -> None:
+        """
+        Creates all LicenseObjects, loads all maps and builds all lookup views that are otherwise created lazily
+        on first access, so a parent process creates them once instead of every forked child.
+        """
+        if self._index is not None:
+            self._index.load_licenses()
+        self._load_lazy_maps(self._merged_data)
+        self._merged_data.load_views()
+
+    @staticmethod
+    def _load_lazy_maps(merged_data: Optional[_LicenseMap]) -> None:
+        while merged_data is not None:
+            for license_map in (merged_data.risky_map, *merged_data.organizations.values(), merged_data.stable_map):
+                if isinstance(license_map, _LazyMap):
+                    license_map.loaded()
+            merged_data = merged_data.folded
+
+    def alias_index(self) -> dict[str, dict[str, list[str]]]:
+        """
+        Returns the reverse index written by merge_data.py --aliases, loaded on first use.
+        Concurrent first calls may each load the file, the last one loaded is kept.
+        For data loaded from a data path, the reverse index is built from the loaded maps instead, see _build_alias_index.
+        :return: canonical license identifier to alias source to names
+        """
+        if self._data_path is not None:
+            return self._build_alias_index()
+
+        alias_index = self._alias_index
+        if alias_index is None:
+            with resources.files("licenselynx.resources").joinpath("merged_aliases.json").open() as file:
+                alias_index = json.load(file)
+            self._alias_index = alias_index
+        return alias_index
+
+    def _build_alias_index(self) -> dict[str, dict[str, list[str]]]:
+        """
+        Builds the reverse index of the loaded maps on first use and again after a reload. merged_data.json does not
+        record where an alias comes from, so the names of the stable map are listed under the source of their license,
+        risky names under risky and organization names under the organization.
+        :return: canonical license identifier to source to names
+        """
+        merged_data = self._merged_data
+        cached = self._data_alias_index
+        if cached is not None and cached[0] is merged_data:
+            return cached[1]
+
+        alias_index: dict[str, dict[str, list[str]]] = {}
+
+        def add(license_map: Mapping[str, LicenseObject], source: Optional[str]) -> None:
+            for name, license_object in license_map.items():
+                alias_index.setdefault(license_object.id, {}).setdefault(source or license_object.src, []).append(name)
+
+        add(merged_data.stable_map, None)
+        add(merged_data.risky_map, "risky")
+        for org, org_map in merged_data.organizations.items():
+            add(org_map, org.value)
+        self._data_alias_index = (merged_data, alias_index)
+        return alias_index
+
+    @staticmethod
+    def load_key_filter() -> Optional[_BloomFilter]:
+        """
+        Loads the Bloom filter over the keys of all maps written by merge_data.py --bloom, without loading the maps.
+        :return: _BloomFilter, None if it is not packaged or the data is loaded from a data path
+        """
+        if os.environ.get(DATA_PATH_ENV_VAR):
+            return None
+        key_filter_path = resources.files("licenselynx.resources").joinpath("merged_data.bloom")
+        if not key_filter_path.is_file():
+            return None
+        return _BloomFilter(key_filter_path.read_bytes())
 
     @property
     def merged_data(self) -> _LicenseMap:
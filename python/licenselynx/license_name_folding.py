@@ -0,0 +1,43 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import re
+
+from licenselynx.quotes_handler import normalize_quotes
+
+# Suffix of the folded-key maps written by scripts/src/load/merge_data.py --folded, e.g. "stableMap.folded"
+FOLDED_MAP_SUFFIX = ".folded"
+
+_LEADING_COMMENT = re.compile(r"^#+\s*")
+_TRAILING_COMMENT = re.compile(r"\s#.*$")
+_SURROUNDING_QUOTES = ("'", '"', "`")
+
+
+def fold_license_name(license_name: str) -> str:
+    """
+    Folds mechanical variants of a license name onto one key, used for the fallback lookup when the exact name is
+    not mapped. The same function builds the folded maps at merge time, so both sides always agree. Steps in order:
+
+    1. normalize quote characters (see normalize_quotes)
+    2. collapse runs of whitespace into a single space
+    3. strip a leading comment marker ("# MIT") and a trailing comment ("'MIT' # Example license")
+    4. repeatedly strip surrounding whitespace, trailing commas and semicolons, and one pair of matching
+       surrounding quotes ('MIT', "MIT", `MIT`) until nothing changes
+    5. case-fold
+
+    For example "'MIT',", "# MIT" and "  mit " all fold to "mit". Word-level differences such as
+    "The MIT License" versus "MIT License" are not folded.
+    :param license_name: license name
+    :return: folded key
+    """
+    folded = " ".join(normalize_quotes(license_name).split())
+    folded = _TRAILING_COMMENT.sub("", _LEADING_COMMENT.sub("", folded))
+
+    previous = None
+    while folded != previous:
+        previous = folded
+        folded = folded.strip().rstrip(",;")
+        if len(folded) >= 2 and folded[0] == folded[-1] and folded[0] in _SURROUNDING_QUOTES:
+            folded = folded[1:-1]
+    return folded.casefold()
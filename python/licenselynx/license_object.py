@@ -8,9 +8,12 @@ from licenselynx.license_source import LicenseSource
 from licenselynx.organization import Organization
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LicenseObject(object):
-    """LicenseObject class represents a license with a canonical name and source."""
+    """
+    LicenseObject class represents a license with a canonical name and source.
+    Instances are immutable and hashable, and all aliases of a license share the same instance.
+    """
 
     id: str
     src: str
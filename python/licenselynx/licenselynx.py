@@ -2,12 +2,40 @@
 # SPDX-FileCopyrightText: Copyright 2025 Siemens AG
 # SPDX-License-Identifier: BSD-3-Clause
 #
+import gc
 import sys
-from typing import Optional
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from threading import Thread
+from typing import TYPE_CHECKING, Literal, Optional, Union, overload
+from weakref import WeakKeyDictionary
+from licenselynx.bloom_filter import _BloomFilter
+from licenselynx.data_watcher import DataWatcher, ReloadInfo
+from licenselynx.license_expression import LicenseExpression, _parse_expression
+from licenselynx.license_map import _LicenseMap
+from licenselynx.license_name_folding import fold_license_name
 from licenselynx.license_object import LicenseObject
 from licenselynx.license_map_singleton import _LicenseMapSingleton
 from licenselynx.organization import Organization
-from licenselynx.quotes_handler import _QuotesHandler
+from licenselynx.lookup_cache import CacheInfo, _LookupCache
+from licenselynx.preload_handle import PreloadHandle
+from licenselynx.quotes_handler import normalize_quotes
+from licenselynx.suggestion_index import Suggestion
+
+if TYPE_CHECKING:
+    import asyncio
+
+# Pending executor loads per event loop, shared by all coroutines awaiting the first load.
+# asyncio is only imported by the coroutines, it would add to the import time of every process.
+_async_loads: WeakKeyDictionary["asyncio.AbstractEventLoop", "asyncio.Future"] = WeakKeyDictionary()
+
+# Optional result cache in front of LicenseLynx.map, see LicenseLynx.enable_cache
+_lookup_cache: Optional[_LookupCache] = None
+
+# Packaged Bloom filter over all keys, loaded on first use, see LicenseLynx._key_filter
+_key_filter: Optional[_BloomFilter] = None
+_key_filter_loaded = False
 
 
 class LicenseLynx:
@@ -15,7 +43,10 @@ class LicenseLynx:
     @staticmethod
     def map(license_name: str, risky: bool = False, org: Optional[Organization] = None) -> Optional[LicenseObject]:
         """
-        Maps license name to the canonical license identifier
+        Maps license name to the canonical license identifier.
+        If the exact name is not mapped and the data contains folded-key maps, the name folded with
+        fold_license_name (case, whitespace, surrounding quotes, trailing commas and comments) is looked up once more.
+        While the data is not loaded yet, names that the packaged Bloom filter rules out return None without loading it.
         :param license_name: string of a license name
         :param risky: enable risky mappings
         :param org: organization enum
@@ -23,20 +54,462 @@ class LicenseLynx:
         or throws an exception if a runtime error occurs
         """
         try:
-            license_name = _QuotesHandler().normalize_quotes(license_name)
-            instance = _LicenseMapSingleton()
+            key_filter = LicenseLynx._key_filter()
+            if key_filter is not None and LicenseLynx._is_definite_miss(key_filter, normalize_quotes(license_name)):
+                return None
 
-            license_object: Optional[LicenseObject] = instance.merged_data.stable_map.get(license_name)
+            merged_data = _LicenseMapSingleton().merged_data
+            cache = _lookup_cache
+            if cache is None:
+                return LicenseLynx._lookup(merged_data, normalize_quotes(license_name), risky, org)
+
+            return cache.get((license_name, risky, org), merged_data, lambda: LicenseLynx._lookup(
+                merged_data, normalize_quotes(license_name), risky, org))
+        except Exception as e:
+            raise e.with_traceback(sys.exc_info()[2])
+
+    @staticmethod
+    def enable_cache(maxsize: int = 4096) -> None:
+        """
+        Enables an LRU cache in front of map, keyed by the license name as passed in and the lookup options.
+        Lookups without a result are cached as well. The cache is cleared automatically when the data is replaced.
+        Enabling the cache again replaces it with an empty one.
+        :param maxsize: maximum number of cached lookups
+        """
+        global _lookup_cache
+        _lookup_cache = _LookupCache(maxsize)
 
-            if not license_object and risky:
-                license_object = instance.merged_data.risky_map.get(license_name)
+    @staticmethod
+    def disable_cache() -> None:
+        """
+        Disables and drops the cache enabled by enable_cache.
+        """
+        global _lookup_cache
+        _lookup_cache = None
 
-            if not license_object and org:
-                license_object = instance.merged_data.organizations[org].get(license_name)
+    @staticmethod
+    def cache_info() -> Optional[CacheInfo]:
+        """
+        Returns hit, miss and eviction counters and the size of the lookup cache.
+        :return: CacheInfo, None if the cache is not enabled
+        """
+        cache = _lookup_cache
+        return cache.info() if cache is not None else None
 
-            if not license_object:
-                return None
+    @overload
+    @staticmethod
+    def map_many(license_names: Iterable[str], risky: bool = False, org: Optional[Organization] = None,
+                 as_dict: Literal[False] = False) -> list[Optional[LicenseObject]]:
+        ...
+
+    @overload
+    @staticmethod
+    def map_many(license_names: Iterable[str], risky: bool = False, org: Optional[Organization] = None, *,
+                 as_dict: Literal[True]) -> dict[str, Optional[LicenseObject]]:
+        ...
+
+    @staticmethod
+    def map_many(license_names: Iterable[str], risky: bool = False, org: Optional[Organization] = None,
+                 as_dict: bool = False) -> Union[list[Optional[LicenseObject]], dict[str, Optional[LicenseObject]]]:
+        """
+        Maps many license names to their canonical license identifiers in one pass.
+        Every distinct license name is normalized and looked up only once. While the data is not loaded yet,
+        it is only loaded once a name passes the packaged Bloom filter, see map.
+        :param license_names: iterable of license names, may contain duplicates
+        :param risky: enable risky mappings
+        :param org: organization enum
+        :param as_dict: return a dict of distinct license name to result instead of a list
+        :return: list of results aligned with the input (None for names without mapping),
+        or a dict keyed by the distinct input names if as_dict is set
+        """
+        try:
+            license_names = list(license_names)
+            key_filter = LicenseLynx._key_filter()
+            merged_data: Optional[_LicenseMap] = None
+
+            results: dict[str, Optional[LicenseObject]] = {}
+            for license_name in license_names:
+                if license_name in results:
+                    continue
+                normalized_name = normalize_quotes(license_name)
+                if key_filter is not None and LicenseLynx._is_definite_miss(key_filter, normalized_name):
+                    results[license_name] = None
+                    continue
+                if merged_data is None:
+                    merged_data = _LicenseMapSingleton().merged_data
+                    # Once the data is loaded, a lookup is cheaper than the filter
+                    key_filter = None
+                results[license_name] = LicenseLynx._lookup(merged_data, normalized_name, risky, org)
+
+            if as_dict:
+                return results
+            return [results[license_name] for license_name in license_names]
+        except Exception as e:
+            raise e.with_traceback(sys.exc_info()[2])
+
+    @staticmethod
+    def map_many_parallel(license_names: Iterable[str], risky: bool = False, org: Optional[Organization] = None,
+                          max_workers: Optional[int] = None, chunk_size: int = 10_000) -> list[Optional[LicenseObject]]:
+        """
+        Maps a large batch of license names on a process pool. The license maps are published once to shared memory
+        (see SharedLicenseData) and reused by later calls until the data is replaced, the workers attach to it instead
+        of loading the data, and the distinct license names are split into chunks across the workers.
+        The names and results are sent between the processes, so this only pays off over map_many for batches of
+        many distinct names on several CPUs, see benchmarks/benchmark_map_many_parallel.py.
+        :param license_names: iterable of license names, may contain duplicates
+        :param risky: enable risky mappings
+        :param org: organization enum
+        :param max_workers: number of worker processes, defaults to the number of CPUs
+        :param chunk_size: number of distinct license names mapped per task
+        :return: list of results aligned with the input, None for names without mapping
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        try:
+            # Imported on first use, process pools and shared memory would add to the import time of every process
+            from licenselynx.shared_license_data import _map_many_parallel
+            return _map_many_parallel(list(license_names), risky, org, max_workers, chunk_size)
+        except Exception as e:
+            raise e.with_traceback(sys.exc_info()[2])
+
+    @staticmethod
+    def map_stream(license_names: Iterable[str], risky: bool = False, org: Optional[Organization] = None,
+                   chunk_size: int = 1024, cache_size: int = 4096) -> Iterator[tuple[str, Optional[LicenseObject]]]:
+        """
+        Lazily maps a possibly unbounded iterable of license names, e.g. read line by line from a large export.
+        The input is consumed in chunks and the results of recently seen license names are kept in a bounded cache,
+        so memory usage does not depend on the input size.
+        :param license_names: iterable of license names
+        :param risky: enable risky mappings
+        :param org: organization enum
+        :param chunk_size: number of license names consumed from the input at once
+        :param cache_size: maximum number of distinct license names whose results are cached
+        :return: generator of (license name, LicenseObject or None) pairs in input order
+        """
+        if chunk_size < 1 or cache_size < 1:
+            raise ValueError("chunk_size and cache_size must be positive")
+
+        return LicenseLynx._map_stream(license_names, risky, org, chunk_size, cache_size)
+
+    @staticmethod
+    def _map_stream(license_names: Iterable[str], risky: bool, org: Optional[Organization], chunk_size: int,
+                    cache_size: int) -> Iterator[tuple[str, Optional[LicenseObject]]]:
+        try:
+            merged_data = _LicenseMapSingleton().merged_data
+            cache: OrderedDict[str, Optional[LicenseObject]] = OrderedDict()
+            license_names_iterator = iter(license_names)
+
+            while chunk := list(islice(license_names_iterator, chunk_size)):
+                for license_name in chunk:
+                    if license_name in cache:
+                        cache.move_to_end(license_name)
+                        license_object = cache[license_name]
+                    else:
+                        license_object = LicenseLynx._lookup(
+                            merged_data, normalize_quotes(license_name), risky, org)
+                        cache[license_name] = license_object
+                        if len(cache) > cache_size:
+                            cache.popitem(last=False)
+                    yield license_name, license_object
+        except Exception as e:
+            raise e.with_traceback(sys.exc_info()[2])
+
+    @staticmethod
+    def map_expression(expression: str, risky: bool = False, org: Optional[Organization] = None) -> LicenseExpression:
+        """
+        Maps a license expression such as "MIT OR Apache-2.0" or "GPL-2.0 WITH Classpath-exception-2.0" to a tree of
+        LicenseOperation (AND/OR), LicenseWithException and LicenseSymbol nodes. Every operand is mapped like map,
+        distinct operands only once; str() of the tree gives the expression with canonical license identifiers.
+        The whole string is looked up first, and a string that is not a valid expression is returned as one LicenseSymbol.
+        Operators are matched case-sensitively (AND, OR, WITH) as in the SPDX specification.
+        :param expression: license expression
+        :param risky: enable risky mappings
+        :param org: organization enum
+        :return: expression tree, LicenseSymbol.license is None for operands without mapping
+        """
+        return LicenseLynx.map_expressions([expression], risky, org)[0]
+
+    @staticmethod
+    def map_expressions(expressions: Iterable[str], risky: bool = False,
+                        org: Optional[Organization] = None) -> list[LicenseExpression]:
+        """
+        Maps many license expressions, e.g. all components of an SBOM, see map_expression.
+        Every distinct expression is parsed once and every distinct operand is looked up once for the whole batch,
+        so repeated expressions and operands cost a dictionary lookup.
+        :param expressions: iterable of license expressions, may contain duplicates
+        :param risky: enable risky mappings
+        :param org: organization enum
+        :return: list of expression trees aligned with the input, equal expressions share the same tree
+        """
+        try:
+            merged_data = _LicenseMapSingleton().merged_data
+            operands: dict[str, Optional[LicenseObject]] = {}
+
+            def resolve(operand: str) -> Optional[LicenseObject]:
+                if operand not in operands:
+                    operands[operand] = LicenseLynx._lookup(merged_data, normalize_quotes(operand), risky, org)
+                return operands[operand]
+
+            trees: dict[str, LicenseExpression] = {}
+            results = []
+            for expression in expressions:
+                tree = trees.get(expression)
+                if tree is None:
+                    tree = _parse_expression(expression, resolve)
+                    trees[expression] = tree
+                results.append(tree)
+            return results
+        except Exception as e:
+            raise e.with_traceback(sys.exc_info()[2])
+
+    @staticmethod
+    def aliases_of(canonical_id: str) -> dict[str, list[str]]:
+        """
+        Returns all names that map to a canonical license identifier, grouped by their source: the alias sources
+        of the data (e.g. spdx, osi, scancodeLicensedb, custom), risky for risky mappings, and the organization name
+        for organization licenses. The canonical identifier itself is listed under the source of the license.
+        The reverse index is loaded on the first call, afterwards a call costs only the size of the result.
+        For license data loaded from a data path (see use_data_path), the reverse index is built from its maps and
+        rebuilt after a reload. Their file does not record alias sources, so stable names are listed under the source
+        of their license instead.
+        :param canonical_id: canonical license identifier, e.g. "Apache-2.0"
+        :return: dict of source to names, empty if the identifier is unknown
+        """
+        try:
+            groups = _LicenseMapSingleton().alias_index().get(canonical_id, {})
+            return {source: list(names) for source, names in groups.items()}
+        except Exception as e:
+            raise e.with_traceback(sys.exc_info()[2])
+
+    @staticmethod
+    def suggest(license_name: str, k: int = 5, min_score: float = 0.6, risky: bool = False,
+                org: Optional[Organization] = None) -> list[Suggestion]:
+        """
+        Suggests the closest known license names, e.g. for names that map returns None for because of a typo.
+        Candidates sharing character trigrams with the folded license name are looked up in a trigram index and
+        re-ranked by edit distance. The work per call is bounded, so the latency does not depend on the input.
+        The index is built on the first call; map and the other lookup methods do not use it.
+        :param license_name: string of a license name
+        :param k: maximum number of suggestions
+        :param min_score: minimum similarity between 0 and 1, 1 minus the edit distance divided by the longer length
+        :param risky: include risky mappings
+        :param org: include the mappings of this organization
+        :return: list of Suggestion (name, license, score) ordered by descending score, at most one per license
+        """
+        if k < 1:
+            raise ValueError("k must be positive")
+        if not 0 <= min_score <= 1:
+            raise ValueError("min_score must be between 0 and 1")
+
+        try:
+            merged_data = _LicenseMapSingleton().merged_data
+            return merged_data.suggestion_index().suggest(license_name, merged_data.view(risky, org), k, min_score)
+        except Exception as e:
+            raise e.with_traceback(sys.exc_info()[2])
+
+    @staticmethod
+    def search_prefix(prefix: str, limit: int = 10, risky: bool = False,
+                      org: Optional[Organization] = None) -> list[tuple[str, LicenseObject]]:
+        """
+        Finds license names starting with a prefix, compared case-insensitively, e.g. for type-ahead.
+        Backed by a sorted array of all names that is built on the first call; a call is a binary search
+        plus the size of the result.
+        :param prefix: beginning of the license names
+        :param limit: maximum number of results
+        :param risky: include risky mappings
+        :param org: include the mappings of this organization
+        :return: (license name, LicenseObject) pairs in case-insensitive alphabetical order
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive")
+
+        try:
+            merged_data = _LicenseMapSingleton().merged_data
+            return merged_data.prefix_index().search(prefix, merged_data.view(risky, org), limit)
+        except Exception as e:
+            raise e.with_traceback(sys.exc_info()[2])
+
+    @staticmethod
+    def search_substring(text: str, limit: int = 10, risky: bool = False,
+                         org: Optional[Organization] = None) -> list[tuple[str, LicenseObject]]:
+        """
+        Finds license names containing a text, compared case-insensitively.
+        Backed by a suffix array of all names that is built on the first call; a call is a binary search
+        plus the size of the result.
+        :param text: text contained in the license names
+        :param limit: maximum number of results
+        :param risky: include risky mappings
+        :param org: include the mappings of this organization
+        :return: (license name, LicenseObject) pairs ordered by the text following the match,
+        so names ending with the text come first
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive")
 
-            return license_object
+        try:
+            merged_data = _LicenseMapSingleton().merged_data
+            return merged_data.substring_index().search(text, merged_data.view(risky, org), limit)
         except Exception as e:
             raise e.with_traceback(sys.exc_info()[2])
+
+    @staticmethod
+    async def amap(license_name: str, risky: bool = False, org: Optional[Organization] = None) -> Optional[LicenseObject]:
+        """
+        Coroutine version of map for asyncio services. The one-time data load runs in the default executor,
+        so it does not block the event loop, afterwards lookups run inline.
+        :param license_name: string of a license name
+        :param risky: enable risky mappings
+        :param org: organization enum
+        :return: LicenseObject with the canonical license identifier and source, None if no license is found
+        """
+        await LicenseLynx._load_async()
+        return LicenseLynx.map(license_name, risky, org)
+
+    @staticmethod
+    async def amap_many(license_names: Iterable[str], risky: bool = False, org: Optional[Organization] = None,
+                        as_dict: bool = False) -> Union[list[Optional[LicenseObject]], dict[str, Optional[LicenseObject]]]:
+        """
+        Coroutine version of map_many, see amap for how the data load is handled.
+        :param license_names: iterable of license names, may contain duplicates
+        :param risky: enable risky mappings
+        :param org: organization enum
+        :param as_dict: return a dict of distinct license name to result instead of a list
+        :return: list of results aligned with the input, or a dict keyed by the distinct input names if as_dict is set
+        """
+        await LicenseLynx._load_async()
+        if as_dict:
+            return LicenseLynx.map_many(license_names, risky, org, as_dict=True)
+        return LicenseLynx.map_many(license_names, risky, org)
+
+    @staticmethod
+    async def _load_async() -> None:
+        """
+        Loads the license maps in the default executor unless they are loaded already.
+        Concurrent callers on the same event loop await the same load.
+        """
+        if _LicenseMapSingleton.is_initialized():
+            return
+
+        import asyncio
+        loop = asyncio.get_running_loop()
+        future = _async_loads.get(loop)
+        if future is None:
+            future = loop.run_in_executor(None, _LicenseMapSingleton)
+            _async_loads[loop] = future
+        try:
+            # Cancelling one awaiter must not cancel the load shared with the others
+            await asyncio.shield(future)
+        finally:
+            if future.done():
+                _async_loads.pop(loop, None)
+
+    @staticmethod
+    def preload(background: bool = False, freeze: bool = False) -> PreloadHandle:
+        """
+        Loads the license data ahead of the first lookup, e.g. during application startup.
+        Lookups issued while a background load is running wait for it instead of loading the data again.
+
+        For pre-fork servers and multiprocessing pools, call preload(freeze=True) in the parent right before
+        forking the workers. All license objects are created in the parent and moved to the permanent
+        garbage collector generation (gc.freeze), so the children share their memory pages instead of copying them.
+        :param background: load on a daemon thread and return immediately
+        :param freeze: create all license objects and freeze them for forked child processes, requires a synchronous load
+        :return: PreloadHandle to check or wait for the load,
+        or throws an exception if a synchronous load fails
+        """
+        if background and freeze:
+            raise ValueError("freeze requires a synchronous preload, background must be False")
+
+        handle = PreloadHandle()
+        if background:
+            Thread(target=handle._load, name="licenselynx-preload", daemon=True).start()
+        else:
+            handle._load()
+            handle.wait()
+
+        if freeze:
+            _LicenseMapSingleton().materialize()
+            gc.collect()
+            gc.freeze()
+        return handle
+
+    @staticmethod
+    def use_data_path(data_path: str) -> None:
+        """
+        Loads the license data from a merged_data.json outside the package, e.g. with additional internal aliases,
+        and replaces the current license data with it. Setting the LICENSELYNX_DATA_PATH environment variable
+        before the first lookup has the same effect. The data file can be reloaded with reload_data or watch_data.
+        :param data_path: path of a merged_data.json (format version 1 or 2, gzip-compressed if it ends with .gz)
+        :return: None, or throws an exception if the data cannot be loaded, the current license data is kept then
+        """
+        _LicenseMapSingleton.install(_LicenseMapSingleton.from_data_path(data_path))
+
+    @staticmethod
+    def reload_data() -> None:
+        """
+        Loads the data file set with use_data_path or LICENSELYNX_DATA_PATH again. The new data is loaded
+        completely before it replaces the current data, so lookups never see partially loaded data.
+        :return: None, or throws an exception if the data cannot be loaded, the current license data is kept then
+        """
+        _LicenseMapSingleton().reload()
+
+    @staticmethod
+    def watch_data(interval: float = 1.0) -> DataWatcher:
+        """
+        Starts a daemon thread that polls the modification time of the data file set with use_data_path or
+        LICENSELYNX_DATA_PATH and reloads it when it changes, like reload_data. Replace the data file atomically
+        (write a temporary file and rename it), a partially written file fails to load and is retried on the next poll.
+        The watcher follows the current license data: after a later use_data_path, it watches the new data file.
+        :param interval: seconds between two polls
+        :return: DataWatcher to stop the watcher and to check the last reload error
+        """
+        if _LicenseMapSingleton().data_path is None:
+            raise ValueError("No data path is set, see LicenseLynx.use_data_path")
+        return DataWatcher(lambda: _LicenseMapSingleton().data_path, LicenseLynx.reload_data, interval)
+
+    @staticmethod
+    def reload_info() -> ReloadInfo:
+        """
+        Returns the data path and the number and time (time.time()) of the reloads of the current license data.
+        :return: ReloadInfo, with data_path None for the packaged data
+        """
+        return _LicenseMapSingleton().reload_info()
+
+    @staticmethod
+    def _key_filter() -> Optional[_BloomFilter]:
+        """
+        Returns the packaged Bloom filter while the data is not loaded. Once it is loaded, a lookup is cheaper than
+        the filter, and the loaded data may have been replaced with data the filter was not built for.
+        :return: _BloomFilter, None if the data is loaded or the filter is not packaged
+        """
+        global _key_filter, _key_filter_loaded
+        if _LicenseMapSingleton.is_initialized():
+            return None
+        if not _key_filter_loaded:
+            _key_filter = _LicenseMapSingleton.load_key_filter()
+            _key_filter_loaded = True
+        return _key_filter
+
+    @staticmethod
+    def _is_definite_miss(key_filter: _BloomFilter, license_name: str) -> bool:
+        """
+        Checks whether neither an already normalized license name nor its folded form is a key of any map.
+        """
+        return license_name not in key_filter and fold_license_name(license_name) not in key_filter
+
+    @staticmethod
+    def _lookup(merged_data: _LicenseMap, license_name: str, risky: bool,
+                org: Optional[Organization]) -> Optional[LicenseObject]:
+        """
+        Looks up an already normalized license name in the stable, risky and organization maps.
+        If the exact name misses and the data contains folded-key maps, the folded name is looked up once more.
+        """
+        license_object: Optional[LicenseObject] = merged_data.view(risky, org).get(license_name)
+        if license_object is None and merged_data.folded is not None:
+            license_object = merged_data.folded.view(risky, org).get(fold_license_name(license_name))
+
+        if not license_object:
+            return None
+
+        return license_object
@@ -0,0 +1,71 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import NamedTuple, Optional
+
+from licenselynx.license_object import LicenseObject
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the LicenseLynx lookup cache, see LicenseLynx.cache_info."""
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+_NOT_CACHED = object()
+
+
+class _LookupCache:
+    """Thread-safe LRU cache of lookup results, including lookups that found no license."""
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Optional[LicenseObject]] = OrderedDict()
+        self._lock = Lock()
+        self._source: object = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, source: object,
+            lookup: Callable[[], Optional[LicenseObject]]) -> Optional[LicenseObject]:
+        """
+        Returns the cached result for the key or looks it up and caches it.
+        :param key: cache key
+        :param source: data the results are looked up in, the cache is cleared when it changes
+        :param lookup: function computing the result on a cache miss
+        :return: LicenseObject or None
+        """
+        with self._lock:
+            if source is not self._source:
+                self._entries.clear()
+                self._source = source
+            result = self._entries.get(key, _NOT_CACHED)
+            if result is not _NOT_CACHED:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return result  # type: ignore[return-value]
+            self._misses += 1
+
+        result = lookup()
+
+        with self._lock:
+            if source is self._source:
+                self._entries[key] = result
+                if len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return result
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._entries))
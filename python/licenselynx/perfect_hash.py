@@ -0,0 +1,79 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import zlib
+from collections.abc import Sequence
+
+# Minimal perfect hash in the style of PTHash: keys are grouped into buckets of about KEYS_PER_BUCKET keys by
+# their hash, and every bucket stores a pilot that moves all of its keys to free slots of a table with exactly one
+# slot per key. A lookup is one CRC-32 of the key, one pilot read and one slot read. Used by the binary index
+# writer and reader in license_index.py.
+KEYS_PER_BUCKET = 4
+_SALT_ATTEMPTS = 16
+
+
+def perfect_hash_key(key: bytes, salt: int) -> int:
+    return zlib.crc32(key, salt)
+
+
+def perfect_hash_position(key_hash: int, pilot: int, count: int) -> int:
+    """
+    Mixes the key hash with the pilot of its bucket (murmur3 finalizer) into a slot.
+    :param key_hash: perfect_hash_key of the key
+    :param pilot: pilot of the bucket of the key
+    :param count: number of slots
+    :return: slot of the key
+    """
+    mixed = (key_hash ^ (pilot * 0x9E3779B1)) & 0xFFFFFFFF
+    mixed = ((mixed ^ (mixed >> 16)) * 0x85EBCA6B) & 0xFFFFFFFF
+    mixed = ((mixed ^ (mixed >> 13)) * 0xC2B2AE35) & 0xFFFFFFFF
+    return (mixed ^ (mixed >> 16)) % count
+
+
+def _place_bucket(member_hashes: list[int], members: list[int], slots: list[int]) -> int:
+    """
+    Searches the smallest pilot that moves all keys of one bucket to distinct free slots and occupies them.
+    :return: pilot of the bucket
+    """
+    count = len(slots)
+    pilot = 0
+    while True:
+        member_slots = [perfect_hash_position(key_hash, pilot, count) for key_hash in member_hashes]
+        if len(set(member_slots)) == len(member_slots) and all(slots[slot] < 0 for slot in member_slots):
+            break
+        pilot += 1
+    for member, slot in zip(members, member_slots):
+        slots[slot] = member
+    return pilot
+
+
+def build_perfect_hash(keys: Sequence[bytes]) -> tuple[int, list[int], list[int]]:
+    """
+    Builds a minimal perfect hash over distinct keys. Buckets are placed largest first, each with the smallest
+    pilot that moves all of its keys to distinct free slots.
+    :param keys: distinct keys
+    :return: salt of the key hash, pilot per bucket, and the position in keys of the key stored in each slot
+    """
+    count = len(keys)
+    bucket_count = -(-count // KEYS_PER_BUCKET)
+    for salt in range(_SALT_ATTEMPTS):
+        hashes = [perfect_hash_key(key, salt) for key in keys]
+        if len(set(hashes)) != count:
+            # Two keys with the same hash can never be separated, retry with another salt
+            continue
+
+        buckets: list[list[int]] = [[] for _ in range(bucket_count)]
+        for position, key_hash in enumerate(hashes):
+            buckets[key_hash % bucket_count].append(position)
+
+        slots = [-1] * count
+        pilots = [0] * bucket_count
+        for bucket in sorted(range(bucket_count), key=lambda bucket: len(buckets[bucket]), reverse=True):
+            members = buckets[bucket]
+            if not members:
+                break
+            pilots[bucket] = _place_bucket([hashes[member] for member in members], members, slots)
+        return salt, pilots, slots
+
+    raise ValueError("Could not build a perfect hash, the keys are not distinct")
@@ -0,0 +1,44 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+from threading import Event
+from typing import Optional
+
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+
+
+class PreloadHandle(object):
+    """PreloadHandle class tracks a load of the license data started by LicenseLynx.preload."""
+
+    def __init__(self) -> None:
+        self._done = Event()
+        self._error: Optional[Exception] = None
+
+    def _load(self) -> None:
+        try:
+            _LicenseMapSingleton()
+        except Exception as e:
+            self._error = e
+        finally:
+            self._done.set()
+
+    def is_ready(self) -> bool:
+        """
+        Checks without blocking whether the license data is loaded.
+        :return: True if the load completed successfully
+        """
+        return self._done.is_set() and self._error is None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until the load completes or the timeout expires.
+        :param timeout: maximum number of seconds to wait, None waits until the load completes
+        :return: True if the license data is loaded, False if the timeout expired,
+        or throws the exception the load failed with
+        """
+        if not self._done.wait(timeout):
+            return False
+        if self._error is not None:
+            raise self._error
+        return True
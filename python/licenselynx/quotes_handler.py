@@ -36,6 +36,31 @@ class _QuotesHandler:
         Returns:
             str: The normalized text with all recognized quote characters replaced.
         """
-        translation_map = {ord(char): replacement for char in self.quote_characters}
-        normalized_input_string = input_string.translate(translation_map)
-        return normalized_input_string
+        return normalize_quotes(input_string, replacement)
+
+
+def _translation_table(replacement: str) -> dict[int, str]:
+    return {ord(char): replacement for char in _QuotesHandler.quote_characters}
+
+
+# Translation table for the default replacement, built once at import time
+_QUOTES_TRANSLATION_TABLE = _translation_table("'")
+
+
+def normalize_quotes(input_string: str, replacement: str = "'") -> str:
+    """
+    Module-level quote normalization shared by the library and the data tooling in scripts/.
+    ASCII-only strings cannot contain any of the quote characters and are returned unchanged.
+
+    Args:
+        input_string (str): The input text that potentially contains various quote characters.
+        replacement (str, optional): The quote character replacement to use. Defaults to "'".
+
+    Returns:
+        str: The normalized text with all recognized quote characters replaced.
+    """
+    if input_string.isascii():
+        return input_string
+    if replacement == "'":
+        return input_string.translate(_QUOTES_TRANSLATION_TABLE)
+    return input_string.translate(_translation_table(replacement))
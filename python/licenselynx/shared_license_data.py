@@ -0,0 +1,130 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import atexit
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from threading import Lock
+from typing import Optional, cast
+
+from licenselynx.license_index import _LicenseIndex
+from licenselynx.license_map import _LicenseMap
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+from licenselynx.license_object import LicenseObject
+from licenselynx.organization import Organization
+
+# Block published by map_many_parallel together with the maps it holds. It is reused by later calls until the maps
+# are replaced, e.g. by LicenseLynx.reload_data, and unlinked when the process exits.
+_published: Optional[tuple[_LicenseMap, "SharedLicenseData"]] = None
+_published_lock = Lock()
+
+
+class SharedLicenseData(object):
+    """
+    SharedLicenseData class holds the loaded license maps in a named shared memory block,
+    so worker processes can attach to them instead of loading the data themselves.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, size: int):
+        self._memory = memory
+        self._size = size
+
+    @classmethod
+    def publish(cls) -> "SharedLicenseData":
+        """
+        Copies the license maps of this process into a new shared memory block, loading them first if necessary.
+        The publishing process owns the block and must call unlink when the workers are done.
+        :return: SharedLicenseData for the new block
+        """
+        index = _LicenseMapSingleton().to_index()
+        memory = shared_memory.SharedMemory(create=True, size=len(index))
+        cast(memoryview, memory.buf)[:len(index)] = index
+        return cls(memory, len(index))
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedLicenseData":
+        """
+        Attaches to a published block and makes LicenseLynx in this process read from it without copying.
+        :param name: name of the shared memory block, see SharedLicenseData.name
+        :return: SharedLicenseData for the block
+        """
+        # Python 3.13+ can skip the resource tracker, which would otherwise unlink the block when a worker exits
+        options = {"track": False} if sys.version_info >= (3, 13) else {}
+        memory = shared_memory.SharedMemory(name=name, **options)
+        shared_data = cls(memory, memory.size)
+        # Uses the block's own buffer instead of a slice, so closing the block never fails on exported views
+        index = _LicenseIndex(cast(memoryview, memory.buf))
+        _LicenseMapSingleton.install(_LicenseMapSingleton.from_index(index, owner=shared_data))
+        return shared_data
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def unlink(self) -> None:
+        """
+        Closes and destroys the shared memory block. Only the publishing process should call this.
+        """
+        self._memory.close()
+        self._memory.unlink()
+
+    def __enter__(self) -> "SharedLicenseData":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.unlink()
+
+
+def _attach_worker(name: str) -> None:
+    SharedLicenseData.attach(name)
+
+
+def _map_chunk(license_names: list[str], risky: bool, org: Optional[Organization]) -> list[Optional[LicenseObject]]:
+    from licenselynx.licenselynx import LicenseLynx
+    return LicenseLynx.map_many(license_names, risky, org)
+
+
+def _unlink_published() -> None:
+    global _published
+    if _published is not None:
+        _published[1].unlink()
+        _published = None
+
+
+def _published_data() -> SharedLicenseData:
+    """
+    Returns the block holding the current maps, publishing them on first use and again after they were replaced.
+    Must be called with _published_lock held, the block must not be replaced while workers attach to it.
+    """
+    global _published
+    merged_data = _LicenseMapSingleton().merged_data
+    if _published is None or _published[0] is not merged_data:
+        if _published is None:
+            atexit.register(_unlink_published)
+        else:
+            _published[1].unlink()
+        _published = (merged_data, SharedLicenseData.publish())
+    return _published[1]
+
+
+def _map_many_parallel(license_names: list[str], risky: bool, org: Optional[Organization], max_workers: Optional[int],
+                       chunk_size: int) -> list[Optional[LicenseObject]]:
+    distinct_names = list(dict.fromkeys(license_names))
+    chunks = [distinct_names[start:start + chunk_size] for start in range(0, len(distinct_names), chunk_size)]
+
+    # Concurrent calls run one after another, each one already uses all workers
+    with _published_lock:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_attach_worker,
+                                 initargs=(_published_data().name,)) as executor:
+            chunk_results = executor.map(_map_chunk, chunks, [risky] * len(chunks), [org] * len(chunks))
+            results: dict[str, Optional[LicenseObject]] = {}
+            for chunk, chunk_result in zip(chunks, chunk_results):
+                results.update(zip(chunk, chunk_result))
+
+    return [results[license_name] for license_name in license_names]
@@ -0,0 +1,130 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import contextlib
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+# A snapshot holds all maps of merged_data.json in the layout of the generated modules (see
+# scripts/src/load/python_codegen.py): a tuple of (id, src) licenses, and per map a tuple of keys and a tuple
+# of license indices. It is written with marshal, whose format depends on the Python version, so the file name
+# contains the SHA-256 of merged_data.json, the library version and the interpreter cache tag.
+# The cache is opt-in, so the modules only needed to name and write snapshots are imported on first use.
+_SNAPSHOT_MAGIC = b"LLYNXSNP"
+_SNAPSHOT_VERSION = 1
+
+Snapshot = tuple[tuple[tuple[str, str], ...], dict[str, tuple[tuple[str, ...], tuple[int, ...]]]]
+
+
+def default_cache_dir() -> Path:
+    """
+    Returns the user cache directory of LicenseLynx, e.g. ~/.cache/licenselynx.
+    :return: directory, not necessarily existing
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "licenselynx"
+
+
+def snapshot_path(cache_dir: Path, data: bytes) -> Path:
+    """
+    Returns the path of the snapshot of the given merged_data.json content.
+    :param cache_dir: snapshot cache directory
+    :param data: content of merged_data.json
+    :return: path of the snapshot, changes whenever the data, the library or the interpreter changes
+    """
+    import hashlib
+    return cache_dir / f"merged_data-{hashlib.sha256(data).hexdigest()}-{_snapshot_suffix()}"
+
+
+def _snapshot_suffix() -> str:
+    """
+    Returns the end of the snapshot file names of this library version and interpreter.
+    """
+    from importlib import metadata
+    try:
+        library_version = metadata.version("licenselynx")
+    except metadata.PackageNotFoundError:
+        library_version = "unknown"
+    return f"{library_version}-{sys.implementation.cache_tag}-{_SNAPSHOT_VERSION}.snapshot"
+
+
+def build_snapshot(merged_data: dict) -> Snapshot:
+    """
+    Converts the parsed content of merged_data.json into a snapshot.
+    :param merged_data: format version 1 (map name to alias to canonical object) or version 2
+        (map names, licenses array and map name to alias to license index)
+    :return: licenses and map name to (keys, license indices)
+    """
+    version = merged_data.get("version", 1)
+    if version == 2:
+        licenses = tuple((record["id"], record["src"]) for record in merged_data["licenses"])
+        return licenses, {name: (tuple(alias_map), tuple(alias_map.values())) for name, alias_map in merged_data.items()
+                          if name not in ("version", "maps", "licenses")}
+    if version != 1:
+        raise ValueError(f"merged_data.json format version {version} is not supported, expected 1 or 2")
+
+    license_indices: dict[tuple[str, str], int] = {}
+    maps = {}
+    for name, alias_map in merged_data.items():
+        indices = tuple(license_indices.setdefault((canonical.get("id"), canonical.get("src")), len(license_indices))
+                        for canonical in alias_map.values())
+        maps[name] = (tuple(alias_map), indices)
+    return tuple(license_indices), maps
+
+
+def read_snapshot(path: Path) -> Optional[Snapshot]:
+    """
+    Reads a snapshot written by write_snapshot.
+    :param path: snapshot path
+    :return: snapshot, None if it does not exist or cannot be read
+    """
+    try:
+        content = path.read_bytes()
+        if not content.startswith(_SNAPSHOT_MAGIC):
+            return None
+        licenses, maps = marshal.loads(memoryview(content)[len(_SNAPSHOT_MAGIC):])
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if not isinstance(licenses, tuple) or not isinstance(maps, dict):
+        return None
+    return licenses, maps
+
+
+def write_snapshot(path: Path, snapshot: Snapshot) -> None:
+    """
+    Writes a snapshot atomically: it is written to a temporary file in the cache directory and renamed to its path,
+    so readers see either no snapshot or a complete one. Concurrent writers write the same content, the last rename wins.
+    Afterwards the snapshots of older data for the same library version and interpreter are removed. Snapshots of other
+    library versions or interpreters sharing the cache directory are kept, e.g. of another virtual environment.
+    Errors are ignored, the cache is only an optimization.
+    :param path: snapshot path
+    :param snapshot: snapshot of the data
+    """
+    import tempfile
+    temporary_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=".snapshot-", delete=False) as file:
+            temporary_path = file.name
+            file.write(_SNAPSHOT_MAGIC + marshal.dumps(snapshot))
+        os.replace(temporary_path, path)
+    except (OSError, ValueError):
+        if temporary_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(temporary_path)
+        return
+
+    with contextlib.suppress(OSError):
+        for stale_path in path.parent.glob(f"merged_data-*-{_snapshot_suffix()}"):
+            if stale_path != path:
+                with contextlib.suppress(OSError):
+                    stale_path.unlink()
@@ -0,0 +1,148 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import heapq
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from typing import NamedTuple
+
+from licenselynx.license_name_folding import fold_license_name
+from licenselynx.license_object import LicenseObject
+
+# Work limits per query, so the latency does not depend on how common the trigrams of the input are:
+# at most _MAX_POSTINGS key ids are counted, rarest trigrams first, and at most _MAX_CANDIDATES keys are re-ranked.
+_MAX_POSTINGS = 2048
+_MAX_CANDIDATES = 16
+
+
+class Suggestion(NamedTuple):
+    """Near match of a license name, see LicenseLynx.suggest."""
+    name: str
+    license: LicenseObject
+    score: float
+
+
+def _trigrams(folded: str) -> set[str]:
+    padded = f" {folded} "
+    return {padded[position:position + 3] for position in range(len(padded) - 2)}
+
+
+def _edit_distance(pattern: str, text: str) -> int:
+    """
+    Levenshtein distance with the bit-parallel algorithm of Myers (Hyyrö's formulation),
+    one column of the dynamic programming matrix per character of text.
+    :param pattern: first string
+    :param text: second string
+    :return: minimum number of single-character insertions, deletions and substitutions
+    """
+    if not pattern:
+        return len(text)
+
+    peq: dict[str, int] = {}
+    for position, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << position)
+
+    mask = (1 << len(pattern)) - 1
+    last = 1 << (len(pattern) - 1)
+    pv, mv, distance = mask, 0, len(pattern)
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            distance += 1
+        elif mh & last:
+            distance -= 1
+        ph = (ph << 1) | 1
+        pv = ((mh << 1) | ~(xv | ph)) & mask
+        mv = ph & xv
+    return distance
+
+
+class _SuggestionIndex:
+    """Trigram inverted index over the folded keys of all license maps."""
+
+    def __init__(self, keys: Iterable[str]):
+        key_ids: dict[str, int] = {}
+        self._folded_keys: list[str] = []
+        self._names: list[list[str]] = []
+        postings: dict[str, list[int]] = {}
+
+        for key in keys:
+            folded = fold_license_name(key)
+            if not folded:
+                continue
+            key_id = key_ids.get(folded)
+            if key_id is None:
+                key_id = len(self._folded_keys)
+                key_ids[folded] = key_id
+                self._folded_keys.append(folded)
+                self._names.append([key])
+                for trigram in _trigrams(folded):
+                    postings.setdefault(trigram, []).append(key_id)
+            elif key not in self._names[key_id]:
+                self._names[key_id].append(key)
+
+        self._postings = {trigram: array("I", key_ids) for trigram, key_ids in postings.items()}
+        self._trigram_counts = array("H", (len(_trigrams(folded)) for folded in self._folded_keys))
+
+    def suggest(self, license_name: str, view: Mapping[str, LicenseObject], k: int,
+                min_score: float) -> list[Suggestion]:
+        """
+        Collects candidates sharing trigrams with the folded license name and re-ranks them by edit distance.
+        :param license_name: license name
+        :param view: mapping the suggested names are resolved in, keys not contained in it are skipped
+        :param k: maximum number of suggestions
+        :param min_score: minimum similarity between 0 and 1
+        :return: suggestions ordered by descending score, at most one per license
+        """
+        folded = fold_license_name(license_name)
+        if not folded:
+            return []
+
+        best: dict[LicenseObject, Suggestion] = {}
+        for key_id in self._candidates(folded):
+            candidate = self._folded_keys[key_id]
+            longest = max(len(folded), len(candidate))
+            # The distance is at least the difference in length
+            if 1 - abs(len(folded) - len(candidate)) / longest < min_score:
+                continue
+            score = 1 - _edit_distance(folded, candidate) / longest
+            if score < min_score:
+                continue
+            for name in self._names[key_id]:
+                license_object = view.get(name)
+                if license_object is None:
+                    continue
+                suggestion = best.get(license_object)
+                if suggestion is None or score > suggestion.score:
+                    best[license_object] = Suggestion(name, license_object, score)
+
+        return heapq.nlargest(k, best.values(), key=lambda suggestion: suggestion.score)
+
+    def _candidates(self, folded: str) -> list[int]:
+        """
+        Counts the trigrams each key shares with the folded license name.
+        :param folded: folded license name
+        :return: ids of at most _MAX_CANDIDATES keys, most similar first
+        """
+        query_trigrams = _trigrams(folded)
+        postings = sorted((self._postings[trigram] for trigram in query_trigrams if trigram in self._postings), key=len)
+        shared: Counter[int] = Counter()
+        budget = _MAX_POSTINGS
+        for key_ids in postings:
+            if len(key_ids) > budget and shared:
+                break
+            shared.update(key_ids)
+            budget -= len(key_ids)
+
+        # The keys sharing the most trigrams are ranked by Jaccard similarity of the trigram sets,
+        # the best of them are re-ranked by the more expensive edit distance
+        query_count = len(query_trigrams)
+        candidates = heapq.nlargest(_MAX_CANDIDATES, shared.most_common(4 * _MAX_CANDIDATES),
+                                    key=lambda item: item[1] / (query_count + self._trigram_counts[item[0]] - item[1]))
+        return [key_id for key_id, _ in candidates]
@@ -0,0 +1,43 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import struct
+
+import pytest
+
+from licenselynx.bloom_filter import _BloomFilter, build_bloom_filter
+
+
+def test_bloom_filter_contains_all_keys():
+    keys = [f"License {number}" for number in range(1000)] + ["Licence écrite", ""]
+
+    key_filter = _BloomFilter(build_bloom_filter(keys))
+
+    assert all(key in key_filter for key in keys)
+    assert None not in key_filter
+
+
+def test_bloom_filter_false_positive_rate():
+    key_filter = _BloomFilter(build_bloom_filter([f"License {number}" for number in range(1000)], 0.01))
+
+    false_positives = sum(f"Unknown {number}" in key_filter for number in range(10_000))
+
+    assert false_positives < 300
+
+
+def test_bloom_filter_empty():
+    key_filter = _BloomFilter(build_bloom_filter([]))
+
+    assert "MIT" not in key_filter
+
+
+def test_bloom_filter_invalid_buffer():
+    buffer = build_bloom_filter(["MIT"])
+
+    with pytest.raises(ValueError, match="invalid header"):
+        _BloomFilter(b"NOTABLOM" + buffer[8:])
+    with pytest.raises(ValueError, match="version 2 is not supported"):
+        _BloomFilter(buffer[:8] + struct.pack("<I", 2) + buffer[12:])
+    with pytest.raises(ValueError, match="truncated"):
+        _BloomFilter(buffer[:-1])
@@ -0,0 +1,267 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import gzip
+import json
+import os
+from threading import Event, Thread
+from unittest.mock import patch
+
+import pytest
+
+import licenselynx.license_map_singleton as license_map_singleton_module
+import licenselynx.licenselynx as licenselynx_module
+from licenselynx import DataWatcher, LicenseLynx, LicenseObject, Organization, ReloadInfo
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+
+MOCK_DATA = {
+    "stableMap": {
+        "MIT License": {"id": "MIT", "src": "spdx"},
+        "MIT": {"id": "MIT", "src": "spdx"},
+    },
+    "riskyMap": {"GPL License": {"id": "GPL", "src": "custom"}},
+    "siemens": {"Siemens License": {"id": "LicenseRef-Siemens", "src": "siemens"}},
+}
+
+CURATED_DATA = dict(MOCK_DATA, stableMap=dict(MOCK_DATA["stableMap"], **{
+    "Internal License": {"id": "LicenseRef-Internal", "src": "custom"},
+}))
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton(monkeypatch):
+    monkeypatch.setattr(_LicenseMapSingleton, "_instances", {})
+    monkeypatch.setattr(licenselynx_module, "_key_filter_loaded", False)
+    monkeypatch.setattr(licenselynx_module, "_lookup_cache", None)
+    monkeypatch.delenv(license_map_singleton_module.DATA_PATH_ENV_VAR, raising=False)
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    path = tmp_path / "merged_data.json"
+    path.write_text(json.dumps(MOCK_DATA))
+    return path
+
+
+@pytest.fixture
+def packaged_data():
+    """Installs an instance standing in for the packaged data, which has no data path."""
+    instance = object.__new__(_LicenseMapSingleton)
+    instance._data_path = None
+    _LicenseMapSingleton.install(instance)
+
+
+def replace_data(path, data: dict) -> None:
+    """Replaces the data file atomically and makes sure its modification time changes."""
+    temporary_path = path.with_suffix(".tmp")
+    temporary_path.write_text(json.dumps(data))
+    stat = path.stat()
+    os.utime(temporary_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    os.replace(temporary_path, path)
+
+
+def test_use_data_path(data_path):
+    LicenseLynx.use_data_path(str(data_path))
+
+    assert LicenseLynx.map("MIT License").id == "MIT"
+    assert LicenseLynx.map("GPL License", risky=True).id == "GPL"
+    assert LicenseLynx.map("Siemens License", org=Organization.SIEMENS).id == "LicenseRef-Siemens"
+    assert LicenseLynx.reload_info() == ReloadInfo(str(data_path), 0, None)
+    assert LicenseLynx._key_filter() is None
+
+
+def test_use_data_path_compressed(tmp_path):
+    path = tmp_path / "merged_data.json.gz"
+    path.write_bytes(gzip.compress(json.dumps(CURATED_DATA).encode("utf-8")))
+
+    LicenseLynx.use_data_path(str(path))
+
+    assert LicenseLynx.map("Internal License").id == "LicenseRef-Internal"
+
+
+def test_data_path_env_var(data_path, monkeypatch):
+    monkeypatch.setenv(license_map_singleton_module.DATA_PATH_ENV_VAR, str(data_path))
+
+    assert _LicenseMapSingleton.load_key_filter() is None
+    assert LicenseLynx.map("MIT").id == "MIT"
+    assert LicenseLynx.reload_info().data_path == str(data_path)
+
+
+def test_data_path_without_packaged_resources(data_path, monkeypatch):
+    monkeypatch.setenv(license_map_singleton_module.DATA_PATH_ENV_VAR, str(data_path))
+
+    with patch("importlib.resources.files", side_effect=ModuleNotFoundError("No module named 'licenselynx.resources'")):
+        assert LicenseLynx.map("MIT").id == "MIT"
+        assert LicenseLynx.aliases_of("MIT") == {"spdx": ["MIT License", "MIT"]}
+        LicenseLynx.reload_data()
+
+
+def test_data_path_loads_all_maps(data_path):
+    LicenseLynx.use_data_path(str(data_path))
+    data_path.write_text("not JSON any more")
+
+    assert LicenseLynx.map("GPL License", risky=True).id == "GPL"
+    assert LicenseLynx.map("Siemens License", org=Organization.SIEMENS).id == "LicenseRef-Siemens"
+
+
+def test_data_path_without_risky_map(tmp_path):
+    path = tmp_path / "merged_data.json"
+    path.write_text(json.dumps({"stableMap": MOCK_DATA["stableMap"], "siemens": MOCK_DATA["siemens"]}))
+
+    with pytest.raises(KeyError, match="riskyMap"):
+        LicenseLynx.use_data_path(str(path))
+
+
+def test_reload_data_swaps_maps(data_path):
+    LicenseLynx.use_data_path(str(data_path))
+    LicenseLynx.enable_cache()
+    old_data = _LicenseMapSingleton().merged_data
+    assert LicenseLynx.map("Internal License") is None
+
+    replace_data(data_path, CURATED_DATA)
+    LicenseLynx.reload_data()
+
+    assert LicenseLynx.map("Internal License") == LicenseObject(id="LicenseRef-Internal", src="custom")
+    assert old_data.stable_map.get("Internal License") is None
+    info = LicenseLynx.reload_info()
+    assert info.reloads == 1
+    assert info.last_reload is not None
+
+
+def test_reload_data_failure_keeps_data(data_path):
+    LicenseLynx.use_data_path(str(data_path))
+    data_path.write_text('{"stableMap": {')
+
+    with pytest.raises(ValueError):
+        LicenseLynx.reload_data()
+
+    assert LicenseLynx.map("MIT").id == "MIT"
+    assert LicenseLynx.reload_info().reloads == 0
+
+
+def test_use_data_path_failure_keeps_data(data_path, tmp_path):
+    LicenseLynx.use_data_path(str(data_path))
+
+    with pytest.raises(FileNotFoundError):
+        LicenseLynx.use_data_path(str(tmp_path / "missing.json"))
+
+    assert LicenseLynx.reload_info().data_path == str(data_path)
+
+
+def test_reload_without_data_path(packaged_data):
+    with pytest.raises(ValueError, match="can be reloaded"):
+        LicenseLynx.reload_data()
+
+
+def test_watch_data_without_data_path(packaged_data):
+    with pytest.raises(ValueError, match="No data path is set"):
+        LicenseLynx.watch_data()
+
+
+def test_watcher_reloads_changed_file(data_path):
+    LicenseLynx.use_data_path(str(data_path))
+    watcher = LicenseLynx.watch_data(interval=3600)
+    try:
+        assert watcher.check() is False
+
+        replace_data(data_path, CURATED_DATA)
+
+        assert watcher.check() is True
+        assert watcher.check() is False
+        assert LicenseLynx.map("Internal License").id == "LicenseRef-Internal"
+        assert LicenseLynx.reload_info().reloads == 1
+        assert watcher.is_running()
+    finally:
+        watcher.stop()
+    assert not watcher.is_running()
+
+
+def test_watcher_retries_failed_reload(data_path):
+    LicenseLynx.use_data_path(str(data_path))
+    watcher = LicenseLynx.watch_data(interval=3600)
+    try:
+        data_path.write_text('{"stableMap": {')
+        os.utime(data_path, ns=(0, 1_000_000))
+
+        assert watcher.check() is False
+        assert isinstance(watcher.last_error, ValueError)
+        assert LicenseLynx.map("MIT").id == "MIT"
+
+        replace_data(data_path, CURATED_DATA)
+
+        assert watcher.check() is True
+        assert watcher.last_error is None
+    finally:
+        watcher.stop()
+
+
+def test_watcher_follows_use_data_path(data_path, tmp_path):
+    LicenseLynx.use_data_path(str(data_path))
+    watcher = LicenseLynx.watch_data(interval=3600)
+    try:
+        curated_path = tmp_path / "curated.json"
+        curated_path.write_text(json.dumps(CURATED_DATA))
+        LicenseLynx.use_data_path(str(curated_path))
+
+        assert watcher.check() is False
+        replace_data(data_path, MOCK_DATA)
+        assert watcher.check() is False
+        replace_data(curated_path, MOCK_DATA)
+        assert watcher.check() is True
+        assert LicenseLynx.map("Internal License") is None
+        assert LicenseLynx.reload_info()[:2] == (str(curated_path), 1)
+    finally:
+        watcher.stop()
+
+
+def test_aliases_of_data_path(data_path):
+    LicenseLynx.use_data_path(str(data_path))
+
+    assert LicenseLynx.aliases_of("MIT") == {"spdx": ["MIT License", "MIT"]}
+    assert LicenseLynx.aliases_of("GPL") == {"risky": ["GPL License"]}
+    assert LicenseLynx.aliases_of("LicenseRef-Siemens") == {"siemens": ["Siemens License"]}
+    assert LicenseLynx.aliases_of("LicenseRef-Internal") == {}
+
+    replace_data(data_path, CURATED_DATA)
+    LicenseLynx.reload_data()
+
+    assert LicenseLynx.aliases_of("LicenseRef-Internal") == {"custom": ["Internal License"]}
+
+
+def test_watcher_polls(data_path):
+    reloaded = Event()
+    watcher = DataWatcher(lambda: str(data_path), reloaded.set, interval=0.01)
+    try:
+        replace_data(data_path, CURATED_DATA)
+
+        assert reloaded.wait(5)
+    finally:
+        watcher.stop()
+
+
+def test_watcher_invalid_interval(data_path):
+    with pytest.raises(ValueError, match="interval must be positive"):
+        DataWatcher(lambda: str(data_path), lambda: None, interval=0)
+
+
+def test_lookups_during_reloads(data_path):
+    LicenseLynx.use_data_path(str(data_path))
+    stop = Event()
+    results = set()
+
+    def lookup() -> None:
+        while not stop.is_set():
+            merged_data = _LicenseMapSingleton().merged_data
+            results.add((merged_data.stable_map.get("Internal License") is None, len(merged_data.stable_map)))
+
+    thread = Thread(target=lookup)
+    thread.start()
+    for data in (CURATED_DATA, MOCK_DATA) * 5:
+        replace_data(data_path, data)
+        LicenseLynx.reload_data()
+    stop.set()
+    thread.join()
+
+    assert results <= {(True, 2), (False, 3)}
+    assert LicenseLynx.reload_info().reloads == 10
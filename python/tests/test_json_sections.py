@@ -0,0 +1,122 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from licenselynx.json_sections import _JsonSections
+
+DATA = {"first": {"a": 1}, "second": [1, 2], "third": {"b": {"c": "}"}}, "fourth": None}
+TEXT = json.dumps(DATA, indent=1)
+
+
+def test_parses_up_to_the_requested_members():
+    read_text = MagicMock(return_value=TEXT)
+
+    sections = _JsonSections(TEXT, read_text, ["second", "first"])
+
+    assert sections.names == ["first", "second"]
+    assert sections.is_complete is False
+    assert sections.pop("first") == {"a": 1}
+    assert sections.pop("second") == [1, 2]
+    read_text.assert_not_called()
+
+
+def test_decodes_a_later_member_on_request():
+    read_text = MagicMock(return_value=TEXT)
+    sections = _JsonSections(TEXT, read_text, ["first"])
+
+    assert sections.pop("third") == {"b": {"c": "}"}}
+    assert sections.names == ["first", "second", "third"]
+    assert sections.is_complete is False
+    assert sections.pop("second") == [1, 2]
+    assert sections.pop("fourth") is None
+    assert sections.pop("unknown") is None
+    assert sections.is_complete is True
+    assert sections.names == list(DATA)
+    assert read_text.call_count == 3
+
+
+def test_skip_to():
+    read_text = MagicMock(return_value=TEXT)
+    sections = _JsonSections(TEXT, read_text, ["first"])
+
+    sections.skip_to(TEXT, ["second", "first"])
+
+    assert sections.names == ["first", "second"]
+    assert sections.is_complete is False
+    sections.skip_to(TEXT, ["first"])
+    assert sections.names == ["first", "second"]
+    read_text.assert_not_called()
+    assert sections.pop("second") == [1, 2]
+    read_text.assert_called_once()
+
+
+def test_skip_to_the_end():
+    read_text = MagicMock(return_value=TEXT)
+    sections = _JsonSections(TEXT, read_text, ["first"])
+
+    sections.skip_to(TEXT)
+
+    assert sections.is_complete is True
+    assert sections.names == list(DATA)
+    read_text.assert_not_called()
+    assert sections.pop("third") == {"b": {"c": "}"}}
+    assert sections.pop("unknown") is None
+    read_text.assert_called_once()
+
+
+def test_missing_member_decodes_everything():
+    sections = _JsonSections(TEXT, MagicMock(), ["first", "unknown"])
+
+    assert sections.is_complete is True
+    assert sections.names == list(DATA)
+
+
+def test_pop_drops_the_value():
+    sections = _JsonSections(TEXT, MagicMock(return_value=TEXT), ["first"])
+
+    sections.pop("first")
+    sections.pop("third")
+
+    assert sections.pop("first") is None
+    assert sections.pop("third") is None
+
+
+@pytest.mark.parametrize("skip", [False, True])
+def test_changed_text_is_rejected(skip):
+    changed_text = json.dumps(dict(DATA, second=[1, 2, 3]), indent=1)
+    read_text = MagicMock(return_value=changed_text)
+    sections = _JsonSections(TEXT, read_text, ["first"])
+    if skip:
+        sections.skip_to(TEXT)
+
+    with pytest.raises(ValueError, match="changed since it was first read"):
+        sections.pop("third")
+
+    read_text.return_value = TEXT
+    assert sections.pop("third") == {"b": {"c": "}"}}
+
+
+@pytest.mark.parametrize("text", ["", "[]", '{"a" 1}', '{"a": 1 "b": 2}', '{a: 1}', '{"a": }', '{"a": 1'])
+def test_invalid_json(text):
+    with pytest.raises(json.JSONDecodeError):
+        _JsonSections(text, MagicMock(), ["b"])
+
+
+@pytest.mark.parametrize("text", ['{"a": 1, "b": }', '{"a": 1, "b" 2}', '{"a": 1, "b": 2'])
+def test_invalid_json_in_skipped_members(text):
+    sections = _JsonSections(text, MagicMock(return_value=text), ["a"])
+
+    with pytest.raises(json.JSONDecodeError):
+        sections.skip_to(text)
+
+
+def test_empty_object():
+    sections = _JsonSections("{ }", MagicMock(), ["a"])
+
+    assert sections.is_complete is True
+    assert sections.names == []
@@ -0,0 +1,71 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import pytest
+
+from licenselynx.key_search import _PrefixIndex, _SubstringIndex
+from licenselynx.license_object import LicenseObject
+
+MIT = LicenseObject("MIT", "spdx")
+APACHE = LicenseObject("Apache-2.0", "spdx")
+ORG = LicenseObject("SISL-1.5", "siemens")
+
+VIEW = {
+    "MIT": MIT,
+    "mit": MIT,
+    "MIT License": MIT,
+    "The MIT License": MIT,
+    "Apache License 2.0": APACHE,
+    "Apache-2.0": APACHE,
+}
+KEYS = [*VIEW, "Siemens Inner Source License", "MIT"]
+
+
+@pytest.mark.parametrize("index_class", [_PrefixIndex, _SubstringIndex])
+def test_search_is_case_insensitive(index_class):
+    names = [name for name, _ in index_class(KEYS).search("mit l", VIEW, 10)]
+
+    assert set(names) >= {"MIT License"}
+    assert all("mit l" in name.casefold() for name in names)
+
+
+def test_prefix_search():
+    index = _PrefixIndex(KEYS)
+
+    assert index.search("apache", VIEW, 10) == [("Apache License 2.0", APACHE), ("Apache-2.0", APACHE)]
+    assert [name for name, _ in index.search("MIT", VIEW, 10)] == ["MIT", "mit", "MIT License"]
+    assert [name for name, _ in index.search("mi", VIEW, 2)] == ["MIT", "mit"]
+    assert index.search("GPL", VIEW, 10) == []
+    assert len(index.search("", VIEW, 4)) == 4
+
+
+def test_substring_search():
+    index = _SubstringIndex(KEYS)
+
+    # Names ending with the text come first
+    assert [name for name, _ in index.search("license", VIEW, 10)] == [
+        "MIT License", "The MIT License", "Apache License 2.0"]
+    assert [name for name, _ in index.search("mit", VIEW, 10)][:2] == ["MIT", "mit"]
+    assert len(index.search("mit", VIEW, 10)) == 4
+    assert len(index.search("i", VIEW, 3)) == 3
+    assert index.search("GPL", VIEW, 10) == []
+    assert len(index.search("", VIEW, 4)) == 4
+
+
+@pytest.mark.parametrize("index_class", [_PrefixIndex, _SubstringIndex])
+def test_search_skips_names_missing_from_view(index_class):
+    index = index_class(KEYS)
+
+    assert index.search("Siemens", VIEW, 10) == []
+    assert index.search("Siemens", {"Siemens Inner Source License": ORG}, 10) == [("Siemens Inner Source License", ORG)]
+
+
+def test_substring_search_matches_scan():
+    keys = [f"License {number} {'abc' * (number % 5)}" for number in range(200)]
+    view = {key: MIT for key in keys}
+    index = _SubstringIndex(keys)
+
+    for text in ("1", "12", "abca", "e 19", "license 1", "xyz", "c"):
+        assert sorted(name for name, _ in index.search(text, view, 1000)) == sorted(
+            key for key in keys if text.casefold() in key.casefold())
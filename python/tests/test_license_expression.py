@@ -0,0 +1,94 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import pytest
+
+from licenselynx.license_expression import LicenseOperation, LicenseSymbol, LicenseWithException, _parse_expression
+from licenselynx.license_object import LicenseObject
+
+LICENSES = {
+    "MIT": LicenseObject("MIT", "spdx"),
+    "MIT License": LicenseObject("MIT", "spdx"),
+    "Apache-2.0": LicenseObject("Apache-2.0", "spdx"),
+    "GPL-2.0": LicenseObject("GPL-2.0-only", "spdx"),
+    "Classpath-exception-2.0": LicenseObject("Classpath-exception-2.0", "spdx"),
+    "BSD-3-Clause": LicenseObject("BSD-3-Clause", "spdx"),
+    "Zero-Clause BSD License (0BSD)": LicenseObject("0BSD", "spdx"),
+    "GPL v2 or later": LicenseObject("GPL-2.0-or-later", "spdx"),
+    "MIT OR Apache": LicenseObject("MIT-or-Apache", "custom"),
+}
+
+
+def parse(expression: str):
+    return _parse_expression(expression, LICENSES.get)
+
+
+def test_single_license():
+    assert parse(" MIT License ") == LicenseSymbol("MIT License", LICENSES["MIT"])
+
+
+def test_operators_and_precedence():
+    tree = parse("MIT OR Apache-2.0 AND GPL-2.0 WITH Classpath-exception-2.0")
+
+    assert tree == LicenseOperation("OR", (
+        LicenseSymbol("MIT", LICENSES["MIT"]),
+        LicenseOperation("AND", (
+            LicenseSymbol("Apache-2.0", LICENSES["Apache-2.0"]),
+            LicenseWithException(LicenseSymbol("GPL-2.0", LICENSES["GPL-2.0"]),
+                                 LicenseSymbol("Classpath-exception-2.0", LICENSES["Classpath-exception-2.0"])),
+        )),
+    ))
+    assert str(tree) == "MIT OR (Apache-2.0 AND GPL-2.0-only WITH Classpath-exception-2.0)"
+
+
+def test_parentheses_and_flattening():
+    tree = parse("(BSD-3-Clause AND MIT) AND (Apache-2.0 OR (MIT License OR Unknown))")
+
+    assert tree.operator == "AND"
+    assert len(tree.operands) == 3
+    assert str(tree) == "BSD-3-Clause AND MIT AND (Apache-2.0 OR MIT OR Unknown)"
+    assert [symbol.name for symbol in tree.symbols()] == ["BSD-3-Clause", "MIT", "Apache-2.0", "MIT License", "Unknown"]
+
+
+def test_operand_with_parenthesized_suffix():
+    tree = parse("Zero-Clause BSD License (0BSD) AND MIT")
+
+    assert str(tree) == "0BSD AND MIT"
+
+
+def test_lowercase_operators_are_part_of_the_name():
+    assert parse("GPL v2 or later") == LicenseSymbol("GPL v2 or later", LICENSES["GPL v2 or later"])
+    assert parse("MIT and more") == LicenseSymbol("MIT and more", None)
+
+
+def test_whole_string_is_looked_up_first():
+    assert parse("MIT OR Apache") == LicenseSymbol("MIT OR Apache", LICENSES["MIT OR Apache"])
+
+
+def test_unmapped_operand():
+    tree = parse("MIT OR Unknown License")
+
+    assert tree.operands[1] == LicenseSymbol("Unknown License", None)
+    assert str(tree) == "MIT OR Unknown License"
+
+
+@pytest.mark.parametrize("expression", ["", "(MIT", "MIT)", "MIT OR", "AND MIT", "(MIT OR Apache-2.0) WITH Classpath-exception-2.0",
+                                        "MIT ()", "MIT () OR Apache-2.0", "(" * 2000 + "MIT" + ")" * 2000])
+def test_invalid_expression_is_one_symbol(expression):
+    assert parse(expression) == LicenseSymbol(expression, None)
+
+
+def test_nesting_depth():
+    nested = "(" * 64 + "MIT OR Apache-2.0" + ")" * 64
+
+    assert str(parse(nested)) == "MIT OR Apache-2.0"
+    assert parse("(" + nested + ")") == LicenseSymbol("(" + nested + ")", None)
+
+
+def test_resolve_called_per_operand():
+    resolved = []
+
+    _parse_expression("MIT OR (MIT AND Apache-2.0)", lambda name: resolved.append(name) or LICENSES.get(name))
+
+    assert resolved == ["MIT OR (MIT AND Apache-2.0)", "MIT", "MIT", "Apache-2.0"]
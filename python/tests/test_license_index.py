@@ -0,0 +1,131 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import struct
+
+import pytest
+from licenselynx.license_index import _LicenseIndex, _build_index
+from licenselynx.license_object import LicenseObject
+
+MOCK_DATA = {
+    "stableMap": {
+        "MIT License": {"id": "MIT", "src": "spdx"},
+        "MIT": {"id": "MIT", "src": "spdx"},
+        "Apache License 2.0": {"id": "Apache-2.0", "src": "spdx"},
+        "Licence écrite": {"id": "Some-License", "src": "custom"},
+    },
+    "riskyMap": {"GPL License": {"id": "GPL", "src": "custom"}},
+    "testOrg": {"testOrg License": {"id": "testOrgId", "src": "testOrg"}},
+}
+
+
+def build_index(data: dict, perfect_hash: bool = False) -> bytes:
+    """Writes the binary index of test data with _build_index, the writer behind merge_data.py --index."""
+    return _build_index({name: {alias: LicenseObject(**canonical) for alias, canonical in alias_map.items()}
+                         for name, alias_map in data.items()}, perfect_hash)
+
+
+def test_index_lookup():
+    index = _LicenseIndex(build_index(MOCK_DATA))
+    stable_map = index.license_map("stableMap")
+
+    assert stable_map.get("MIT License").id == "MIT"
+    assert stable_map.get("MIT License").src == "spdx"
+    assert stable_map["Apache License 2.0"].id == "Apache-2.0"
+    assert stable_map.get("Licence écrite").id == "Some-License"
+    assert stable_map.get("GPL License") is None
+    assert stable_map.get("") is None
+    with pytest.raises(KeyError):
+        stable_map["GPL License"]
+
+
+def test_index_shares_license_objects():
+    stable_map = _LicenseIndex(build_index(MOCK_DATA)).license_map("stableMap")
+
+    assert stable_map.get("MIT License") is stable_map.get("MIT")
+
+
+def test_index_mapping_protocol():
+    index = _LicenseIndex(build_index(MOCK_DATA))
+    stable_map = index.license_map("stableMap")
+
+    assert index.map_names == ["stableMap", "riskyMap", "testOrg"]
+    assert len(stable_map) == 4
+    assert "MIT" in stable_map
+    assert "GPL License" not in stable_map
+    assert sorted(stable_map) == sorted(MOCK_DATA["stableMap"])
+    assert dict(stable_map.items())["MIT"].id == "MIT"
+
+
+def test_index_load_licenses():
+    index = _LicenseIndex(build_index(MOCK_DATA))
+
+    index.load_licenses()
+
+    assert all(license_object is not None for license_object in index._licenses)
+    assert index.license_map("stableMap").get("MIT") is index.license(0)
+
+
+def test_build_index_round_trip():
+    index = _LicenseIndex(build_index(MOCK_DATA))
+    maps = {name: index.license_map(name) for name in index.map_names}
+
+    rebuilt = _LicenseIndex(memoryview(_build_index(maps)))
+
+    assert rebuilt.map_names == index.map_names
+    for name in index.map_names:
+        assert dict(rebuilt.license_map(name).items()) == dict(index.license_map(name).items())
+
+
+def test_build_index_perfect_hash_round_trip():
+    index = _LicenseIndex(build_index(MOCK_DATA))
+    maps = {name: index.license_map(name) for name in index.map_names}
+
+    rebuilt = _LicenseIndex(_build_index(maps, perfect_hash=True))
+
+    assert rebuilt.map_names == index.map_names
+    assert rebuilt.license_map("stableMap").get("Licence écrite").id == "Some-License"
+    for name in index.map_names:
+        assert dict(rebuilt.license_map(name).items()) == dict(index.license_map(name).items())
+
+
+def test_index_invalid_header():
+    with pytest.raises(ValueError, match="invalid header"):
+        _LicenseIndex(b"NOTANIDX" + build_index(MOCK_DATA)[8:])
+    index = bytearray(build_index(MOCK_DATA))
+    struct.pack_into("<I", index, 8, 3)
+    with pytest.raises(ValueError, match="version 3 is not supported"):
+        _LicenseIndex(index)
+
+
+def test_perfect_hash_index_lookup():
+    index = _LicenseIndex(build_index(MOCK_DATA, perfect_hash=True))
+    stable_map = index.license_map("stableMap")
+
+    assert index.map_names == ["stableMap", "riskyMap", "testOrg"]
+    assert all(stable_map.get(alias).id == canonical["id"] for alias, canonical in MOCK_DATA["stableMap"].items())
+    assert stable_map.get("Licence écrite").id == "Some-License"
+    assert stable_map.get("GPL License") is None
+    assert stable_map.get("MIT Licens") is None
+    assert stable_map.get("") is None
+    assert "MIT" in stable_map
+    assert sorted(stable_map) == sorted(MOCK_DATA["stableMap"])
+    assert index.license_map("riskyMap").get("GPL License").id == "GPL"
+
+
+def test_perfect_hash_index_unknown_keys():
+    data = {"stableMap": {f"License {number}": {"id": f"L-{number}", "src": "custom"} for number in range(500)}}
+    stable_map = _LicenseIndex(build_index(data, perfect_hash=True)).license_map("stableMap")
+
+    assert all(stable_map.get(f"License {number}").id == f"L-{number}" for number in range(500))
+    assert not any(f"License {number}" in stable_map for number in range(500, 1500))
+
+
+def test_index_open_file(tmp_path):
+    index_file = tmp_path / "merged_data.idx"
+    index_file.write_bytes(build_index(MOCK_DATA))
+
+    index = _LicenseIndex.open(index_file)
+
+    assert index.license_map("riskyMap").get("GPL License").id == "GPL"
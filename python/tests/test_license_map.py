@@ -0,0 +1,82 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+from types import MappingProxyType
+
+from licenselynx.license_map import _ChainedMap, _LazyMap, _LicenseMap
+from licenselynx.license_object import LicenseObject
+from licenselynx.organization import Organization
+
+STABLE = LicenseObject("MIT", "spdx")
+RISKY = LicenseObject("GPL", "custom")
+ORG = LicenseObject("SISL-1.5", "siemens")
+
+
+def create_license_map(map_type=dict) -> _LicenseMap:
+    return _LicenseMap(
+        stable_map=map_type({"shared": STABLE, "stable": STABLE}),
+        risky_map=map_type({"shared": RISKY, "risky": RISKY, "risky and org": RISKY}),
+        organizations={Organization.SIEMENS: map_type({"shared": ORG, "risky and org": ORG, "org": ORG})},
+    )
+
+
+def test_view_without_options_is_stable_map():
+    license_map = create_license_map()
+
+    assert license_map.view(False, None) is license_map.stable_map
+
+
+def test_view_precedence():
+    license_map = create_license_map()
+
+    risky_view = license_map.view(True, None)
+    org_view = license_map.view(False, Organization.SIEMENS)
+    all_view = license_map.view(True, Organization.SIEMENS)
+
+    assert dict(risky_view) == {"shared": STABLE, "stable": STABLE, "risky": RISKY, "risky and org": RISKY}
+    assert dict(org_view) == {"shared": STABLE, "stable": STABLE, "risky and org": ORG, "org": ORG}
+    assert dict(all_view) == {"shared": STABLE, "stable": STABLE, "risky": RISKY, "risky and org": RISKY, "org": ORG}
+
+
+def test_view_is_cached_and_shares_values():
+    license_map = create_license_map()
+
+    view = license_map.view(True, Organization.SIEMENS)
+
+    assert license_map.view(True, Organization.SIEMENS) is view
+    assert view["org"] is ORG
+    assert view["stable"] is STABLE
+
+
+def test_view_of_lazy_dicts_is_merged():
+    license_map = create_license_map(lambda license_map: _LazyMap(lambda: license_map))
+
+    assert isinstance(license_map.view(True, Organization.SIEMENS), dict)
+
+
+def test_view_of_other_maps_is_chained():
+    dict_view = create_license_map().view(True, Organization.SIEMENS)
+    license_map = create_license_map(MappingProxyType)
+
+    view = license_map.view(True, Organization.SIEMENS)
+
+    assert isinstance(view, _ChainedMap)
+    assert license_map.view(True, Organization.SIEMENS) is view
+    assert dict(view) == dict(dict_view)
+    assert list(view) == ["shared", "stable", "risky", "risky and org", "org"]
+    assert len(view) == 5
+    assert view["risky and org"] is RISKY
+    assert "org" in view
+    assert view.get("missing") is None
+    assert "missing" not in view
+
+
+def test_load_views():
+    license_map = create_license_map(MappingProxyType)
+    license_map.folded = create_license_map()
+
+    license_map.load_views()
+
+    assert set(license_map._views) == {(True, None), (False, Organization.SIEMENS), (True, Organization.SIEMENS)}
+    assert set(license_map.folded._views) == set(license_map._views)
@@ -0,0 +1,264 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import gzip
+import json
+import sys
+from enum import StrEnum
+from unittest.mock import patch
+
+import pytest
+import licenselynx.license_map_singleton as license_map_singleton_module
+import licenselynx.licenselynx as licenselynx_module
+from licenselynx.bloom_filter import build_bloom_filter
+from licenselynx.license_index import _LicenseIndex, _build_index
+from licenselynx.license_map import _ChainedMap
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+from licenselynx.licenselynx import LicenseLynx
+from licenselynx.license_object import LicenseObject
+
+MOCK_DATA = {
+    "stableMap": {
+        "MIT License": {"id": "MIT", "src": "spdx"},
+        "MIT": {"id": "MIT", "src": "spdx"},
+        "Apache License 2.0": {"id": "Apache-2.0", "src": "spdx"},
+        "Licence écrite": {"id": "Some-License", "src": "custom"},
+    },
+    "riskyMap": {"GPL License": {"id": "GPL", "src": "custom"}},
+    "testOrg": {"testOrg License": {"id": "testOrgId", "src": "testOrg"}},
+}
+
+
+class TestOrganization(StrEnum):
+    TEST_ORG = "testOrg"
+
+
+def build_index(data: dict, perfect_hash: bool = False) -> bytes:
+    """Writes the binary index of test data with _build_index, the writer behind merge_data.py --index."""
+    return _build_index({name: {alias: LicenseObject(**canonical) for alias, canonical in alias_map.items()}
+                         for name, alias_map in data.items()}, perfect_hash)
+
+
+def write_generated_modules(data: dict, package_dir) -> None:
+    """Writes the generated module layout of scripts/src/load/python_codegen.py for test data."""
+    package_dir.mkdir()
+    licenses: dict[tuple, int] = {}
+    map_modules = {}
+    for position, (name, alias_map) in enumerate(data.items()):
+        indices = tuple(licenses.setdefault((canonical["id"], canonical["src"]), len(licenses))
+                        for canonical in alias_map.values())
+        package_dir.joinpath(f"map_{position}.py").write_text(f"KEYS = {tuple(alias_map)!r}\nLICENSES = {indices!r}\n",
+                                                              encoding="utf-8")
+        map_modules[name] = f"map_{position}"
+    package_dir.joinpath("licenses.py").write_text(f"LICENSES = {tuple(licenses)!r}\n")
+    package_dir.joinpath("__init__.py").write_text(f"MAPS = {map_modules!r}\n")
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton(monkeypatch):
+    monkeypatch.setattr(_LicenseMapSingleton, "_instances", {})
+    monkeypatch.setattr(license_map_singleton_module, "Organization", TestOrganization)
+    monkeypatch.setattr(licenselynx_module, "_key_filter_loaded", False)
+
+
+@pytest.fixture
+def index_resources(tmp_path, monkeypatch):
+    """Provides a resource directory containing only the binary index."""
+    monkeypatch.setenv(license_map_singleton_module.BACKEND_ENV_VAR, "auto")
+    monkeypatch.setattr(license_map_singleton_module, "GENERATED_PACKAGE", "licenselynx_test_missing_generated")
+    tmp_path.joinpath("merged_data.idx").write_bytes(build_index(MOCK_DATA))
+    with patch("importlib.resources.files", return_value=tmp_path):
+        yield tmp_path
+
+
+@pytest.fixture
+def generated_modules(index_resources, monkeypatch):
+    """Provides generated modules for MOCK_DATA next to the binary index, importable as licenselynx_test_generated."""
+    write_generated_modules(MOCK_DATA, index_resources / "licenselynx_test_generated")
+    monkeypatch.syspath_prepend(str(index_resources))
+    monkeypatch.setattr(license_map_singleton_module, "GENERATED_PACKAGE", "licenselynx_test_generated")
+    yield index_resources
+    for name in [name for name in sys.modules if name.startswith("licenselynx_test_generated")]:
+        del sys.modules[name]
+
+
+def test_singleton_uses_index(index_resources):
+    assert LicenseLynx.map("MIT License").id == "MIT"
+    assert LicenseLynx.map("GPL License") is None
+    assert LicenseLynx.map("GPL License", risky=True).id == "GPL"
+    assert LicenseLynx.map("testOrg License", org=TestOrganization.TEST_ORG).id == "testOrgId"
+
+
+def test_singleton_materialize(index_resources):
+    instance = _LicenseMapSingleton()
+
+    instance.materialize()
+
+    assert all(license_object is not None for license_object in instance._index._licenses)
+    assert isinstance(instance.merged_data.view(True, TestOrganization.TEST_ORG), _ChainedMap)
+    assert (True, TestOrganization.TEST_ORG) in instance.merged_data._views
+
+
+def test_singleton_index_missing_org(index_resources):
+    data = {"stableMap": {}, "riskyMap": {}}
+    index_resources.joinpath("merged_data.idx").write_bytes(build_index(data))
+
+    with pytest.raises(ValueError, match="Organization 'testOrg' is defined in the Organization enum"):
+        _LicenseMapSingleton()
+
+
+def test_singleton_falls_back_to_json(index_resources):
+    index_resources.joinpath("merged_data.idx").unlink()
+    index_resources.joinpath("merged_data.json").write_text(
+        '{"stableMap": {"MIT": {"id": "MIT", "src": "spdx"}}, "riskyMap": {}, "testOrg": {}}')
+
+    assert isinstance(_LicenseMapSingleton().merged_data.stable_map, dict)
+    assert LicenseLynx.map("MIT").id == "MIT"
+
+
+def test_singleton_reads_compressed_json(index_resources):
+    index_resources.joinpath("merged_data.idx").unlink()
+    index_resources.joinpath("merged_data.json.gz").write_bytes(gzip.compress(json.dumps(MOCK_DATA).encode("utf-8")))
+
+    assert LicenseLynx.map("MIT License") is LicenseLynx.map("MIT")
+    assert LicenseLynx.map("GPL License", risky=True).id == "GPL"
+    assert LicenseLynx.map("testOrg License", org=TestOrganization.TEST_ORG).id == "testOrgId"
+
+
+def test_singleton_prefers_uncompressed_json(index_resources):
+    index_resources.joinpath("merged_data.idx").unlink()
+    index_resources.joinpath("merged_data.json").write_text(json.dumps(MOCK_DATA))
+    index_resources.joinpath("merged_data.json.gz").write_bytes(b"not gzip")
+
+    assert LicenseLynx.map("MIT").id == "MIT"
+
+
+def test_singleton_reads_format_version_2(index_resources):
+    index_resources.joinpath("merged_data.idx").unlink()
+    licenses = [{"id": "MIT", "src": "spdx"}, {"id": "Apache-2.0", "src": "spdx"}, {"id": "Some-License", "src": "custom"},
+                {"id": "GPL", "src": "custom"}, {"id": "testOrgId", "src": "testOrg"}]
+    index_resources.joinpath("merged_data.json").write_text(json.dumps({
+        "version": 2,
+        "licenses": licenses,
+        "stableMap": {"MIT License": 0, "MIT": 0, "Apache License 2.0": 1, "Licence écrite": 2},
+        "riskyMap": {"GPL License": 3},
+        "testOrg": {"testOrg License": 4},
+    }))
+
+    merged_data = _LicenseMapSingleton().merged_data
+
+    assert not merged_data.risky_map.is_loaded
+    assert LicenseLynx.map("MIT License") is LicenseLynx.map("MIT")
+    assert LicenseLynx.map("Licence écrite") == LicenseObject(id="Some-License", src="custom")
+    assert LicenseLynx.map("GPL License", risky=True).id == "GPL"
+    assert LicenseLynx.map("testOrg License", org=TestOrganization.TEST_ORG).id == "testOrgId"
+
+
+def test_singleton_defers_maps_listed_in_format_version_2(index_resources):
+    index_resources.joinpath("merged_data.idx").unlink()
+    index_resources.joinpath("merged_data.json").write_text(
+        '{"version": 2, "maps": ["stableMap", "testOrg", "riskyMap"], "licenses": [{"id": "MIT", "src": "spdx"}], '
+        '"stableMap": {"MIT": 0}, "testOrg": {"testOrg License": 0}, "riskyMap": {"GPL License": }}')
+
+    assert LicenseLynx.map("MIT").id == "MIT"
+    assert LicenseLynx.map("testOrg License", org=TestOrganization.TEST_ORG).id == "MIT"
+    with pytest.raises(json.JSONDecodeError):
+        LicenseLynx.map("GPL License", risky=True)
+
+
+def test_singleton_checks_maps_listed_in_format_version_2(index_resources):
+    index_resources.joinpath("merged_data.idx").unlink()
+    index_resources.joinpath("merged_data.json").write_text(
+        '{"version": 2, "maps": ["stableMap", "riskyMap"], "licenses": [], "stableMap": {}, "riskyMap": {}, "testOrg": {}}')
+
+    with pytest.raises(ValueError, match="Organization 'testOrg' is defined in the Organization enum"):
+        _LicenseMapSingleton()
+
+
+def test_singleton_rejects_unknown_format_version(index_resources):
+    index_resources.joinpath("merged_data.idx").unlink()
+    index_resources.joinpath("merged_data.json").write_text(
+        '{"version": 3, "licenses": [], "stableMap": {}, "riskyMap": {}, "testOrg": {}}')
+
+    with pytest.raises(ValueError, match="format version 3 is not supported"):
+        _LicenseMapSingleton()
+
+
+def test_singleton_uses_generated_modules(generated_modules):
+    generated_modules.joinpath("merged_data.idx").unlink()
+
+    instance = _LicenseMapSingleton()
+
+    assert instance._index is None
+    assert LicenseLynx.map("MIT License") is LicenseLynx.map("MIT")
+    assert LicenseLynx.map("Licence écrite").id == "Some-License"
+    assert LicenseLynx.map("GPL License", risky=True).id == "GPL"
+    assert LicenseLynx.map("testOrg License", org=TestOrganization.TEST_ORG).id == "testOrgId"
+    assert instance.merged_data.folded is None
+
+
+def test_singleton_generated_maps_are_lazy(generated_modules):
+    generated_modules.joinpath("merged_data.idx").unlink()
+
+    instance = _LicenseMapSingleton()
+
+    assert "licenselynx_test_generated.map_0" in sys.modules
+    assert "licenselynx_test_generated.map_1" not in sys.modules
+    instance.materialize()
+    assert "licenselynx_test_generated.map_2" in sys.modules
+    assert dict(instance.merged_data.risky_map) == {"GPL License": LicenseObject(id="GPL", src="custom")}
+
+
+def test_singleton_generated_backend_matches_json(generated_modules, monkeypatch):
+    generated_modules.joinpath("merged_data.json").write_text(json.dumps(MOCK_DATA))
+    monkeypatch.setenv(license_map_singleton_module.BACKEND_ENV_VAR, "json")
+    from_json = _LicenseMapSingleton().merged_data
+    monkeypatch.setattr(_LicenseMapSingleton, "_instances", {})
+    monkeypatch.setenv(license_map_singleton_module.BACKEND_ENV_VAR, "generated")
+    from_generated = _LicenseMapSingleton().merged_data
+
+    assert dict(from_generated.stable_map) == dict(from_json.stable_map)
+    assert dict(from_generated.risky_map) == dict(from_json.risky_map)
+    assert dict(from_generated.organizations[TestOrganization.TEST_ORG]) == \
+        dict(from_json.organizations[TestOrganization.TEST_ORG])
+
+
+def test_singleton_generated_missing_org(index_resources, monkeypatch):
+    write_generated_modules({"stableMap": {}, "riskyMap": {}}, index_resources / "licenselynx_test_generated_no_org")
+    monkeypatch.syspath_prepend(str(index_resources))
+    monkeypatch.setattr(license_map_singleton_module, "GENERATED_PACKAGE", "licenselynx_test_generated_no_org")
+    monkeypatch.setenv(license_map_singleton_module.BACKEND_ENV_VAR, "generated")
+
+    with pytest.raises(ValueError, match="Organization 'testOrg' is defined in the Organization enum"):
+        _LicenseMapSingleton()
+    del sys.modules["licenselynx_test_generated_no_org"]
+
+
+def test_singleton_uses_folded_index(index_resources):
+    data = dict(MOCK_DATA, **{
+        "stableMap.folded": {"mit license": {"id": "MIT", "src": "spdx"}},
+        "riskyMap.folded": {"gpl license": {"id": "GPL", "src": "custom"}},
+    })
+    index_resources.joinpath("merged_data.idx").write_bytes(build_index(data))
+
+    assert LicenseLynx.map("'MIT License',") is LicenseLynx.map("MIT License")
+    assert LicenseLynx.map("# GPL license", risky=True).id == "GPL"
+    assert LicenseLynx.map("testorg license", org=TestOrganization.TEST_ORG) is None
+
+    rebuilt = _LicenseMapSingleton.from_index(_LicenseIndex(_LicenseMapSingleton().to_index()))
+    assert "stableMap.folded" in rebuilt._index.map_names
+    assert rebuilt.merged_data.folded.view(True, None).get("gpl license").id == "GPL"
+
+
+def test_singleton_loads_key_filter(index_resources):
+    assert _LicenseMapSingleton.load_key_filter() is None
+
+    keys = [key for alias_map in MOCK_DATA.values() for key in alias_map]
+    index_resources.joinpath("merged_data.bloom").write_bytes(build_bloom_filter(keys))
+
+    key_filter = _LicenseMapSingleton.load_key_filter()
+    assert all(key in key_filter for key in keys)
+    assert LicenseLynx.map("Unknown License") is None
+    assert _LicenseMapSingleton.is_initialized() is False
+    assert LicenseLynx.map("testOrg License", org=TestOrganization.TEST_ORG).id == "testOrgId"
@@ -0,0 +1,40 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import pytest
+
+from licenselynx import fold_license_name
+
+
+@pytest.mark.parametrize("license_name", [
+    "MIT",
+    "mit",
+    "  MIT\t",
+    "'MIT',",
+    '"MIT",',
+    "`MIT`;",
+    "# MIT",
+    "'MIT' # Example license",
+    "“MIT”",
+    "\"'MIT'\"",
+])
+def test_fold_license_name_variants(license_name):
+    assert fold_license_name(license_name) == "mit"
+
+
+def test_fold_license_name_collapses_whitespace():
+    assert fold_license_name(" GNU   General\nPublic License ") == "gnu general public license"
+
+
+def test_fold_license_name_keeps_inner_characters():
+    assert fold_license_name("Script# License") == "script# license"
+    assert fold_license_name("'MIT' License") == "'mit' license"
+    assert fold_license_name("'MIT") == "'mit"
+    assert fold_license_name("The MIT License(MIT)") == "the mit license(mit)"
+
+
+def test_fold_license_name_empty():
+    assert fold_license_name("") == ""
+    assert fold_license_name("#") == ""
+    assert fold_license_name("'',") == ""
@@ -2,13 +2,22 @@
 # SPDX-FileCopyrightText: Copyright 2025 Siemens AG
 # SPDX-License-Identifier: BSD-3-Clause
 #
+import asyncio
+import dataclasses
 import json
+import subprocess
+import sys
+import threading
 from enum import StrEnum
+from pathlib import Path
 from unittest.mock import mock_open, patch, MagicMock
 
 import pytest
 import licenselynx.license_map_singleton as license_map_singleton_module
 import licenselynx.license_object as license_object_module
+import licenselynx.licenselynx as licenselynx_module
+from licenselynx import CacheInfo
+from licenselynx.bloom_filter import _BloomFilter, build_bloom_filter
 from licenselynx.licenselynx import LicenseLynx
 from licenselynx.license_object import LicenseObject
 from licenselynx.license_map_singleton import _LicenseMapSingleton
@@ -36,6 +45,27 @@ def reset_singleton(monkeypatch):
     monkeypatch.setattr(_LicenseMapSingleton, "_instances", {})
 
 
+@pytest.fixture(autouse=True)
+def no_key_filter(monkeypatch):
+    """Disables the Bloom filter pre-check, the mocked resources below do not provide merged_data.bloom."""
+    monkeypatch.setattr(licenselynx_module, "_key_filter", None)
+    monkeypatch.setattr(licenselynx_module, "_key_filter_loaded", True)
+
+
+@pytest.fixture
+def key_filter(monkeypatch):
+    """Installs a Bloom filter over the keys of the mocked data."""
+    keys = [LICENSE_STRING_STABLE, LICENSE_STRING_WITH_NORMALIZED_QUOTES, LICENSE_STRING_SCANCODE, LICENSE_STRING_RISKY,
+            LICENSE_STRING_ORG, "mit license", "some license", "gpl license", "testorg"]
+    monkeypatch.setattr(licenselynx_module, "_key_filter", _BloomFilter(build_bloom_filter(keys)))
+
+
+@pytest.fixture(autouse=True)
+def json_backend(monkeypatch):
+    """Forces the JSON backend, the mocked resources below only provide merged_data.json."""
+    monkeypatch.setenv(license_map_singleton_module.BACKEND_ENV_VAR, "json")
+
+
 @pytest.fixture(autouse=True)
 def mock_organization(monkeypatch):
     monkeypatch.setattr(license_map_singleton_module, "Organization", TestOrganization)
@@ -52,12 +82,21 @@ def mock_data():
                                },
                  "riskyMap": {LICENSE_STRING_RISKY: {"id": CANONICAL_ID_RISKY, "src": LicenseSource.CUSTOM.value}},
                  TestOrganization.TEST_ORG: {LICENSE_STRING_ORG: {"id": CANONICAL_ID_ORG,
-                                                                  "src": TestOrganization.TEST_ORG.value}}}
-    mock_file = MagicMock()
-    mock_file.__enter__.return_value = mock_open(read_data=json.dumps(mock_data)).return_value
+                                                                  "src": TestOrganization.TEST_ORG.value}},
+                 "stableMap.folded": {"mit license": {"id": CANONICAL_ID_STABLE, "src": LicenseSource.SPDX.value},
+                                      "some license": {"id": CANONICAL_ID_STABLE,
+                                                       "src": LicenseSource.SCANCODE_LICENSEDB.value}},
+                 "riskyMap.folded": {"gpl license": {"id": CANONICAL_ID_RISKY, "src": LicenseSource.CUSTOM.value}},
+                 "testOrg.folded": {"testorg": {"id": CANONICAL_ID_ORG, "src": TestOrganization.TEST_ORG.value}}}
+
+    def open_mock_file(*args, **kwargs):
+        # merged_data.json is read again when the maps at its end are first accessed
+        mock_file = MagicMock()
+        mock_file.__enter__.return_value = mock_open(read_data=json.dumps(mock_data)).return_value
+        return mock_file
 
     with patch('importlib.resources.files') as mock_resources_files:
-        mock_resources_files.return_value.joinpath.return_value.open.return_value = mock_file
+        mock_resources_files.return_value.joinpath.return_value.open.side_effect = open_mock_file
         yield
 
 
@@ -74,6 +113,41 @@ def test_license_map_singleton(mock_data):
     assert instance.merged_data.stable_map.get(LICENSE_STRING_STABLE).src == LicenseSource.SPDX
 
 
+def test_license_map_singleton_does_not_lock_after_init(mock_data, monkeypatch):
+    instance = _LicenseMapSingleton()
+    lock = MagicMock()
+    monkeypatch.setattr(license_map_singleton_module._Singleton, "_lock", lock)
+
+    assert _LicenseMapSingleton() is instance
+    lock.__enter__.assert_not_called()
+
+
+def test_license_map_singleton_concurrent_init(mock_data, monkeypatch):
+    init_calls = []
+    original_init = _LicenseMapSingleton.__init__
+
+    def counting_init(self):
+        init_calls.append(self)
+        original_init(self)
+
+    monkeypatch.setattr(_LicenseMapSingleton, "__init__", counting_init)
+    barrier = threading.Barrier(8)
+    instances = []
+
+    def create():
+        barrier.wait()
+        instances.append(_LicenseMapSingleton())
+
+    threads = [threading.Thread(target=create) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(init_calls) == 1
+    assert all(instance is instances[0] for instance in instances)
+
+
 def test_map_with_existing_license(mock_data):
     result = LicenseLynx.map(LICENSE_STRING_STABLE)
 
@@ -105,6 +179,521 @@ def test_map_with_non_existing_license(mock_data):
     assert result2 is None
 
 
+def test_map_falls_back_to_folded_key(mock_data):
+    result = LicenseLynx.map("'MIT  license',")
+    result_comment = LicenseLynx.map("# \u201CMIT License\u201D # Example license")
+
+    assert result is LicenseLynx.map(LICENSE_STRING_STABLE)
+    assert result_comment is result
+    assert LicenseLynx.map("'Some License'").src == LicenseSource.SCANCODE_LICENSEDB
+    assert LicenseLynx.map("MIT") is None
+
+
+def test_map_folded_key_respects_options(mock_data):
+    assert LicenseLynx.map("gpl license") is None
+    assert LicenseLynx.map("gpl license", risky=True).id == CANONICAL_ID_RISKY
+    assert LicenseLynx.map(" TESTORG ") is None
+    assert LicenseLynx.map(" TESTORG ", org=TestOrganization.TEST_ORG).id == CANONICAL_ID_ORG
+
+
+def test_map_without_folded_maps(mock_data):
+    instance = _LicenseMapSingleton()
+    instance._merged_data = dataclasses.replace(instance.merged_data, folded=None)
+
+    assert LicenseLynx.map("mit license") is None
+    assert LicenseLynx.map(LICENSE_STRING_STABLE).id == CANONICAL_ID_STABLE
+
+
+def test_map_expression(mock_data):
+    tree = LicenseLynx.map_expression(f"{LICENSE_STRING_STABLE} OR ({LICENSE_STRING_RISKY} AND {LICENSE_STRING_ORG})",
+                                      risky=True, org=TestOrganization.TEST_ORG)
+
+    assert str(tree) == f"{CANONICAL_ID_STABLE} OR ({CANONICAL_ID_RISKY} AND {CANONICAL_ID_ORG})"
+    assert [symbol.license for symbol in tree.symbols()] == [
+        LicenseLynx.map(name, risky=True, org=TestOrganization.TEST_ORG)
+        for name in (LICENSE_STRING_STABLE, LICENSE_STRING_RISKY, LICENSE_STRING_ORG)]
+    assert str(LicenseLynx.map_expression(f"{LICENSE_STRING_STABLE} AND {LICENSE_STRING_RISKY}")) == \
+        f"{CANONICAL_ID_STABLE} AND {LICENSE_STRING_RISKY}"
+
+
+def test_map_expression_single_license(mock_data):
+    symbol = LicenseLynx.map_expression(LICENSE_STRING_WITH_QUOTES)
+
+    assert symbol.name == LICENSE_STRING_WITH_QUOTES
+    assert symbol.license is LicenseLynx.map(LICENSE_STRING_STABLE)
+
+
+def test_map_expressions_memoizes_operands(mock_data):
+    expressions = [f"{LICENSE_STRING_STABLE} OR {LICENSE_STRING_RISKY}", f"{LICENSE_STRING_RISKY} AND {LICENSE_STRING_STABLE}",
+                   f"{LICENSE_STRING_STABLE} OR {LICENSE_STRING_RISKY}"] * 50
+    with patch.object(licenselynx_module, "normalize_quotes", side_effect=lambda name: name) as normalize_quotes:
+        trees = LicenseLynx.map_expressions(expressions)
+
+    # Both whole expressions and both operands
+    assert normalize_quotes.call_count == 4
+    assert len(trees) == 150
+    assert trees[2] is trees[0]
+    assert str(trees[1]) == f"{LICENSE_STRING_RISKY} AND {CANONICAL_ID_STABLE}"
+
+
+@pytest.fixture
+def alias_resources(tmp_path):
+    """Provides a resource directory with merged_data.json and merged_aliases.json."""
+    tmp_path.joinpath("merged_data.json").write_text(json.dumps({
+        "stableMap": {"MIT": {"id": "MIT", "src": "spdx"}}, "riskyMap": {}, "testOrg": {}}))
+    tmp_path.joinpath("merged_aliases.json").write_text(json.dumps({
+        "MIT": {"spdx": ["MIT", "MIT License"], "custom": ["'MIT'"], "risky": ["MIT-ish"]}}))
+    with patch("importlib.resources.files", return_value=tmp_path):
+        yield tmp_path
+
+
+def test_aliases_of(alias_resources):
+    assert LicenseLynx.aliases_of("MIT") == {"spdx": ["MIT", "MIT License"], "custom": ["'MIT'"], "risky": ["MIT-ish"]}
+    assert LicenseLynx.aliases_of("Unknown") == {}
+
+
+def test_aliases_of_loads_index_once(alias_resources):
+    LicenseLynx.map("MIT")
+    assert _LicenseMapSingleton()._alias_index is None
+
+    LicenseLynx.aliases_of("MIT")["spdx"].append("modified")
+    alias_resources.joinpath("merged_aliases.json").unlink()
+
+    assert LicenseLynx.aliases_of("MIT")["spdx"] == ["MIT", "MIT License"]
+
+
+def test_aliases_of_missing_resource(alias_resources):
+    alias_resources.joinpath("merged_aliases.json").unlink()
+
+    with pytest.raises(FileNotFoundError):
+        LicenseLynx.aliases_of("MIT")
+
+
+def test_search_prefix(mock_data):
+    assert LicenseLynx.search_prefix("mit") == [(LICENSE_STRING_STABLE, LicenseLynx.map(LICENSE_STRING_STABLE))]
+    assert LicenseLynx.search_prefix("GPL") == []
+    assert LicenseLynx.search_prefix("GPL", risky=True)[0][1].id == CANONICAL_ID_RISKY
+    assert LicenseLynx.search_prefix("test", org=TestOrganization.TEST_ORG)[0][1].id == CANONICAL_ID_ORG
+    assert len(LicenseLynx.search_prefix("", limit=2)) == 2
+
+
+def test_search_substring(mock_data):
+    results = LicenseLynx.search_substring("LICENSE", risky=True)
+
+    assert [name for name, _ in results] == [LICENSE_STRING_WITH_NORMALIZED_QUOTES, LICENSE_STRING_RISKY,
+                                             LICENSE_STRING_STABLE, LICENSE_STRING_SCANCODE]
+    assert [license_object.id for _, license_object in LicenseLynx.search_substring("org")] == []
+    assert LicenseLynx.search_substring("org", org=TestOrganization.TEST_ORG)[0][1].id == CANONICAL_ID_ORG
+
+
+def test_search_builds_indexes_lazily(mock_data):
+    LicenseLynx.search_prefix("mit")
+    merged_data = _LicenseMapSingleton().merged_data
+
+    assert merged_data._prefix_index is not None
+    assert merged_data._substring_index is None
+    LicenseLynx.search_substring("mit")
+    assert merged_data._substring_index is not None
+
+
+def test_search_invalid_limit(mock_data):
+    with pytest.raises(ValueError, match="limit must be positive"):
+        LicenseLynx.search_prefix("mit", limit=0)
+    with pytest.raises(ValueError, match="limit must be positive"):
+        LicenseLynx.search_substring("mit", limit=0)
+
+
+def test_suggest(mock_data):
+    suggestions = LicenseLynx.suggest("MIT Licnese")
+
+    assert suggestions[0].name == LICENSE_STRING_STABLE
+    assert suggestions[0].license is LicenseLynx.map(LICENSE_STRING_STABLE)
+    assert 0.6 <= suggestions[0].score < 1
+    assert LicenseLynx.suggest("GPL Licnese") == []
+    assert LicenseLynx.suggest("GPL Licnese", risky=True)[0].license.id == CANONICAL_ID_RISKY
+    assert LicenseLynx.suggest("testOgr", org=TestOrganization.TEST_ORG)[0].license.id == CANONICAL_ID_ORG
+
+
+def test_suggest_builds_index_lazily(mock_data):
+    LicenseLynx.map(LICENSE_STRING_STABLE)
+    assert _LicenseMapSingleton().merged_data._suggestion_index is None
+
+    LicenseLynx.suggest(LICENSE_STRING_STABLE)
+    index = _LicenseMapSingleton().merged_data._suggestion_index
+    LicenseLynx.suggest(LICENSE_STRING_RISKY)
+
+    assert index is not None
+    assert _LicenseMapSingleton().merged_data._suggestion_index is index
+
+
+def test_suggest_invalid_arguments(mock_data):
+    with pytest.raises(ValueError, match="k must be positive"):
+        LicenseLynx.suggest(LICENSE_STRING_STABLE, k=0)
+    with pytest.raises(ValueError, match="min_score"):
+        LicenseLynx.suggest(LICENSE_STRING_STABLE, min_score=1.5)
+
+
+def test_aliases_share_license_object(mock_data):
+    result = LicenseLynx.map(LICENSE_STRING_STABLE)
+    result_with_quotes = LicenseLynx.map(LICENSE_STRING_WITH_QUOTES)
+    result_scancode = LicenseLynx.map(LICENSE_STRING_SCANCODE)
+
+    assert result is result_with_quotes
+    assert result is not result_scancode
+    assert result != result_scancode
+
+
+def test_license_object_is_frozen_and_hashable(mock_data):
+    result = LicenseLynx.map(LICENSE_STRING_STABLE)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.id = CANONICAL_ID_RISKY  # type: ignore[misc]
+    assert not hasattr(result, "__dict__")
+    assert {result, LicenseObject(CANONICAL_ID_STABLE, LicenseSource.SPDX.value)} == {result}
+
+
+def test_json_backend_loads_maps_on_first_access(mock_data):
+    merged_data = _LicenseMapSingleton().merged_data
+
+    assert LicenseLynx.map(LICENSE_STRING_STABLE).id == CANONICAL_ID_STABLE
+    assert merged_data.risky_map.is_loaded is False
+    assert merged_data.organizations[TestOrganization.TEST_ORG].is_loaded is False
+    assert merged_data.folded.stable_map.is_loaded is False
+
+    assert LicenseLynx.map(LICENSE_STRING_RISKY, risky=True).id == CANONICAL_ID_RISKY
+    assert LicenseLynx.map("mit LICENSE").id == CANONICAL_ID_STABLE
+    assert merged_data.risky_map.is_loaded is True
+    assert merged_data.folded.stable_map.is_loaded is True
+    assert merged_data.organizations[TestOrganization.TEST_ORG].is_loaded is False
+    assert merged_data.risky_map.get(LICENSE_STRING_RISKY) is merged_data.folded.risky_map.get("gpl license")
+
+
+def test_materialize_loads_all_maps(mock_data):
+    instance = _LicenseMapSingleton()
+
+    instance.materialize()
+
+    merged_data = instance.merged_data
+    assert merged_data.risky_map.is_loaded is True
+    assert all(org_map.is_loaded for org_map in merged_data.organizations.values())
+    assert all(org_map.is_loaded for org_map in merged_data.folded.organizations.values())
+
+
+def test_map_many(mock_data):
+    names = [LICENSE_STRING_STABLE, LICENSE_STRING_RISKY, LICENSE_STRING_WITH_QUOTES, LICENSE_STRING_STABLE]
+
+    results = LicenseLynx.map_many(names)
+
+    assert len(results) == 4
+    assert results[0].id == CANONICAL_ID_STABLE
+    assert results[1] is None
+    assert results[2].id == CANONICAL_ID_STABLE
+    assert results[3] is results[0]
+
+
+def test_map_many_with_risky_and_org(mock_data):
+    names = (name for name in [LICENSE_STRING_RISKY, LICENSE_STRING_ORG])
+
+    results = LicenseLynx.map_many(names, risky=True, org=TestOrganization.TEST_ORG)
+
+    assert [result.id for result in results] == [CANONICAL_ID_RISKY, CANONICAL_ID_ORG]
+
+
+def test_map_many_as_dict(mock_data):
+    results = LicenseLynx.map_many([LICENSE_STRING_STABLE, LICENSE_STRING_RISKY, LICENSE_STRING_STABLE], as_dict=True)
+
+    assert list(results) == [LICENSE_STRING_STABLE, LICENSE_STRING_RISKY]
+    assert results[LICENSE_STRING_STABLE].id == CANONICAL_ID_STABLE
+    assert results[LICENSE_STRING_RISKY] is None
+
+
+def test_map_many_normalizes_distinct_names_once(mock_data):
+    with patch.object(licenselynx_module, "normalize_quotes", side_effect=lambda name: name) as normalize_quotes:
+        LicenseLynx.map_many([LICENSE_STRING_STABLE] * 100 + [LICENSE_STRING_RISKY] * 100)
+
+    assert normalize_quotes.call_count == 2
+
+
+def test_map_many_matches_map(mock_data):
+    names = [LICENSE_STRING_STABLE, LICENSE_STRING_RISKY, LICENSE_STRING_WITH_QUOTES, LICENSE_STRING_ORG, ""]
+
+    assert LicenseLynx.map_many(names, risky=True) == [LicenseLynx.map(name, risky=True) for name in names]
+
+
+def test_map_key_filter_skips_load_on_miss(mock_data, key_filter):
+    assert LicenseLynx.map("Unknown License") is None
+    assert LicenseLynx.map_many(["Unknown License", "Another Unknown License"]) == [None, None]
+    assert _LicenseMapSingleton.is_initialized() is False
+
+    assert LicenseLynx.map(LICENSE_STRING_WITH_QUOTES).id == CANONICAL_ID_STABLE
+    assert _LicenseMapSingleton.is_initialized() is True
+
+
+def test_map_key_filter_passes_folded_names(mock_data, key_filter):
+    assert LicenseLynx.map("  mit LICENSE, ").id == CANONICAL_ID_STABLE
+
+
+def test_map_many_key_filter(mock_data, key_filter):
+    names = ["Unknown License", LICENSE_STRING_RISKY, LICENSE_STRING_ORG, "Unknown License"]
+
+    results = LicenseLynx.map_many(names, risky=True, org=TestOrganization.TEST_ORG)
+
+    assert [result.id if result else None for result in results] == [None, CANONICAL_ID_RISKY, CANONICAL_ID_ORG, None]
+
+
+def test_map_key_filter_unused_after_load(mock_data, monkeypatch):
+    monkeypatch.setattr(licenselynx_module, "_key_filter", _BloomFilter(build_bloom_filter([])))
+    LicenseLynx.preload()
+
+    assert LicenseLynx.map(LICENSE_STRING_STABLE).id == CANONICAL_ID_STABLE
+    assert LicenseLynx.map_many([LICENSE_STRING_STABLE])[0].id == CANONICAL_ID_STABLE
+
+
+def test_map_stream(mock_data):
+    names = [LICENSE_STRING_STABLE, LICENSE_STRING_RISKY, LICENSE_STRING_WITH_QUOTES, LICENSE_STRING_ORG]
+
+    results = list(LicenseLynx.map_stream(iter(names), risky=True, org=TestOrganization.TEST_ORG, chunk_size=3))
+
+    assert [name for name, _ in results] == names
+    assert [result for _, result in results] == [LicenseLynx.map(name, risky=True, org=TestOrganization.TEST_ORG)
+                                                 for name in names]
+
+
+def test_map_stream_consumes_input_lazily(mock_data):
+    consumed = []
+
+    def names():
+        for number in range(10_000):
+            consumed.append(number)
+            yield LICENSE_STRING_STABLE
+
+    stream = LicenseLynx.map_stream(names(), chunk_size=10)
+    name, result = next(stream)
+
+    assert name == LICENSE_STRING_STABLE
+    assert result.id == CANONICAL_ID_STABLE
+    assert len(consumed) == 10
+
+
+def test_map_stream_bounded_cache(mock_data):
+    names = [LICENSE_STRING_STABLE, LICENSE_STRING_RISKY, LICENSE_STRING_SCANCODE, LICENSE_STRING_STABLE]
+
+    with patch.object(licenselynx_module, "normalize_quotes", side_effect=lambda name: name) as normalize_quotes:
+        list(LicenseLynx.map_stream(names, cache_size=2))
+        list(LicenseLynx.map_stream(names[:2] * 50, cache_size=2))
+
+    # The first stream evicts LICENSE_STRING_STABLE before it is seen again, the second one only hits the cache
+    assert normalize_quotes.call_count == 4 + 2
+
+
+def test_map_stream_invalid_sizes(mock_data):
+    with pytest.raises(ValueError):
+        LicenseLynx.map_stream([], chunk_size=0)
+    with pytest.raises(ValueError):
+        LicenseLynx.map_stream([], cache_size=0)
+
+
+def test_amap(mock_data):
+    async def run():
+        return await LicenseLynx.amap(LICENSE_STRING_RISKY, risky=True), await LicenseLynx.amap(LICENSE_STRING_ORG)
+
+    result, missing = asyncio.run(run())
+
+    assert result.id == CANONICAL_ID_RISKY
+    assert missing is None
+
+
+def test_amap_many(mock_data):
+    async def run():
+        return (await LicenseLynx.amap_many([LICENSE_STRING_STABLE, LICENSE_STRING_RISKY]),
+                await LicenseLynx.amap_many([LICENSE_STRING_STABLE], as_dict=True))
+
+    results, results_by_name = asyncio.run(run())
+
+    assert results[0].id == CANONICAL_ID_STABLE
+    assert results[1] is None
+    assert results_by_name[LICENSE_STRING_STABLE].id == CANONICAL_ID_STABLE
+
+
+def test_amap_concurrent_awaiters_share_load(mock_data, monkeypatch):
+    init_threads = []
+    original_init = _LicenseMapSingleton.__init__
+
+    def recording_init(self):
+        init_threads.append(threading.current_thread())
+        original_init(self)
+
+    monkeypatch.setattr(_LicenseMapSingleton, "__init__", recording_init)
+
+    async def run():
+        return await asyncio.gather(*(LicenseLynx.amap(LICENSE_STRING_STABLE) for _ in range(10)))
+
+    results = asyncio.run(run())
+
+    assert len(init_threads) == 1
+    assert init_threads[0] is not threading.main_thread()
+    assert all(result.id == CANONICAL_ID_STABLE for result in results)
+
+
+def test_amap_after_warm_up_runs_inline(mock_data, monkeypatch):
+    _LicenseMapSingleton()
+
+    async def run():
+        with patch.object(asyncio.get_running_loop(), "run_in_executor") as run_in_executor:
+            result = await LicenseLynx.amap(LICENSE_STRING_STABLE)
+        run_in_executor.assert_not_called()
+        return result
+
+    assert asyncio.run(run()).id == CANONICAL_ID_STABLE
+
+
+def test_amap_load_error_is_raised_and_retried(mock_data):
+    async def run():
+        with patch('importlib.resources.files', side_effect=FileNotFoundError):
+            with pytest.raises(FileNotFoundError):
+                await LicenseLynx.amap(LICENSE_STRING_STABLE)
+        return await LicenseLynx.amap(LICENSE_STRING_STABLE)
+
+    assert asyncio.run(run()).id == CANONICAL_ID_STABLE
+
+
+def test_import_skips_optional_modules():
+    code = ("import sys, licenselynx; "
+            "print([name for name in ('asyncio', 'concurrent.futures.process', 'multiprocessing.shared_memory') "
+            "if name in sys.modules])")
+    result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parents[1], check=True,
+                            capture_output=True, text=True)
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_preload(mock_data):
+    handle = LicenseLynx.preload()
+
+    assert handle.is_ready() is True
+    assert handle.wait(0) is True
+    assert _LicenseMapSingleton.is_initialized() is True
+
+
+def test_preload_background(mock_data, monkeypatch):
+    release = threading.Event()
+    init_calls = []
+    original_init = _LicenseMapSingleton.__init__
+
+    def blocking_init(self):
+        init_calls.append(self)
+        release.wait()
+        original_init(self)
+
+    monkeypatch.setattr(_LicenseMapSingleton, "__init__", blocking_init)
+
+    handle = LicenseLynx.preload(background=True)
+    assert handle.is_ready() is False
+    assert handle.wait(timeout=0.01) is False
+
+    results = []
+    lookup = threading.Thread(target=lambda: results.append(LicenseLynx.map(LICENSE_STRING_STABLE)))
+    lookup.start()
+    release.set()
+    lookup.join()
+
+    assert handle.wait(timeout=5) is True
+    assert handle.is_ready() is True
+    assert results[0].id == CANONICAL_ID_STABLE
+    assert len(init_calls) == 1
+
+
+def test_preload_error(mock_data):
+    with patch('importlib.resources.files', side_effect=FileNotFoundError):
+        with pytest.raises(FileNotFoundError):
+            LicenseLynx.preload()
+
+        handle = LicenseLynx.preload(background=True)
+        with pytest.raises(FileNotFoundError):
+            handle.wait(timeout=5)
+        assert handle.is_ready() is False
+
+
+def test_preload_freeze(mock_data):
+    with patch("gc.freeze") as freeze:
+        handle = LicenseLynx.preload(freeze=True)
+
+    assert handle.is_ready() is True
+    freeze.assert_called_once()
+
+
+def test_preload_freeze_requires_synchronous_load(mock_data):
+    with pytest.raises(ValueError, match="freeze requires a synchronous preload"):
+        LicenseLynx.preload(background=True, freeze=True)
+
+
+@pytest.fixture
+def lookup_cache():
+    LicenseLynx.enable_cache(maxsize=2)
+    yield
+    LicenseLynx.disable_cache()
+
+
+def test_cache_hits_and_negative_caching(mock_data, lookup_cache):
+    first = LicenseLynx.map(LICENSE_STRING_STABLE)
+    second = LicenseLynx.map(LICENSE_STRING_STABLE)
+    missing = [LicenseLynx.map(CANONICAL_ID_RISKY) for _ in range(3)]
+
+    assert first is second
+    assert missing == [None, None, None]
+    assert LicenseLynx.cache_info() == CacheInfo(hits=3, misses=2, evictions=0, maxsize=2, currsize=2)
+
+
+def test_cache_key_includes_options(mock_data, lookup_cache):
+    assert LicenseLynx.map(LICENSE_STRING_RISKY) is None
+    assert LicenseLynx.map(LICENSE_STRING_RISKY, risky=True).id == CANONICAL_ID_RISKY
+    assert LicenseLynx.cache_info().misses == 2
+
+
+def test_cache_evicts_least_recently_used(mock_data, lookup_cache):
+    LicenseLynx.map(LICENSE_STRING_STABLE)
+    LicenseLynx.map(LICENSE_STRING_SCANCODE)
+    LicenseLynx.map(LICENSE_STRING_STABLE)
+    LicenseLynx.map(LICENSE_STRING_RISKY)
+    LicenseLynx.map(LICENSE_STRING_STABLE)
+
+    assert LicenseLynx.cache_info() == CacheInfo(hits=2, misses=3, evictions=1, maxsize=2, currsize=2)
+
+
+def test_cache_invalidated_on_reload(mock_data, lookup_cache, monkeypatch):
+    LicenseLynx.map(LICENSE_STRING_STABLE)
+    instance = _LicenseMapSingleton()
+    monkeypatch.setattr(instance, "_merged_data", dataclasses.replace(instance.merged_data))
+
+    LicenseLynx.map(LICENSE_STRING_STABLE)
+
+    assert LicenseLynx.cache_info() == CacheInfo(hits=0, misses=2, evictions=0, maxsize=2, currsize=1)
+
+
+def test_cache_concurrent_lookups(mock_data, lookup_cache):
+    names = [LICENSE_STRING_STABLE, LICENSE_STRING_RISKY, LICENSE_STRING_SCANCODE]
+
+    def lookups():
+        for number in range(300):
+            assert LicenseLynx.map(names[number % 3]) == LicenseLynx.map(names[number % 3])
+
+    threads = [threading.Thread(target=lookups) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = LicenseLynx.cache_info()
+    assert info.hits + info.misses == 4 * 300 * 2
+    assert info.currsize == 2
+
+
+def test_cache_disabled(mock_data):
+    assert LicenseLynx.cache_info() is None
+    with pytest.raises(ValueError):
+        LicenseLynx.enable_cache(maxsize=0)
+
+
 def test_is_spdx_identifier(mock_data):
     result = LicenseLynx.map(LICENSE_STRING_STABLE)
 
@@ -177,6 +766,13 @@ def test_init_with_missing_org_in_data():
             _LicenseMapSingleton()
 
 
+def test_init_with_unknown_backend(monkeypatch):
+    monkeypatch.setenv(license_map_singleton_module.BACKEND_ENV_VAR, "unknown")
+
+    with pytest.raises(ValueError, match="Unknown LICENSELYNX_BACKEND 'unknown'"):
+        _LicenseMapSingleton()
+
+
 def test_map_with_org_license(mock_data):
     result = LicenseLynx.map(LICENSE_STRING_ORG, org=TestOrganization.TEST_ORG)
 
@@ -0,0 +1,25 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import pytest
+
+from licenselynx.perfect_hash import KEYS_PER_BUCKET, build_perfect_hash, perfect_hash_key, perfect_hash_position
+
+
+@pytest.mark.parametrize("count", [1, 2, 5, 1000])
+def test_build_perfect_hash_is_minimal_and_perfect(count):
+    keys = [f"License {number}".encode("utf-8") for number in range(count)]
+
+    salt, pilots, slots = build_perfect_hash(keys)
+
+    assert len(pilots) == -(-count // KEYS_PER_BUCKET)
+    assert sorted(slots) == list(range(count))
+    for slot, position in enumerate(slots):
+        key_hash = perfect_hash_key(keys[position], salt)
+        assert perfect_hash_position(key_hash, pilots[key_hash % len(pilots)], count) == slot
+
+
+def test_build_perfect_hash_duplicate_keys():
+    with pytest.raises(ValueError, match="not distinct"):
+        build_perfect_hash([b"MIT", b"MIT"])
@@ -0,0 +1,27 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+from licenselynx.quotes_handler import _QuotesHandler, normalize_quotes
+
+
+def test_normalize_quotes_replaces_all_quote_characters():
+    text = "".join(_QuotesHandler.quote_characters)
+
+    assert normalize_quotes(text) == "'" * len(_QuotesHandler.quote_characters)
+    assert normalize_quotes(text, replacement='"') == '"' * len(_QuotesHandler.quote_characters)
+
+
+def test_normalize_quotes_ascii_fast_path():
+    text = "'MIT' \"License\""
+
+    assert normalize_quotes(text) is text
+
+
+def test_normalize_quotes_keeps_other_non_ascii_characters():
+    assert normalize_quotes("„Licence écrite“") == "'Licence écrite'"
+
+
+def test_quotes_handler_delegates_to_normalize_quotes():
+    assert _QuotesHandler().normalize_quotes("‘MIT’ License") == normalize_quotes("‘MIT’ License")
+    assert _QuotesHandler().normalize_quotes("‘MIT’", replacement="`") == "`MIT`"
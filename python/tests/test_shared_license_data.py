@@ -0,0 +1,75 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+from unittest.mock import patch
+
+import pytest
+import licenselynx.shared_license_data as shared_license_data_module
+from licenselynx import LicenseLynx, LicenseObject, Organization, SharedLicenseData
+from licenselynx.license_index import _LicenseIndex, _build_index
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+
+MIT = LicenseObject("MIT", "spdx")
+GPL = LicenseObject("GPL", "custom")
+MOCK_MAPS = {
+    "stableMap": {"MIT License": MIT, "MIT": MIT},
+    "riskyMap": {"GPL License": GPL},
+    **{org.value: {f"{org.value} License": LicenseObject(f"{org.value}Id", org.value)} for org in Organization},
+}
+
+
+@pytest.fixture(autouse=True)
+def mock_singleton(monkeypatch):
+    """Installs a singleton backed by an in-memory index, so no packaged resources are needed."""
+    monkeypatch.setattr(_LicenseMapSingleton, "_instances", {})
+    _LicenseMapSingleton.install(_LicenseMapSingleton.from_index(_LicenseIndex(_build_index(MOCK_MAPS))))
+    yield
+    shared_license_data_module._unlink_published()
+
+
+def test_publish_and_attach(monkeypatch):
+    with SharedLicenseData.publish() as shared_data:
+        assert shared_data.size > 0
+        monkeypatch.setattr(_LicenseMapSingleton, "_instances", {})
+
+        attached = SharedLicenseData.attach(shared_data.name)
+
+        assert attached.name == shared_data.name
+        assert LicenseLynx.map("MIT License") == MIT
+        assert LicenseLynx.map("GPL License", risky=True) == GPL
+        assert LicenseLynx.map(f"{Organization.SIEMENS.value} License", org=Organization.SIEMENS).src == Organization.SIEMENS
+        assert _LicenseMapSingleton().merged_data.stable_map.get("Unknown") is None
+
+
+def test_map_many_parallel():
+    names = ["MIT License", "Unknown", "GPL License", "MIT License", "MIT"] * 3
+
+    results = LicenseLynx.map_many_parallel(names, risky=True, max_workers=2, chunk_size=1)
+
+    assert results == LicenseLynx.map_many(names, risky=True)
+    assert results[:3] == [MIT, None, GPL]
+
+
+def test_map_many_parallel_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        LicenseLynx.map_many_parallel(["MIT"], chunk_size=0)
+
+
+def test_map_many_parallel_reuses_published_data():
+    with patch.object(SharedLicenseData, "publish", wraps=SharedLicenseData.publish) as publish:
+        LicenseLynx.map_many_parallel(["MIT License"], max_workers=1)
+        LicenseLynx.map_many_parallel(["MIT"], max_workers=1)
+        assert publish.call_count == 1
+
+        _LicenseMapSingleton.install(_LicenseMapSingleton.from_index(_LicenseIndex(_build_index(MOCK_MAPS))))
+
+        assert LicenseLynx.map_many_parallel(["MIT License"], max_workers=1) == [MIT]
+        assert publish.call_count == 2
+
+
+def test_to_index_of_index_backed_data():
+    index = _build_index(MOCK_MAPS, perfect_hash=True)
+    instance = _LicenseMapSingleton.from_index(_LicenseIndex(index))
+
+    assert instance.to_index() == index
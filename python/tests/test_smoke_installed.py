@@ -43,3 +43,11 @@ def test_organization_entry_not_resolved_without_org():
     """Organization entry must NOT resolve without the org parameter."""
     result = LicenseLynx.map("Siemens Inner Source License v1.5")
     assert result is None, "Expected None without org parameter"
+
+
+@pytest.mark.smoke
+def test_aliases_of():
+    """Reverse index lists the aliases of a license grouped by source."""
+    aliases = LicenseLynx.aliases_of("0BSD")
+    assert "0BSD" in aliases["spdx"]
+    assert LicenseLynx.map(aliases["custom"][0]).id == "0BSD"
@@ -0,0 +1,194 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import gzip
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+import licenselynx.license_map_singleton as license_map_singleton_module
+from licenselynx.license_map_singleton import _LicenseMapSingleton
+from licenselynx.license_object import LicenseObject
+from licenselynx.organization import Organization
+from licenselynx.snapshot_cache import build_snapshot, default_cache_dir, read_snapshot, snapshot_path, write_snapshot
+
+MOCK_DATA = {
+    "stableMap": {
+        "MIT License": {"id": "MIT", "src": "spdx"},
+        "MIT": {"id": "MIT", "src": "spdx"},
+        "Licence écrite": {"id": "Some-License", "src": "custom"},
+    },
+    "riskyMap": {"GPL License": {"id": "GPL", "src": "custom"}},
+    "siemens": {"Siemens License": {"id": "LicenseRef-Siemens", "src": "siemens"}},
+}
+
+
+@pytest.fixture
+def json_resources(tmp_path, monkeypatch):
+    """Provides a resource directory containing only merged_data.json and enables the snapshot cache."""
+    resource_dir = tmp_path / "resources"
+    resource_dir.mkdir()
+    resource_dir.joinpath("merged_data.json").write_text(json.dumps(MOCK_DATA))
+    monkeypatch.setattr(_LicenseMapSingleton, "_instances", {})
+    monkeypatch.setenv(license_map_singleton_module.BACKEND_ENV_VAR, "json")
+    monkeypatch.setenv(license_map_singleton_module.SNAPSHOT_CACHE_ENV_VAR, str(tmp_path / "cache"))
+    with patch("importlib.resources.files", return_value=resource_dir):
+        yield resource_dir
+
+
+def test_snapshot_round_trip(tmp_path):
+    snapshot = build_snapshot(MOCK_DATA)
+    path = snapshot_path(tmp_path / "cache", b"data")
+
+    write_snapshot(path, snapshot)
+
+    assert read_snapshot(path) == snapshot
+    licenses, maps = snapshot
+    assert licenses == (("MIT", "spdx"), ("Some-License", "custom"), ("GPL", "custom"), ("LicenseRef-Siemens", "siemens"))
+    assert maps["stableMap"] == (("MIT License", "MIT", "Licence écrite"), (0, 0, 1))
+    assert [entry.name for entry in (tmp_path / "cache").iterdir()] == [path.name]
+
+
+def test_snapshot_of_format_version_2():
+    normalized = {
+        "version": 2,
+        "licenses": [{"id": "MIT", "src": "spdx"}, {"id": "Some-License", "src": "custom"},
+                     {"id": "GPL", "src": "custom"}, {"id": "LicenseRef-Siemens", "src": "siemens"}],
+        "stableMap": {"MIT License": 0, "MIT": 0, "Licence écrite": 1},
+        "riskyMap": {"GPL License": 2},
+        "siemens": {"Siemens License": 3},
+    }
+
+    assert build_snapshot(normalized) == build_snapshot(MOCK_DATA)
+    with pytest.raises(ValueError, match="format version 3 is not supported"):
+        build_snapshot(dict(normalized, version=3))
+
+
+def test_snapshot_path_depends_on_data(tmp_path):
+    assert snapshot_path(tmp_path, b"data") == snapshot_path(tmp_path, b"data")
+    assert snapshot_path(tmp_path, b"data") != snapshot_path(tmp_path, b"changed data")
+
+
+def test_read_snapshot_invalid(tmp_path):
+    path = tmp_path / "merged_data.snapshot"
+    assert read_snapshot(path) is None
+
+    path.write_bytes(b"garbage")
+    assert read_snapshot(path) is None
+
+    write_snapshot(path, build_snapshot(MOCK_DATA))
+    path.write_bytes(path.read_bytes()[:-10])
+    assert read_snapshot(path) is None
+
+
+def test_write_snapshot_ignores_errors(tmp_path):
+    blocked = tmp_path / "blocked"
+    blocked.write_text("not a directory")
+
+    write_snapshot(blocked / "merged_data.snapshot", build_snapshot(MOCK_DATA))
+
+    assert blocked.read_text() == "not a directory"
+
+
+def test_write_snapshot_removes_stale_snapshots(tmp_path):
+    snapshot = build_snapshot(MOCK_DATA)
+    old_path = snapshot_path(tmp_path, b"old data")
+    other_interpreter_path = tmp_path / old_path.name.replace(sys.implementation.cache_tag, "other-tag")
+    with patch("importlib.metadata.version", return_value="0.0.1"):
+        other_version_path = snapshot_path(tmp_path, b"old data")
+    write_snapshot(old_path, snapshot)
+    write_snapshot(other_interpreter_path, snapshot)
+    write_snapshot(other_version_path, snapshot)
+
+    path = snapshot_path(tmp_path, b"data")
+    write_snapshot(path, snapshot)
+
+    assert sorted(entry.name for entry in tmp_path.iterdir()) == sorted([path.name, other_interpreter_path.name,
+                                                                        other_version_path.name])
+
+
+def test_write_snapshot_concurrent_writers(tmp_path):
+    snapshot = build_snapshot(MOCK_DATA)
+    path = snapshot_path(tmp_path, b"data")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: write_snapshot(path, snapshot), range(32)))
+
+    assert read_snapshot(path) == snapshot
+    assert [entry.name for entry in tmp_path.iterdir()] == [path.name]
+
+
+def test_default_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr("sys.platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert default_cache_dir() == tmp_path / "licenselynx"
+
+
+def test_singleton_writes_and_uses_snapshot(json_resources, tmp_path):
+    merged_data = _LicenseMapSingleton().merged_data
+
+    snapshots = list((tmp_path / "cache").iterdir())
+    assert len(snapshots) == 1
+    assert merged_data.stable_map["MIT License"] is merged_data.stable_map["MIT"]
+
+    with patch("licenselynx.license_map_singleton.json.loads", side_effect=AssertionError("JSON parsed")):
+        cached = _LicenseMapSingleton.__new__(_LicenseMapSingleton)
+        cached.__init__()
+    assert dict(cached.merged_data.stable_map) == dict(merged_data.stable_map)
+    assert dict(cached.merged_data.risky_map) == {"GPL License": LicenseObject(id="GPL", src="custom")}
+    assert cached.merged_data.organizations[Organization.SIEMENS]["Siemens License"].id == "LicenseRef-Siemens"
+
+
+def test_singleton_snapshot_invalidated_by_data_change(json_resources, tmp_path):
+    _LicenseMapSingleton()
+    changed_data = dict(MOCK_DATA, stableMap={"Apache License 2.0": {"id": "Apache-2.0", "src": "spdx"}})
+    json_resources.joinpath("merged_data.json").write_text(json.dumps(changed_data))
+
+    reloaded = _LicenseMapSingleton.__new__(_LicenseMapSingleton)
+    reloaded.__init__()
+
+    assert list(reloaded.merged_data.stable_map) == ["Apache License 2.0"]
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+
+def test_singleton_snapshot_parses_the_hashed_bytes(json_resources, tmp_path):
+    with patch.object(_LicenseMapSingleton, "_read_json_text", side_effect=AssertionError("file read twice")):
+        merged_data = _LicenseMapSingleton().merged_data
+
+    snapshot, = (tmp_path / "cache").iterdir()
+    assert snapshot == snapshot_path(tmp_path / "cache", json_resources.joinpath("merged_data.json").read_bytes())
+    assert merged_data.stable_map["MIT"].id == "MIT"
+
+
+def test_singleton_snapshot_cache_skips_data_path(json_resources, tmp_path):
+    _LicenseMapSingleton.from_data_path(str(json_resources.joinpath("merged_data.json")))
+
+    assert not (tmp_path / "cache").exists()
+
+
+def test_singleton_snapshot_of_compressed_json(json_resources, tmp_path):
+    json_path = json_resources.joinpath("merged_data.json")
+    json_resources.joinpath("merged_data.json.gz").write_bytes(gzip.compress(json_path.read_bytes()))
+    json_path.unlink()
+
+    assert _LicenseMapSingleton().merged_data.stable_map["MIT License"].id == "MIT"
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+
+def test_singleton_snapshot_missing_org(json_resources):
+    json_resources.joinpath("merged_data.json").write_text(json.dumps({"stableMap": {}, "riskyMap": {}}))
+
+    with pytest.raises(ValueError, match="Organization 'siemens' is defined in the Organization enum"):
+        _LicenseMapSingleton()
+
+
+def test_singleton_snapshot_cache_disabled(json_resources, tmp_path, monkeypatch):
+    monkeypatch.setenv(license_map_singleton_module.SNAPSHOT_CACHE_ENV_VAR, "0")
+
+    assert _LicenseMapSingleton().merged_data.stable_map["MIT"].id == "MIT"
+    assert not (tmp_path / "cache").exists()
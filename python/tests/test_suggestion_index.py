@@ -0,0 +1,87 @@
+#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+import random
+
+import pytest
+
+from licenselynx.license_object import LicenseObject
+from licenselynx.suggestion_index import _SuggestionIndex, _edit_distance
+
+MIT = LicenseObject("MIT", "spdx")
+MIT_0 = LicenseObject("MIT-0", "spdx")
+APACHE = LicenseObject("Apache-2.0", "spdx")
+
+VIEW = {
+    "MIT License": MIT,
+    "'MIT License',": MIT,
+    "The MIT License": MIT,
+    "MIT No Attribution": MIT_0,
+    "Apache License 2.0": APACHE,
+    "Apache License, Version 2.0": APACHE,
+}
+
+
+def reference_edit_distance(first: str, second: str) -> int:
+    previous = list(range(len(second) + 1))
+    for row, first_char in enumerate(first, 1):
+        current = [row]
+        for column, second_char in enumerate(second, 1):
+            current.append(min(previous[column] + 1, current[column - 1] + 1,
+                               previous[column - 1] + (first_char != second_char)))
+        previous = current
+    return previous[-1]
+
+
+@pytest.mark.parametrize("first, second, distance", [
+    ("", "", 0),
+    ("", "mit", 3),
+    ("mit", "", 3),
+    ("mit", "mit", 0),
+    ("mit license", "mti license", 2),
+    ("kitten", "sitting", 3),
+])
+def test_edit_distance(first, second, distance):
+    assert _edit_distance(first, second) == distance
+
+
+def test_edit_distance_matches_reference():
+    generator = random.Random(0)
+    for _ in range(500):
+        first = "".join(generator.choice("abc") for _ in range(generator.randint(0, 80)))
+        second = "".join(generator.choice("abcd") for _ in range(generator.randint(0, 80)))
+        assert _edit_distance(first, second) == reference_edit_distance(first, second)
+
+
+def test_suggest_ranks_by_edit_distance():
+    suggestions = _SuggestionIndex(VIEW).suggest("MIT Licnese", VIEW, 5, 0.5)
+
+    assert suggestions[0].license is MIT
+    assert suggestions[0].name == "MIT License"
+    assert suggestions[0].score == pytest.approx(1 - 2 / 11)
+    assert [suggestion.score for suggestion in suggestions] == sorted(
+        (suggestion.score for suggestion in suggestions), reverse=True)
+
+
+def test_suggest_one_per_license():
+    suggestions = _SuggestionIndex(VIEW).suggest("apache license 2", VIEW, 5, 0.7)
+
+    assert [suggestion.license for suggestion in suggestions] == [APACHE]
+    assert suggestions[0].name == "Apache License 2.0"
+
+
+def test_suggest_limits():
+    index = _SuggestionIndex(VIEW)
+
+    assert len(index.suggest("MIT Licence", VIEW, 1, 0.0)) == 1
+    assert index.suggest("MIT Licence", VIEW, 5, 1.0) == []
+    assert index.suggest("GNU General Public License", VIEW, 5, 0.6) == []
+    assert index.suggest("", VIEW, 5, 0.0) == []
+
+
+def test_suggest_skips_names_missing_from_view():
+    index = _SuggestionIndex(VIEW)
+    view = {"MIT No Attribution": MIT_0}
+
+    assert [suggestion.license for suggestion in index.suggest("MIT Licnese", view, 5, 0.0)] == [MIT_0]
@@ -0,0 +1,34 @@
+#
+# Copyright (c) Siemens AG 2025 ALL RIGHTS RESERVED
+#
+import os
+import sys
+
+# The binary index is written by the Python library that reads it, see python/licenselynx/license_index.py
+# for the layout
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../python')))
+
+from licenselynx.license_index import _build_index  # noqa: E402
+from licenselynx.license_object import LicenseObject  # noqa: E402
+
+
+def build_index(data: dict, perfect_hash: bool = False) -> bytes:
+    """
+    Builds the binary index for the merged data.
+
+    Args:
+        data: merged data as written to merged_data.json, i.e. map name -> alias -> canonical object
+        perfect_hash: write version 2 with a minimal perfect hash per map instead of sorted entry tables
+
+    Returns:
+        bytes: the binary index
+    """
+    maps = {map_name: {alias: LicenseObject(id=canonical["id"], src=canonical.get("src", ""))
+                       for alias, canonical in alias_map.items()}
+            for map_name, alias_map in data.items()}
+    return _build_index(maps, perfect_hash)
+
+
+def write_index(data: dict, output_path: str, perfect_hash: bool = False):
+    with open(output_path, 'wb') as outfile:
+        outfile.write(build_index(data, perfect_hash))
@@ -2,12 +2,28 @@
 # Copyright (c) Siemens AG 2025 ALL RIGHTS RESERVED
 #
 import argparse
+import gzip
+import io
+import itertools
 import json
 import os
+import sys
+from collections.abc import Iterator
+from typing import Optional
 
 # Set the working directory to the script's directory
 script_dir = os.path.dirname(os.path.abspath(__file__))
 
+# Allow running this file directly as a script, e.g. python3 scripts/src/load/merge_data.py
+sys.path.append(os.path.abspath(os.path.join(script_dir, '../../')))
+# The folded-key maps use the folding function of the Python library, so lookups and merged keys always agree
+sys.path.append(os.path.abspath(os.path.join(script_dir, '../../../python')))
+
+from src.load.binary_index import write_index  # noqa: E402
+from src.load.python_codegen import write_python_modules  # noqa: E402
+from licenselynx.bloom_filter import build_bloom_filter  # noqa: E402
+from licenselynx.license_name_folding import FOLDED_MAP_SUFFIX, fold_license_name  # noqa: E402
+
 DATA_DIR = os.path.abspath(os.path.join(script_dir, '../../../data'))
 
 
@@ -22,28 +38,35 @@ def _build_maps_from_dir(data_dir: str) -> tuple[dict, dict]:
     canonical_dict = {}
     risky_dict = {}
 
+    for license_data in _read_license_files(data_dir):
+        canonical_id = license_data["canonical"]["id"]
+        canonical_object = license_data["canonical"]
+        aliases = license_data.get("aliases", [])
+
+        canonical_dict[canonical_id] = canonical_object
+        for source in aliases:
+            for alias in aliases[source]:
+                canonical_dict[alias] = canonical_object
+
+        risky_aliases = license_data.get("risky")
+        if not risky_aliases:
+            continue
+        for element in risky_aliases:
+            risky_dict[element] = canonical_object
+
+    return canonical_dict, risky_dict
+
+
+def _read_license_files(data_dir: str) -> Iterator[dict]:
+    """
+    Yields the content of all JSON files in data_dir in file name order, skipping non-JSON files and subdirectories.
+    """
     for filename in sorted(os.listdir(data_dir)):
         if not filename.endswith('.json'):
             continue
         filepath = os.path.join(data_dir, filename)
         with open(filepath, 'r') as f:
-            license_data = json.load(f)
-            canonical_id = license_data["canonical"]["id"]
-            canonical_object = license_data["canonical"]
-            aliases = license_data.get("aliases", [])
-
-            canonical_dict[canonical_id] = canonical_object
-            for source in aliases:
-                for alias in aliases[source]:
-                    canonical_dict[alias] = canonical_object
-
-            risky_aliases = license_data.get("risky")
-            if not risky_aliases:
-                continue
-            for element in risky_aliases:
-                risky_dict[element] = canonical_object
-
-    return canonical_dict, risky_dict
+            yield json.load(f)
 
 
 def read_data(data_dir: str) -> dict:
@@ -62,15 +85,8 @@ def read_org_data(data_dir: str) -> dict:
         canonical IDs + aliases + risky entries -> canonical object.
         Returns empty dict if orgs/ does not exist.
     """
-    orgs_path = os.path.join(data_dir, 'orgs')
-    if not os.path.isdir(orgs_path):
-        return {}
-
     org_maps: dict = {}
-    for org_name in sorted(os.listdir(orgs_path)):
-        org_dir_path = os.path.join(orgs_path, org_name)
-        if not os.path.isdir(org_dir_path):
-            continue
+    for org_name, org_dir_path in _org_dirs(data_dir):
         canonical_dict, risky_dict = _build_maps_from_dir(org_dir_path)
         canonical_dict.update(risky_dict)
         org_maps[org_name] = canonical_dict
@@ -78,29 +94,185 @@ def read_org_data(data_dir: str) -> dict:
     return org_maps
 
 
+def _org_dirs(data_dir: str) -> Iterator[tuple[str, str]]:
+    """
+    Yields name and path of all org subdirectories under data_dir/orgs/ in name order, nothing if orgs/ does not exist.
+    """
+    orgs_path = os.path.join(data_dir, 'orgs')
+    if not os.path.isdir(orgs_path):
+        return
+
+    for org_name in sorted(os.listdir(orgs_path)):
+        org_dir_path = os.path.join(orgs_path, org_name)
+        if os.path.isdir(org_dir_path):
+            yield org_name, org_dir_path
+
+
+def fold_maps(data: dict) -> dict:
+    """
+    Builds one folded-key map per map in data, used by the Python library as a fallback when the exact alias misses.
+    Keys are folded with licenselynx.license_name_folding.fold_license_name. A folded key whose aliases map to
+    different canonical objects is ambiguous and left out, as are keys that fold to an empty string.
+
+    Returns:
+        dict with keys '<map name>.folded' (e.g. 'stableMap.folded'), each mapping folded keys -> canonical object.
+    """
+    folded_data = {}
+    for map_name, alias_map in data.items():
+        folded_map: dict = {}
+        ambiguous = set()
+        for alias, canonical_object in alias_map.items():
+            folded_key = fold_license_name(alias)
+            if not folded_key or folded_key in ambiguous:
+                continue
+            if folded_map.setdefault(folded_key, canonical_object) != canonical_object:
+                del folded_map[folded_key]
+                ambiguous.add(folded_key)
+        folded_data[map_name + FOLDED_MAP_SUFFIX] = folded_map
+
+    return folded_data
+
+
+def build_alias_index(data_dir: str, data: dict) -> dict:
+    """
+    Builds the reverse index from canonical ID to all names that map to it, grouped by where the name comes from:
+    the alias source in the license file (e.g. 'spdx', 'osi', 'scancodeLicensedb', 'custom'), 'risky' for risky
+    aliases, and the org directory name for all names of org licenses. The canonical ID itself is listed under
+    the source of the canonical object. Names that another license overrides in the merged maps are left out.
+
+    Returns:
+        dict mapping canonical IDs to dicts of source -> names.
+    """
+    alias_index: dict = {}
+
+    def add(map_name: str, source: str, license_data: dict, names: list) -> None:
+        canonical_object = license_data["canonical"]
+        for name in names:
+            if data[map_name].get(name) == canonical_object:
+                alias_index.setdefault(canonical_object["id"], {}).setdefault(source, []).append(name)
+
+    for license_data in _read_license_files(data_dir):
+        add("stableMap", license_data["canonical"]["src"], license_data, [license_data["canonical"]["id"]])
+        for source, aliases in license_data.get("aliases", {}).items():
+            add("stableMap", source, license_data, aliases)
+        add("riskyMap", "risky", license_data, license_data.get("risky") or [])
+
+    for org_name, org_dir_path in _org_dirs(data_dir):
+        for license_data in _read_license_files(org_dir_path):
+            names = [license_data["canonical"]["id"], *itertools.chain.from_iterable(
+                license_data.get("aliases", {}).values()), *(license_data.get("risky") or [])]
+            add(org_name, org_name, license_data, names)
+
+    return alias_index
+
+
 def write_data(alias_mapping: dict, output_path: str):
+    """
+    Writes compact JSON, gzip-compressed if output_path ends with .gz. The compressed file does not contain
+    a timestamp or file name, so the same data always produces the same bytes.
+    """
+    if output_path.endswith('.gz'):
+        with open(output_path, 'wb') as rawfile, \
+                gzip.GzipFile(filename='', mode='wb', compresslevel=9, fileobj=rawfile, mtime=0) as compressed, \
+                io.TextIOWrapper(compressed, encoding='utf-8') as outfile:
+            json.dump(alias_mapping, outfile, separators=(',', ':'))
+        return
     with open(output_path, 'w') as outfile:
         json.dump(alias_mapping, outfile, separators=(',', ':'))
 
 
-def merge_data_to_paths(data_dir: str, output_path: str):
+def to_format_version_2(data: dict) -> dict:
+    """
+    Converts merged data into the normalized format version 2: the unique canonical objects are stored once in the
+    licenses array, and every map maps its aliases to the position of their canonical object in that array.
+    The version, the names of all maps and the licenses precede the maps, so readers can check which maps exist
+    and parse the maps one at a time.
+
+    Args:
+        data: merged data, i.e. map name -> alias -> canonical object
+
+    Returns:
+        dict: {"version": 2, "maps": [map name, ...], "licenses": [canonical object, ...],
+        map name: {alias: license index}}
+    """
+    license_indices: dict[str, int] = {}
+    licenses: list[dict] = []
+    normalized: dict = {"version": 2, "maps": list(data), "licenses": licenses}
+    for map_name, alias_map in data.items():
+        if map_name in normalized:
+            raise ValueError(f"Map name '{map_name}' is reserved in format version 2")
+        references = {}
+        for alias, canonical in alias_map.items():
+            license_key = json.dumps(canonical, sort_keys=True)
+            license_index = license_indices.get(license_key)
+            if license_index is None:
+                license_index = len(licenses)
+                license_indices[license_key] = license_index
+                licenses.append(canonical)
+            references[alias] = license_index
+        normalized[map_name] = references
+    return normalized
+
+
+def write_bloom_filter(data: dict, output_path: str):
+    """
+    Writes the Bloom filter over the keys of all maps in data, used by the Python library to return None for
+    names that are not a key of any map without loading the maps.
+
+    Args:
+        data: merged data as written to merged_data.json, including the folded-key maps if they are written
+        output_path: path of the Bloom filter file
+    """
+    keys = {key for alias_map in data.values() for key in alias_map}
+    with open(output_path, 'wb') as outfile:
+        outfile.write(build_bloom_filter(sorted(keys)))
+
+
+def merge_data_to_paths(data_dir: str, output_path: str, index_path: Optional[str] = None, folded: bool = False,
+                        aliases_path: Optional[str] = None, perfect_hash: bool = False, bloom_path: Optional[str] = None,
+                        python_modules_dir: Optional[str] = None, format_version: int = 1):
     data = read_data(data_dir)
     org_data = read_org_data(data_dir)
     data.update(org_data)
+    if aliases_path:
+        write_data(build_alias_index(data_dir, data), aliases_path)
+    if folded:
+        data.update(fold_maps(data))
 
-    write_data(data, output_path)
+    write_data(to_format_version_2(data) if format_version == 2 else data, output_path)
+    if index_path:
+        write_index(data, index_path, perfect_hash)
+    if bloom_path:
+        write_bloom_filter(data, bloom_path)
+    if python_modules_dir:
+        write_python_modules(data, python_modules_dir)
 
 
 def main(argv=None):
     parser = argparse.ArgumentParser()
 
     parser.add_argument('--output', '-o', required=True, type=str, help='Path for export file')
+    parser.add_argument('--index', type=str, help='Optional path for the binary lookup index')
+    parser.add_argument('--perfect-hash', action='store_true',
+                        help='Write the binary lookup index with a minimal perfect hash per map instead of sorted tables')
+    parser.add_argument('--folded', action='store_true',
+                        help='Add folded-key fallback maps (case, whitespace, quotes, commas, comments) for the Python library')
+    parser.add_argument('--aliases', type=str,
+                        help='Optional path for the reverse index from canonical ID to aliases grouped by source')
+    parser.add_argument('--bloom', type=str,
+                        help='Optional path for the Bloom filter over all keys, used by the Python library to skip misses')
+    parser.add_argument('--python-modules', type=str,
+                        help='Optional directory for the generated Python modules holding all maps, e.g. python/licenselynx/_generated')
+    parser.add_argument('--format-version', type=int, choices=[1, 2], default=1,
+                        help='Format of the export file: 1 stores the canonical object per alias, '
+                             '2 stores the canonical objects once and a license index per alias (Python library only)')
 
     args = parser.parse_args(argv)
 
     output_path = args.output
 
-    merge_data_to_paths(DATA_DIR, output_path)
+    merge_data_to_paths(DATA_DIR, output_path, args.index, args.folded, args.aliases, args.perfect_hash, args.bloom,
+                        args.python_modules, args.format_version)
 
 
 if __name__ == '__main__':
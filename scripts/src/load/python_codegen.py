@@ -0,0 +1,101 @@
+#
+# Copyright (c) Siemens AG 2025 ALL RIGHTS RESERVED
+#
+import os
+import re
+
+# Python modules generated for the Python library, the counterpart of the Go and Java generated maps:
+#
+#   __init__.py     MAPS: map name -> name of the module holding the map
+#   licenses.py     LICENSES: tuple of (id, src) tuples, one per distinct canonical object
+#   map_*.py        KEYS: tuple of the aliases of one map, LICENSES: tuple of the index into licenses.LICENSES per alias
+#
+# The modules only contain constant tuples, which Python compiles into the constants of the module code object.
+# Importing a cached .pyc unmarshals them in one step, strings repeated in a module are stored once.
+#
+# The reader lives in python/licenselynx/license_map_singleton.py (_load_generated) and must be kept in sync with this file.
+GENERATED_MARKER = "# Code generated by scripts/src/load/python_codegen.py. DO NOT EDIT."
+HEADER = f"""#
+# SPDX-FileCopyrightText: Copyright 2025 Siemens AG
+# SPDX-License-Identifier: BSD-3-Clause
+#
+{GENERATED_MARKER}
+"""
+_INDICES_PER_LINE = 20
+
+
+def module_name(map_name: str) -> str:
+    """
+    Derives the module name of a map, e.g. map_stable_map_folded for stableMap.folded.
+
+    Args:
+        map_name: name of the map in the merged data
+
+    Returns:
+        str: module name
+    """
+    snake_case = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", map_name).lower()
+    return "map_" + re.sub(r"[^a-z0-9_]", "_", snake_case)
+
+
+def _render_tuple(name: str, lines: list[str]) -> str:
+    return f"{name} = (\n" + "".join(f"    {line},\n" for line in lines) + ")\n"
+
+
+def build_python_modules(data: dict) -> dict[str, str]:
+    """
+    Generates the Python modules for the merged data.
+
+    Args:
+        data: merged data as written to merged_data.json, i.e. map name -> alias -> canonical object
+
+    Returns:
+        dict: file name -> source code of the module
+    """
+    license_indices: dict[tuple[str, str], int] = {}
+    modules: dict[str, tuple[str, str]] = {}
+    map_modules: dict[str, str] = {}
+
+    for map_name, alias_map in data.items():
+        name = module_name(map_name)
+        if name in modules:
+            raise ValueError(f"Maps '{map_name}' and '{modules[name][0]}' would be generated into the same module {name}")
+
+        indices = []
+        for canonical in alias_map.values():
+            license_key = (canonical["id"], canonical.get("src", ""))
+            indices.append(license_indices.setdefault(license_key, len(license_indices)))
+        index_lines = [", ".join(str(index) for index in indices[start:start + _INDICES_PER_LINE])
+                       for start in range(0, len(indices), _INDICES_PER_LINE)]
+        modules[name] = (map_name, _render_tuple("KEYS", [repr(alias) for alias in alias_map]) + "\n"
+                         + _render_tuple("LICENSES", index_lines))
+        map_modules[map_name] = name
+
+    files = {f"{name}.py": HEADER + "\n" + source for name, (_, source) in modules.items()}
+    files["licenses.py"] = HEADER + "\n" + _render_tuple("LICENSES", [repr(license_key) for license_key in license_indices])
+    map_lines = "".join(f"    {map_name!r}: {name!r},\n" for map_name, name in map_modules.items())
+    files["__init__.py"] = HEADER + "\nMAPS = {\n" + map_lines + "}\n"
+    return files
+
+
+def write_python_modules(data: dict, output_dir: str):
+    """
+    Writes the generated modules into output_dir, replacing all modules generated before.
+
+    Args:
+        data: merged data as written to merged_data.json
+        output_dir: directory of the generated package, e.g. python/licenselynx/_generated
+    """
+    files = build_python_modules(data)
+    os.makedirs(output_dir, exist_ok=True)
+    for file_name in os.listdir(output_dir):
+        path = os.path.join(output_dir, file_name)
+        if file_name.endswith(".py") and file_name not in files:
+            with open(path, encoding="utf-8") as file:
+                generated = GENERATED_MARKER in file.read()
+            if generated:
+                os.remove(path)
+
+    for file_name, source in files.items():
+        with open(os.path.join(output_dir, file_name), "w", encoding="utf-8") as outfile:
+            outfile.write(source)
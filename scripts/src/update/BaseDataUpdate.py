@@ -12,6 +12,11 @@ import requests
 
 from src.logger import setup_logger
 
+# The quote normalization is shared with the Python library, see python/licenselynx/quotes_handler.py
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../python')))
+
+from licenselynx.quotes_handler import normalize_quotes  # noqa: E402
+
 
 LICENSE_SPELLING_PAIRS = (
     ("license", "licence"),
@@ -217,32 +222,7 @@ class BaseDataUpdate:
         Returns:
             str: The normalized text with all recognized quote characters replaced.
         """
-        self._LOGGER.debug(f"Normalizing quotes: {input_string}")
-        # List of quote characters to replace with the default replacement.
-        quote_characters = [
-            # Single quotes
-            "\u2018",  # LEFT SINGLE QUOTATION MARK ‘
-            "\u2019",  # RIGHT SINGLE QUOTATION MARK ’
-            "\u201A",  # SINGLE LOW-9 QUOTATION MARK ‚
-            "\u201B",  # SINGLE HIGH-REVERSED-9 QUOTATION MARK ‛
-            "\u2032",  # PRIME (often used as an apostrophe) ′
-            "\uFF07",  # FULLWIDTH APOSTROPHE ＇
-            # Double quotes
-            "\u201C",  # LEFT DOUBLE QUOTATION MARK “
-            "\u201D",  # RIGHT DOUBLE QUOTATION MARK ”
-            "\u201E",  # DOUBLE LOW-9 QUOTATION MARK „
-            "\u201F",  # DOUBLE HIGH-REVERSED-9 QUOTATION MARK ‟
-            "\u2033",  # DOUBLE PRIME ″
-            "\u00AB",  # LEFT-POINTING DOUBLE ANGLE QUOTATION MARK «
-            "\u00BB",  # RIGHT-POINTING DOUBLE ANGLE QUOTATION MARK »
-            "\uFF02",  # FULLWIDTH QUOTATION MARK ＂
-        ]
-
-        # Create a translation mapping from the Unicode code point of each quote character
-        # to the desired replacement.
-        translation_map = {ord(char): replacement for char in quote_characters}
-        normalized_input_string = input_string.translate(translation_map)
-        return normalized_input_string
+        return normalize_quotes(input_string, replacement)
 
     def _normalize_alias_list(self, aliases: list[str]) -> list[str]:
         """
@@ -0,0 +1,104 @@
+#
+# Copyright (c) Siemens AG 2025 ALL RIGHTS RESERVED
+#
+import pytest
+
+from src.load.binary_index import build_index, write_index
+from licenselynx.license_index import _HEADER, _INDEX_VERSION, _LicenseIndex, _PERFECT_HASH_INDEX_VERSION, \
+    _PerfectHashLicenseMap
+
+
+SAMPLE_DATA = {
+    "stableMap": {
+        "MIT License": {"id": "MIT", "src": "spdx"},
+        "MIT": {"id": "MIT", "src": "spdx"},
+        "Apache License 2.0": {"id": "Apache-2.0", "src": "spdx"},
+    },
+    "riskyMap": {"GPL License": {"id": "GPL", "src": "custom"}},
+    "testOrg": {},
+}
+
+
+def read_index(index: bytes) -> dict:
+    """Reads a binary index back into the merged data layout with the reader of the Python library."""
+    license_index = _LicenseIndex(index)
+    return {name: [(alias, {"id": license_object.id, "src": license_object.src})
+                   for alias, license_object in license_index.license_map(name).items()]
+            for name in license_index.map_names}
+
+
+def test_build_index_header():
+    index = build_index(SAMPLE_DATA)
+
+    magic, version, strings_offset, _, _, license_count, _, map_count = _HEADER.unpack_from(index, 0)
+
+    assert magic == b"LLYNXIDX"
+    assert version == _INDEX_VERSION
+    assert strings_offset == _HEADER.size
+    assert license_count == 3
+    assert map_count == 3
+
+
+def test_build_index_round_trip():
+    decoded = read_index(build_index(SAMPLE_DATA))
+
+    assert list(decoded) == ["stableMap", "riskyMap", "testOrg"]
+    assert dict(decoded["stableMap"]) == SAMPLE_DATA["stableMap"]
+    assert dict(decoded["riskyMap"]) == SAMPLE_DATA["riskyMap"]
+    assert decoded["testOrg"] == []
+
+
+def test_build_index_sorts_keys_by_utf8_bytes():
+    data = {"stableMap": {"b": {"id": "B", "src": "spdx"}, "é": {"id": "E", "src": "spdx"}, "A": {"id": "A", "src": "spdx"}}}
+
+    keys = [key for key, _ in read_index(build_index(data))["stableMap"]]
+
+    assert keys == sorted(keys, key=lambda key: key.encode("utf-8"))
+
+
+def test_build_index_deduplicates_strings():
+    index = build_index({"stableMap": {"MIT": {"id": "MIT", "src": "spdx"}}, "riskyMap": {"MIT": {"id": "MIT", "src": "spdx"}}})
+
+    _, _, _, strings_size, _, license_count, _, _ = _HEADER.unpack_from(index, 0)
+
+    assert license_count == 1
+    assert strings_size == len("MITspdxstableMapriskyMap")
+
+
+def test_write_index(tmpdir):
+    output_path = tmpdir.join("merged_data.idx")
+
+    write_index(SAMPLE_DATA, str(output_path))
+
+    with open(output_path, 'rb') as f:
+        assert f.read() == build_index(SAMPLE_DATA)
+
+
+def test_write_index_keeps_version_1_by_default(tmpdir):
+    output_path = tmpdir.join("merged_data.idx")
+
+    write_index(SAMPLE_DATA, str(output_path), perfect_hash=False)
+
+    with open(output_path, 'rb') as f:
+        assert _HEADER.unpack_from(f.read(), 0)[1] == _INDEX_VERSION
+
+
+def test_build_index_perfect_hash():
+    data = {
+        "stableMap": {f"License {number}": {"id": f"L-{number % 7}", "src": "custom"} for number in range(300)},
+        "riskyMap": {},
+    }
+    index = build_index(data, perfect_hash=True)
+
+    assert _HEADER.unpack_from(index, 0)[1] == _PERFECT_HASH_INDEX_VERSION
+    license_index = _LicenseIndex(index)
+    stable_map = license_index.license_map("stableMap")
+    assert isinstance(stable_map, _PerfectHashLicenseMap)
+    assert all(stable_map.get(alias).id == canonical["id"] for alias, canonical in data["stableMap"].items())
+    assert stable_map.get("License 300") is None
+    assert len(license_index.license_map("riskyMap")) == 0
+    assert read_index(index)["riskyMap"] == []
+
+
+if __name__ == '__main__':
+    pytest.main()
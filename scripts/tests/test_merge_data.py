@@ -1,12 +1,16 @@
 #
 # Copyright (c) Siemens AG 2025 ALL RIGHTS RESERVED
 #
+import gzip
 import json
 import os
 import tempfile
 
 import pytest
-from src.load.merge_data import read_data, write_data, main, _build_maps_from_dir, read_org_data
+from src.load.binary_index import build_index
+from src.load.merge_data import read_data, write_data, main, _build_maps_from_dir, read_org_data, fold_maps, \
+    build_alias_index, to_format_version_2
+from licenselynx.bloom_filter import _BloomFilter
 
 
 @pytest.fixture
@@ -159,6 +163,145 @@ def test_main_integration(temp_data_dir, temp_output_file, monkeypatch):
     assert output_data == expected_output
 
 
+def test_main_writes_index(temp_data_dir, temp_output_file, tmpdir, monkeypatch):
+    index_path = str(tmpdir.join("merged_data.idx"))
+    monkeypatch.setattr('src.load.merge_data.DATA_DIR', temp_data_dir)
+
+    main(['--output', temp_output_file, '--index', index_path])
+
+    with open(temp_output_file, 'r') as f:
+        output_data = json.load(f)
+    with open(index_path, 'rb') as f:
+        assert f.read() == build_index(output_data)
+
+
+def test_main_writes_perfect_hash_index(temp_data_dir, temp_output_file, tmpdir, monkeypatch):
+    index_path = str(tmpdir.join("merged_data.idx"))
+    monkeypatch.setattr('src.load.merge_data.DATA_DIR', temp_data_dir)
+
+    main(['--output', temp_output_file, '--index', index_path, '--perfect-hash'])
+
+    with open(temp_output_file, 'r') as f:
+        output_data = json.load(f)
+    with open(index_path, 'rb') as f:
+        assert f.read() == build_index(output_data, perfect_hash=True)
+
+
+def test_main_writes_bloom_filter(temp_data_dir, temp_output_file, tmpdir, monkeypatch):
+    bloom_path = str(tmpdir.join("merged_data.bloom"))
+    monkeypatch.setattr('src.load.merge_data.DATA_DIR', temp_data_dir)
+
+    main(['--output', temp_output_file, '--folded', '--bloom', bloom_path])
+
+    with open(temp_output_file, 'r') as f:
+        output_data = json.load(f)
+    with open(bloom_path, 'rb') as f:
+        key_filter = _BloomFilter(f.read())
+    assert all(key in key_filter for alias_map in output_data.values() for key in alias_map)
+    assert "mit open source license" in key_filter
+
+
+def test_main_writes_compressed_data(temp_data_dir, temp_output_file, tmpdir, monkeypatch):
+    compressed_path = str(tmpdir.join("merged_data.json.gz"))
+    monkeypatch.setattr('src.load.merge_data.DATA_DIR', temp_data_dir)
+
+    main(['--output', temp_output_file])
+    main(['--output', compressed_path])
+
+    with open(temp_output_file, 'rb') as f:
+        output_data = f.read()
+    with open(compressed_path, 'rb') as f:
+        compressed_data = f.read()
+    assert gzip.decompress(compressed_data) == output_data
+    main(['--output', compressed_path])
+    with open(compressed_path, 'rb') as f:
+        assert f.read() == compressed_data
+
+
+def test_to_format_version_2():
+    mit = {"id": "MIT", "src": "spdx"}
+    gpl = {"id": "GPL", "src": "custom"}
+    data = {"stableMap": {"MIT": mit, "MIT License": dict(mit)}, "riskyMap": {"GPL": gpl, "MIT?": mit}, "siemens": {}}
+
+    assert to_format_version_2(data) == {
+        "version": 2,
+        "maps": ["stableMap", "riskyMap", "siemens"],
+        "licenses": [mit, gpl],
+        "stableMap": {"MIT": 0, "MIT License": 0},
+        "riskyMap": {"GPL": 1, "MIT?": 0},
+        "siemens": {},
+    }
+    with pytest.raises(ValueError, match="Map name 'licenses' is reserved"):
+        to_format_version_2({"licenses": {}})
+    with pytest.raises(ValueError, match="Map name 'maps' is reserved"):
+        to_format_version_2({"maps": {}})
+
+
+def test_main_writes_format_version_2(temp_data_dir, temp_output_file, tmpdir, monkeypatch):
+    normalized_path = str(tmpdir.join("merged_data.v2.json"))
+    monkeypatch.setattr('src.load.merge_data.DATA_DIR', temp_data_dir)
+
+    main(['--output', temp_output_file])
+    main(['--output', normalized_path, '--format-version', '2'])
+
+    with open(temp_output_file, 'r') as f:
+        output_data = json.load(f)
+    with open(normalized_path, 'r') as f:
+        normalized_data = json.load(f)
+    assert list(normalized_data)[:3] == ["version", "maps", "licenses"]
+    licenses = normalized_data.pop("licenses")
+    assert normalized_data.pop("version") == 2
+    assert normalized_data.pop("maps") == list(output_data)
+    assert {name: {alias: licenses[index] for alias, index in alias_map.items()}
+            for name, alias_map in normalized_data.items()} == output_data
+
+
+def test_main_writes_python_modules(temp_data_dir, temp_output_file, tmpdir, monkeypatch):
+    output_dir = str(tmpdir.join("_generated"))
+    monkeypatch.setattr('src.load.merge_data.DATA_DIR', temp_data_dir)
+
+    main(['--output', temp_output_file, '--folded', '--python-modules', output_dir])
+
+    with open(temp_output_file, 'r') as f:
+        output_data = json.load(f)
+    with open(os.path.join(output_dir, '__init__.py')) as f:
+        init_source = f.read()
+    assert all(repr(map_name) in init_source for map_name in output_data)
+    assert os.path.isfile(os.path.join(output_dir, 'map_stable_map_folded.py'))
+
+
+def test_fold_maps():
+    mit = {"id": "MIT", "src": "spdx"}
+    mit_custom = {"id": "MIT", "src": "custom"}
+    gpl = {"id": "GPL", "src": "spdx"}
+    data = {
+        "stableMap": {"MIT": mit, "'MIT',": mit, "# MIT": mit, "GPL": gpl, "gpl": mit_custom, "#": gpl},
+        "riskyMap": {"risky_gpl_3": gpl},
+    }
+
+    folded_data = fold_maps(data)
+
+    assert folded_data == {
+        "stableMap.folded": {"mit": mit},
+        "riskyMap.folded": {"risky_gpl_3": gpl},
+    }
+
+
+def test_main_writes_folded_maps(temp_data_dir, temp_output_file, tmpdir, monkeypatch):
+    index_path = str(tmpdir.join("merged_data.idx"))
+    monkeypatch.setattr('src.load.merge_data.DATA_DIR', temp_data_dir)
+
+    main(['--output', temp_output_file, '--index', index_path, '--folded'])
+
+    with open(temp_output_file, 'r') as f:
+        output_data = json.load(f)
+    assert list(output_data) == ["stableMap", "riskyMap", "stableMap.folded", "riskyMap.folded"]
+    assert output_data["stableMap.folded"]["mit open source license"] == {"id": "MIT", "src": "spdx"}
+    assert output_data["stableMap.folded"]["gpl v3"] == {"id": "GPL", "src": "spdx"}
+    with open(index_path, 'rb') as f:
+        assert f.read() == build_index(output_data)
+
+
 def test_build_maps_from_dir(tmpdir):
     license1 = {
         "canonical": {"id": "MIT"},
@@ -341,5 +484,52 @@ def test_main_integration_with_orgs(monkeypatch):
             os.remove(output_path)
 
 
+def test_build_alias_index(tmpdir):
+    mit = {
+        "canonical": {"id": "MIT", "src": "spdx"},
+        "aliases": {"spdx": ["MIT License"], "custom": ["'MIT'", "Shared"]},
+        "risky": ["mit-risky"]
+    }
+    zlib = {
+        "canonical": {"id": "Zlib", "src": "spdx"},
+        "aliases": {"custom": ["Shared"]},
+    }
+    org = {
+        "canonical": {"id": "testOrgId", "src": "testOrg"},
+        "aliases": {"custom": ["testOrg License"]},
+        "risky": ["testOrg-risky"]
+    }
+    with open(tmpdir.join("MIT.json"), 'w') as f:
+        json.dump(mit, f)
+    with open(tmpdir.join("Zlib.json"), 'w') as f:
+        json.dump(zlib, f)
+    with open(tmpdir.mkdir("orgs").mkdir("testOrg").join("testOrgId.json"), 'w') as f:
+        json.dump(org, f)
+    data = read_data(str(tmpdir))
+    data.update(read_org_data(str(tmpdir)))
+
+    alias_index = build_alias_index(str(tmpdir), data)
+
+    # "Shared" is mapped to Zlib, the license file read last
+    assert alias_index == {
+        "MIT": {"spdx": ["MIT", "MIT License"], "custom": ["'MIT'"], "risky": ["mit-risky"]},
+        "Zlib": {"spdx": ["Zlib"], "custom": ["Shared"]},
+        "testOrgId": {"testOrg": ["testOrgId", "testOrg License", "testOrg-risky"]},
+    }
+
+
+def test_main_writes_alias_index(temp_data_dir, temp_output_file, tmpdir, monkeypatch):
+    aliases_path = str(tmpdir.join("merged_aliases.json"))
+    monkeypatch.setattr('src.load.merge_data.DATA_DIR', temp_data_dir)
+
+    main(['--output', temp_output_file, '--aliases', aliases_path, '--folded'])
+
+    with open(aliases_path, 'r') as f:
+        alias_index = json.load(f)
+    assert alias_index["GPL"] == {"spdx": ["GPL"], "source1": ["GNU General Public License", "GPL v3"],
+                                  "source2": ["GPLv3"], "risky": ["risky_gpl_3"]}
+    assert set(alias_index) == {"MIT", "GPL"}
+
+
 if __name__ == '__main__':
     pytest.main()
@@ -0,0 +1,80 @@
+#
+# Copyright (c) Siemens AG 2025 ALL RIGHTS RESERVED
+#
+import importlib
+import sys
+
+import pytest
+
+from src.load.python_codegen import build_python_modules, module_name, write_python_modules
+
+SAMPLE_DATA = {
+    "stableMap": {
+        "MIT License": {"id": "MIT", "src": "spdx"},
+        "MIT": {"id": "MIT", "src": "spdx"},
+        "Apache License 2.0": {"id": "Apache-2.0", "src": "spdx"},
+        "Licence 'écrite'\n\udc80": {"id": "Some-License", "src": "custom"},
+    },
+    "riskyMap": {"GPL License": {"id": "GPL", "src": "custom"}},
+    "testOrg": {},
+    "stableMap.folded": {"mit license": {"id": "MIT", "src": "spdx"}},
+}
+
+
+@pytest.fixture
+def import_generated(tmp_path, monkeypatch):
+    """Imports a generated package written to tmp_path and removes it from sys.modules afterwards."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield lambda name: importlib.import_module(name)
+    for name in [name for name in sys.modules if name.startswith("generated_maps")]:
+        del sys.modules[name]
+
+
+def read_generated(import_generated, package: str) -> dict:
+    """Decodes the generated modules back into the merged data layout."""
+    licenses = import_generated(f"{package}.licenses").LICENSES
+    data = {}
+    for map_name, name in import_generated(package).MAPS.items():
+        module = import_generated(f"{package}.{name}")
+        data[map_name] = {key: {"id": licenses[index][0], "src": licenses[index][1]}
+                          for key, index in zip(module.KEYS, module.LICENSES)}
+    return data
+
+
+def test_module_name():
+    assert module_name("stableMap") == "map_stable_map"
+    assert module_name("riskyMap.folded") == "map_risky_map_folded"
+    assert module_name("siemens") == "map_siemens"
+
+
+def test_build_python_modules_round_trip(tmp_path, import_generated):
+    write_python_modules(SAMPLE_DATA, str(tmp_path / "generated_maps"))
+
+    assert read_generated(import_generated, "generated_maps") == SAMPLE_DATA
+
+
+def test_build_python_modules_shares_licenses():
+    files = build_python_modules(SAMPLE_DATA)
+
+    assert sorted(files) == ["__init__.py", "licenses.py", "map_risky_map.py", "map_stable_map.py",
+                             "map_stable_map_folded.py", "map_test_org.py"]
+    assert files["licenses.py"].count("'MIT'") == 1
+    assert all("DO NOT EDIT" in source for source in files.values())
+
+
+def test_build_python_modules_name_collision():
+    with pytest.raises(ValueError, match="same module map_stable_map"):
+        build_python_modules({"stableMap": {}, "stable_map": {}})
+
+
+def test_write_python_modules_removes_stale_modules(tmp_path):
+    output_dir = tmp_path / "generated_maps"
+    output_dir.mkdir()
+    output_dir.joinpath("map_old.py").write_text(build_python_modules({"old": {}})["map_old.py"])
+    output_dir.joinpath("handwritten.py").write_text("VALUE = 1\n")
+
+    write_python_modules(SAMPLE_DATA, str(output_dir))
+
+    assert not output_dir.joinpath("map_old.py").exists()
+    assert output_dir.joinpath("handwritten.py").exists()
+    assert output_dir.joinpath("map_stable_map.py").exists()